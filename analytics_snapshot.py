@@ -0,0 +1,594 @@
+"""
+Canonical analytics snapshot shared by the report generators.
+
+Reviews, verticals, AD financials, best practices and follow-ups are loaded and
+aggregated once into an AnalyticsSnapshot, which is pickled to
+data/analytics_snapshot.pkl. generate_report.py, generate_enhanced_report.py,
+generate_scorecards.py, generate_highlights_report.py and
+generate_eoy_tracking_report.py only render from it:
+
+    from analytics_snapshot import load_snapshot
+    snapshot = load_snapshot()
+    for name, ad in snapshot.ads.items():          # ranked by total score
+        ad["scores"]["Cost Savings Delivered"]     # section mean, None if unscored
+
+load_snapshot() reuses the cache while the size and mtime of every source file (and of
+the code that builds it) are unchanged, and rebuilds and rewrites it otherwise, so a full
+report run does the aggregation once.
+
+AD names are canonical verticals.csv names (staff_dimensions.canonical_ad_name) everywhere:
+reviews, financial files and the best-practice/follow-up JSON keys. A joint review
+("Brian Davis / Justin Homa") counts for every AD it names except JOINT_REVIEW_EXCLUSIONS.
+
+    python analytics_snapshot.py              # build if stale, print the overall ranking
+    python analytics_snapshot.py --rebuild
+"""
+
+import argparse
+import glob
+import json
+import os
+import pickle
+import time
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+
+from review_data import load_reviews_frame, section_columns
+from staff_dimensions import canonical_ad_name, load_dimension_table
+
+MODULE_DIR = Path(__file__).resolve().parent
+
+# Relative to the working directory, like the generators' own data/ paths
+DATA_DIR = Path("data")
+DEFAULT_SNAPSHOT_PATH = DATA_DIR / "analytics_snapshot.pkl"
+
+# Bump when the snapshot layout changes so old caches are rebuilt
+SNAPSHOT_VERSION = 2
+
+REVIEWS_FILE = "performance_reviews.csv"
+VERTICALS_FILE = "verticals.csv"
+BEST_PRACTICES_FILE = "best-practices.json"
+FOLLOW_UPS_FILE = "follow-up-questions.json"
+AD_CSVS_GLOB = "ad_csvs/*.csv"
+
+# Everything the snapshot is derived from: data files, and the code that derives it
+DATA_SOURCES = [REVIEWS_FILE, VERTICALS_FILE, BEST_PRACTICES_FILE, FOLLOW_UPS_FILE, AD_CSVS_GLOB]
+CODE_SOURCES = ["analytics_snapshot.py", "review_data.py", "staff_dimensions.py"]
+
+# Joint reviews are not credited to these ADs (per user request, as in the dashboard)
+JOINT_REVIEW_EXCLUSIONS = {"Justin Homa"}
+
+# data/ad_csvs file names that are not a spelling variant of the reviewed name
+FINANCIAL_FILE_ALIASES = {"Russell Ober": "RJ Ober"}
+
+FINANCIAL_MONTH = "Dec-25"
+
+
+class AnalyticsSnapshot:
+    """
+    Everything the generators render, keyed by canonical AD name.
+
+    sections          scoring sections in form order
+    ads               {AD: aggregate dict}, ranked by total score (see aggregate_ads)
+    section_rankings  {section: [AD, ...]} by section mean, highest first
+    staff             {AD: {"vertical", "tier", "role", "scorecard"}} for every verticals.csv row
+    best_practices    {AD: [practice, ...]} in file order
+    follow_ups        {AD: [item, ...]} in file order
+    """
+
+    __slots__ = ("version", "sources", "built_at", "sections", "ads", "section_rankings",
+                 "staff", "best_practices", "follow_ups")
+
+    def __init__(self, sections, ads, section_rankings, staff, best_practices, follow_ups):
+        self.version = SNAPSHOT_VERSION
+        self.sources = None
+        self.built_at = datetime.now().isoformat(timespec="seconds")
+        self.sections = sections
+        self.ads = ads
+        self.section_rankings = section_rankings
+        self.staff = staff
+        self.best_practices = best_practices
+        self.follow_ups = follow_ups
+
+
+def source_signature(data_dir=DATA_DIR):
+    """((path, size, mtime_ns), ...) for every source file, sorted by path."""
+    paths = [path for pattern in DATA_SOURCES for path in glob.glob(str(Path(data_dir) / pattern))]
+    paths += [str(MODULE_DIR / name) for name in CODE_SOURCES]
+    signature = []
+    for path in paths:
+        stat = os.stat(path)
+        signature.append((path, stat.st_size, stat.st_mtime_ns))
+    return tuple(sorted(signature))
+
+
+def _clean_text(value):
+    """Stripped text, or None for blanks and NaN."""
+    if value is None or pd.isna(value):
+        return None
+    text = str(value).strip()
+    return text if text and text.lower() not in ("nan", "none") else None
+
+
+def load_reviews(csv_path=DATA_DIR / REVIEWS_FILE):
+    """
+    One record per review row: {"id", "account", "reviewer", "ads", "joint", "scores", "feedback"}.
+
+    "ads" are the canonical names the review counts for; scores are floats (None when
+    blank) and feedback is stripped text (None when blank), both keyed by section. The
+    account is kept as exported, as the scorecards print it.
+    """
+    df = load_reviews_frame(csv_path)
+    sections = section_columns(df.columns)
+    reviews = []
+    for row in df.to_dict("records"):
+        raw_ad = _clean_text(row.get("Account Director Name"))
+        if not raw_ad or raw_ad == "Account Director Name":
+            continue
+        names = [canonical_ad_name(name) for name in raw_ad.split("/") if name.strip()]
+        joint = len(names) > 1
+        if joint:
+            names = [name for name in names if name not in JOINT_REVIEW_EXCLUSIONS]
+        scores = {}
+        for section, _, score_col in sections:
+            score = row[score_col]
+            scores[section] = None if pd.isna(score) else float(score)
+        reviews.append({
+            "id": row.get("Id"),
+            "account": row.get("Account Name") if _clean_text(row.get("Account Name")) else "N/A",
+            "reviewer": _clean_text(row.get("Enter Your Name")) or "Anonymous",
+            "ads": names,
+            "joint": joint,
+            "scores": scores,
+            "feedback": {section: _clean_text(row[feedback_col]) for section, feedback_col, _ in sections},
+        })
+    return [section for section, _, _ in sections], reviews
+
+
+def aggregate_ads(sections, reviews):
+    """
+    Per-AD aggregates in overall rank order:
+
+        name, rank, account (first own review), review_count, reviewers
+        scores        {section: mean rounded to 2, None if unscored}
+        counts        {section: number of scores}
+        feedback      {section: [{"reviewer", "score", "text", "joint"}, ...]} in file order
+        total_score   sum of the scored section means (max 5 per section), unrounded
+        sections_scored, mean_score (total_score / sections_scored)
+
+    Ties keep the order the reports always had: a section ranking lists tied ADs by their
+    first scored review, and the overall ranking (by total rounded to 1) lists them in the
+    order they first appear walking the section rankings.
+
+    Returns (ads, section_rankings).
+    """
+    grouped = {}
+    for review in reviews:
+        for name in review["ads"]:
+            grouped.setdefault(name, []).append(review)
+
+    ads = {}
+    for name, ad_reviews in grouped.items():
+        # The AD's own reviews before joint ones, so "account" is their own account
+        own_first = sorted(ad_reviews, key=lambda review: review["joint"])
+        scores, counts, feedback = {}, {}, {}
+        for section in sections:
+            values = [r["scores"][section] for r in ad_reviews if r["scores"][section] is not None]
+            scores[section] = round(sum(values) / len(values), 2) if values else None
+            counts[section] = len(values)
+            feedback[section] = [
+                {"reviewer": r["reviewer"], "score": r["scores"][section], "text": r["feedback"][section],
+                 "joint": r["joint"]}
+                for r in ad_reviews if r["feedback"][section]
+            ]
+        scored = [score for score in scores.values() if score is not None]
+        total = sum(scored)
+        ads[name] = {
+            "name": name,
+            "account": own_first[0]["account"],
+            "review_count": len(ad_reviews),
+            "reviewers": list(dict.fromkeys(r["reviewer"] for r in own_first)),
+            "scores": scores,
+            "counts": counts,
+            "feedback": feedback,
+            "total_score": total,
+            "sections_scored": len(scored),
+            "mean_score": round(total / len(scored), 2) if scored else 0,
+        }
+
+    section_rankings = {}
+    for section in sections:
+        first_scored = dict.fromkeys(
+            name for review in reviews if review["scores"][section] is not None for name in review["ads"]
+        )
+        section_rankings[section] = sorted(first_scored, key=lambda name: ads[name]["scores"][section],
+                                           reverse=True)
+
+    order = dict.fromkeys(name for section in sections for name in section_rankings[section])
+    order.update(dict.fromkeys(ads))
+    ranked = sorted(order, key=lambda name: round(ads[name]["total_score"], 1), reverse=True)
+    for rank, name in enumerate(ranked, 1):
+        ads[name]["rank"] = rank
+    ads = {name: ads[name] for name in ranked}
+    return ads, section_rankings
+
+
+def load_staff(path=DATA_DIR / VERTICALS_FILE):
+    """{AD: {"vertical", "tier", "role", "scorecard"}}; blanks are "" (scorecard None)."""
+    try:
+        table = load_dimension_table(path)
+    except Exception as e:
+        print(f"Warning: Could not load {path}: {e}")
+        return {}
+    staff = {}
+    for name, row in table.iterrows():
+        staff[canonical_ad_name(name)] = {
+            "vertical": "" if pd.isna(row["Vertical"]) else str(row["Vertical"]),
+            "tier": "" if pd.isna(row["Tier"]) else str(row["Tier"]),
+            "role": "" if pd.isna(row["Role"]) else str(row["Role"]),
+            "scorecard": None if pd.isna(row["Scorecard"]) else round(float(row["Scorecard"]), 2),
+        }
+    return staff
+
+
+def load_keyed_json(path):
+    """A {name: [items]} JSON file re-keyed by canonical AD name (variants merged)."""
+    with open(path, "r", encoding="utf-8") as f:
+        raw = json.load(f)
+    keyed = {}
+    for name, items in raw.items():
+        keyed.setdefault(canonical_ad_name(name), []).extend(items)
+    return keyed
+
+
+def clean_numeric_value(val):
+    """Clean malformed numeric values from CSVs
+    Handles cases like: '\"\"\"1\",\"104\"\"\"' -> 1104
+    """
+    if pd.isna(val) or val == '':
+        return None
+
+    try:
+        # Convert to string and remove all quotes and commas
+        cleaned = str(val).replace('"', '').replace(',', '').strip()
+        if cleaned:
+            return float(cleaned)
+    except:
+        pass
+    return None
+
+
+def load_financial_data(data_dir=DATA_DIR):
+    """Load all AD CSV files and aggregate Dec-25 financial metrics per (canonical) AD"""
+    ad_financial_data = {}
+
+    for csv_file in sorted(Path(data_dir).glob(AD_CSVS_GLOB)):
+        # Convert filename to AD name (e.g., "aaron-simpson.csv" -> "Aaron Simpson")
+        ad_name = csv_file.stem.replace('-', ' ').title()
+        ad_name = canonical_ad_name(FINANCIAL_FILE_ALIASES.get(ad_name, ad_name))
+
+        try:
+            df = pd.read_csv(csv_file)
+            if FINANCIAL_MONTH not in df.columns:
+                df[FINANCIAL_MONTH] = None
+            # First value per (account, KPI), as the per-account lookups did
+            values = df.drop_duplicates(["Account", "KPI"]).set_index(["Account", "KPI"])[FINANCIAL_MONTH]
+
+            def kpi(account, name):
+                return clean_numeric_value(values.get((account, name)))
+
+            accounts = df['Account'].unique().tolist()
+            revenue_total = 0
+            csat_values = []
+            headcount_total = 0
+            red_sites_count = 0
+            growth_values = []
+            account_revenues = {}  # Track revenue per account for sorting
+
+            for account in accounts:
+                revenue = kpi(account, 'Revenue ($)')
+                account_revenues[account] = revenue or 0
+                if revenue is not None:
+                    revenue_total += revenue
+                csat = kpi(account, 'CSAT')
+                if csat is not None:
+                    csat_values.append(csat)
+                headcount = kpi(account, 'Headcount')
+                if headcount is not None:
+                    headcount_total += int(headcount)
+                red_sites = kpi(account, 'Red Sites (#)')
+                if red_sites is not None:
+                    red_sites_count += int(red_sites)
+                growth = kpi(account, 'Growth (%)')
+                if growth is not None:
+                    growth_values.append(growth)
+
+            # Sort accounts by revenue (biggest to smallest)
+            sorted_accounts = sorted(accounts, key=lambda x: account_revenues.get(x, 0), reverse=True)
+
+            ad_financial_data[ad_name] = {
+                'accounts': sorted_accounts,
+                'num_accounts': len(sorted_accounts),
+                'revenue_total': revenue_total,
+                'csat_avg': sum(csat_values) / len(csat_values) if csat_values else None,
+                'headcount_total': headcount_total,
+                'red_sites_count': red_sites_count,
+                'growth_avg': sum(growth_values) / len(growth_values) if growth_values else None
+            }
+
+        except Exception as e:
+            print(f"Error processing {csv_file}: {e}")
+            continue
+
+    return ad_financial_data
+
+
+def apply_manual_mappings(financial_data):
+    """Apply manual mappings for ADs with special cases"""
+
+    # Rade Kukobat → Use Eli Lilly data
+    if "Eli Lilly" in financial_data:
+        financial_data["Rade Kukobat"] = financial_data["Eli Lilly"].copy()
+        print("  - Mapped Rade Kukobat to Eli Lilly")
+
+    # David Pergola & Justin Homa → Calculate from Merck headcount ratio
+    # Brian Davis Merck Dec-25: Revenue=$4,077K, Headcount=345
+    # Revenue per employee = $11.82K
+    merck_rev_per_employee = 4077 / 345  # $11.82K per employee
+
+    # David Pergola: 135 headcount (Merck Sodexo)
+    david_headcount = 135
+    david_revenue = david_headcount * merck_rev_per_employee
+    financial_data["David Pergola"] = {
+        'accounts': ['Merck Sodexo'],
+        'num_accounts': 1,
+        'revenue_total': david_revenue,
+        'csat_avg': 4.75,  # Use Brian's Merck CSAT
+        'headcount_total': david_headcount,
+        'red_sites_count': 0,  # Estimated
+        'growth_avg': 8.9,  # Use Brian's Merck growth
+        'calculated_revenue': True  # Flag for asterisk
+    }
+    print(f"  - Mapped David Pergola: {david_headcount} HC = ${david_revenue:.0f}K revenue (Merck Sodexo)")
+
+    # Justin Homa: Keep Organon data + ADD Merck CBRE calculation
+    justin_headcount_merck = 155
+    justin_revenue_merck = justin_headcount_merck * merck_rev_per_employee
+
+    if "Justin Homa" in financial_data:
+        # Add Merck CBRE to existing Organon data
+        organon_data = financial_data["Justin Homa"]
+        financial_data["Justin Homa"] = {
+            'accounts': ['Merck CBRE', 'Organon'],
+            'num_accounts': 2,
+            'revenue_total': justin_revenue_merck + organon_data.get('revenue_total', 0),
+            'csat_avg': 4.75,  # Use Merck CSAT
+            'headcount_total': justin_headcount_merck + organon_data.get('headcount_total', 0),
+            'red_sites_count': organon_data.get('red_sites_count', 0),
+            'growth_avg': 8.9,
+            'calculated_revenue': True  # Flag for asterisk
+        }
+        print(f"  - Mapped Justin Homa: Merck CBRE ({justin_headcount_merck} HC) + Organon = ${financial_data['Justin Homa']['revenue_total']:.0f}K total")
+
+    # Headcount overrides (AD-confirmed adjustments)
+    headcount_overrides = {
+        'Jack Thornton': 79,
+    }
+
+    for ad_name, confirmed_headcount in headcount_overrides.items():
+        if ad_name in financial_data:
+            old_headcount = financial_data[ad_name]['headcount_total']
+            financial_data[ad_name]['headcount_total'] = confirmed_headcount
+            financial_data[ad_name]['headcount_adjusted'] = True  # Flag for asterisk
+            print(f"  - Adjusted {ad_name} headcount: {old_headcount} -> {confirmed_headcount} (AD-confirmed)")
+
+    # Account reassignments (transfer accounts between ADs)
+
+    # Stuart Kelloff: Add Adobe (transfer from Rosalvina Quinonez)
+    # Adobe: $855K revenue, 106 HC
+    if "Stuart Kelloff" in financial_data:
+        adobe_revenue = 855
+        adobe_headcount = 106
+        stuart_data = financial_data["Stuart Kelloff"]
+        financial_data["Stuart Kelloff"] = {
+            'accounts': stuart_data.get('accounts', []) + ['Adobe Systems'],
+            'num_accounts': stuart_data.get('num_accounts', 0) + 1,
+            'revenue_total': stuart_data.get('revenue_total', 0) + adobe_revenue,
+            'csat_avg': stuart_data.get('csat_avg', 4.5),
+            'headcount_total': stuart_data.get('headcount_total', 0) + adobe_headcount,
+            'red_sites_count': stuart_data.get('red_sites_count', 0),
+            'growth_avg': stuart_data.get('growth_avg', 0)
+        }
+        print(f"  - Added Adobe Systems to Stuart Kelloff: +${adobe_revenue}K, +{adobe_headcount} HC")
+
+    # Grant Frazier: Assign Meta (from Luna Duarte)
+    # Meta: $4,176K revenue, 437 HC
+    financial_data["Grant Frazier"] = {
+        'accounts': ['Meta'],
+        'num_accounts': 1,
+        'revenue_total': 4176,
+        'csat_avg': 4.74,
+        'headcount_total': 437,
+        'red_sites_count': 1,
+        'growth_avg': 30.9
+    }
+    print(f"  - Assigned Meta to Grant Frazier: $4,176K, 437 HC")
+
+    # Taylor Wattenberg: Assign Microsoft (from TBH)
+    # Microsoft: $5,376K revenue, 600 HC
+    financial_data["Taylor Wattenberg"] = {
+        'accounts': ['Microsoft'],
+        'num_accounts': 1,
+        'revenue_total': 5376,
+        'csat_avg': 4.66,
+        'headcount_total': 600,
+        'red_sites_count': 4,
+        'growth_avg': 28.1
+    }
+    print(f"  - Assigned Microsoft to Taylor Wattenberg: $5,376K, 600 HC")
+
+    # Rade Kukobat: Assign Eli Lilly LCC/LRL
+    # Calculate revenue based on Chad Boulton's Eli Lilly account ratio
+    # Chad: $2,075K revenue / 399 HC = $5.20K per HC
+    # Rade: 83 HC × $5.20K = $431.5K
+    eli_lilly_rev_per_hc = 2075 / 399  # Chad's Eli Lilly ratio
+    rade_headcount = 83
+    rade_revenue = eli_lilly_rev_per_hc * rade_headcount
+
+    financial_data["Rade Kukobat"] = {
+        'accounts': ['Eli Lilly LCC/LRL'],
+        'num_accounts': 1,
+        'revenue_total': rade_revenue,
+        'csat_avg': 2.25,
+        'headcount_total': rade_headcount,
+        'red_sites_count': 1,
+        'growth_avg': 55.4,
+        'headcount_adjusted': True,  # Flag for asterisk - AD confirmed
+        'calculated_revenue': True   # Flag for asterisk - calculated from ratio
+    }
+    print(f"  - Assigned Eli Lilly LCC/LRL to Rade Kukobat: ${rade_revenue:.0f}K, {rade_headcount} HC (calculated from Chad's ratio)")
+
+    # Isaac Calderon: Use actual audited headcount (285 instead of 340)
+    if "Isaac Calderon" in financial_data:
+        # Keep all existing data but update headcount to audited value
+        financial_data["Isaac Calderon"]['headcount_total'] = 285
+        print(f"  - Corrected Isaac Calderon headcount to 285 (from audit)")
+
+    # Giselle Langelier: Add accounts (Medtronic, Capsida, Fuji Film)
+    financial_data["Giselle Langelier"] = {
+        'accounts': ['Medtronic', 'Capsida Biotherapeutics', 'Fuji Film'],
+        'num_accounts': 3,
+        'revenue_total': 672,
+        'csat_avg': 4.59,  # Average from the three accounts
+        'headcount_total': 98,
+        'red_sites_count': 2,
+        'growth_avg': 5.0
+    }
+    print(f"  - Assigned accounts to Giselle Langelier: $672K, 98 HC")
+
+    # Peggy Shum: Add accounts (Chubb Insurance, Deutsche Bank)
+    financial_data["Peggy Shum"] = {
+        'accounts': ['Chubb Insurance', 'Deutsche Bank'],
+        'num_accounts': 2,
+        'revenue_total': 547,
+        'csat_avg': 4.50,  # Estimated
+        'headcount_total': 67,
+        'red_sites_count': 0,
+        'growth_avg': 0
+    }
+    print(f"  - Assigned accounts to Peggy Shum: $547K, 67 HC")
+
+    # Gregory DeMedio: Add Abbott Labs (from LIFE SCIENCE.csv)
+    financial_data["Gregory DeMedio"] = {
+        'accounts': ['Abbott Labs'],
+        'num_accounts': 1,
+        'revenue_total': 1713,
+        'csat_avg': 4.49,
+        'headcount_total': 278,
+        'red_sites_count': 10,
+        'growth_avg': 0.8
+    }
+    print(f"  - Assigned Abbott Labs to Gregory DeMedio: $1,713K, 278 HC")
+
+    # Keith Deuber: Assign Amazon (same as Dustin Smith)
+    # Amazon: $3,140K revenue, 733 HC (from dustin-smith.csv Dec-25 data)
+    financial_data["Keith Deuber"] = {
+        'accounts': ['Amazon'],
+        'num_accounts': 1,
+        'revenue_total': 3140,
+        'csat_avg': 4.76,
+        'headcount_total': 733,
+        'red_sites_count': 16,
+        'growth_avg': -38.7
+    }
+    print(f"  - Assigned Amazon to Keith Deuber: $3,140K, 733 HC")
+
+    return financial_data
+
+
+def build_snapshot(data_dir=DATA_DIR):
+    """Load every source and aggregate it (the expensive step). Does not touch the cache."""
+    data_dir = Path(data_dir)
+    sections, reviews = load_reviews(data_dir / REVIEWS_FILE)
+    ads, section_rankings = aggregate_ads(sections, reviews)
+    staff = load_staff(data_dir / VERTICALS_FILE)
+    financials = apply_manual_mappings(load_financial_data(data_dir))
+    for name, ad in ads.items():
+        dims = staff.get(name, {})
+        ad["vertical"] = dims.get("vertical", "")
+        ad["tier"] = dims.get("tier", "")
+        ad["role"] = dims.get("role", "")
+        ad["scorecard"] = dims.get("scorecard")
+        ad["financials"] = financials.get(name, {})
+    return AnalyticsSnapshot(
+        sections=sections,
+        ads=ads,
+        section_rankings=section_rankings,
+        staff=staff,
+        best_practices=load_keyed_json(data_dir / BEST_PRACTICES_FILE),
+        follow_ups=load_keyed_json(data_dir / FOLLOW_UPS_FILE),
+    )
+
+
+def read_snapshot(path=DEFAULT_SNAPSHOT_PATH):
+    """The cached snapshot, or None if it is missing, unreadable or from another version."""
+    try:
+        with open(path, "rb") as f:
+            snapshot = pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError, TypeError):
+        return None
+    if not isinstance(snapshot, AnalyticsSnapshot) or snapshot.version != SNAPSHOT_VERSION:
+        return None
+    return snapshot
+
+
+def write_snapshot(snapshot, path=DEFAULT_SNAPSHOT_PATH):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Per-process temp file, swapped in atomically so concurrent readers never see half a file
+    tmp_path = path.with_name(f"{path.stem}.{os.getpid()}.tmp")
+    with open(tmp_path, "wb") as f:
+        pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, path)
+
+
+def load_snapshot(path=DEFAULT_SNAPSHOT_PATH, rebuild=False):
+    """
+    The current snapshot: the cached one if its sources are unchanged, otherwise a
+    fresh build (which is written back to the cache).
+    """
+    signature = source_signature()
+    if not rebuild:
+        snapshot = read_snapshot(path)
+        if snapshot is not None and snapshot.sources == signature:
+            return snapshot
+    snapshot = build_snapshot()
+    snapshot.sources = signature
+    write_snapshot(snapshot, path)
+    return snapshot
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build (if stale) and summarize the shared analytics snapshot.")
+    parser.add_argument("--rebuild", action="store_true", help="Rebuild even if the cache is current")
+    parser.add_argument("--path", default=str(DEFAULT_SNAPSHOT_PATH))
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    snapshot = load_snapshot(args.path, rebuild=args.rebuild)
+    elapsed = time.perf_counter() - started
+
+    print(f"{args.path}: built {snapshot.built_at}, loaded in {elapsed * 1000:.0f} ms")
+    print(f"  {len(snapshot.ads)} ADs, {len(snapshot.sections)} sections, {len(snapshot.staff)} staff rows, "
+          f"{sum(map(len, snapshot.follow_ups.values()))} follow-ups")
+    for name, ad in snapshot.ads.items():
+        print(f"  {ad['rank']:>3}. {name:<28} {ad['total_score']:>6.2f}  ({ad['review_count']} reviews)")
+
+
+if __name__ == "__main__":
+    # Build through the imported module so the cache pickles analytics_snapshot.AnalyticsSnapshot,
+    # not __main__.AnalyticsSnapshot (which the generators could not load)
+    import analytics_snapshot
+    analytics_snapshot.main()
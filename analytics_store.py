@@ -0,0 +1,420 @@
+"""
+Local SQLite analytical store for reviews, account KPIs, ATB, Month End Ranking and verticals.
+
+`python analytics_store.py ingest` parses every source file once into data/analytics.db
+(long/tidy tables with indexes on canonical AD, account, month and IFM). The query
+helpers below are what generators and server.py use instead of re-reading the CSVs:
+
+    from analytics_store import connect, revenue_by_ad
+    conn = connect()
+    rows = revenue_by_ad(conn, vertical="FINANCE", month="2025-12")
+
+Ad-hoc questions can go straight to SQL:
+
+    python analytics_store.py query "SELECT * FROM account_kpis WHERE account_director = 'Brian Davis'"
+
+Months are stored as "YYYY-MM" so they sort and range-filter correctly.
+"""
+
+import argparse
+import csv
+import os
+import re
+import sqlite3
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+
+from review_data import section_columns
+from staff_dimensions import canonical_ad_name, load_dimension_table
+
+REPO_DIR = Path(__file__).resolve().parent
+DATA_DIR = REPO_DIR / "data"
+DEFAULT_DB_PATH = DATA_DIR / "analytics.db"
+
+SCHEMA_VERSION = 1
+
+VERTICAL_KPI_FILES = ["DISTRIBUTION.csv", "FINANCE.csv", "TECHNOLOGY.csv", "MANUFACTURING.csv", "LIFE SCIENCE.csv"]
+REVIEWS_FILE = "performance_reviews.csv"
+VERTICALS_FILE = "verticals.csv"
+ATB_GLOB = "ATB *.csv"
+MONTH_END_GLOB = "Month End Ranking - *.csv"
+
+MONTH_NAMES = {datetime(2000, m, 1).strftime("%B").lower(): m for m in range(1, 13)}
+
+SCHEMA = """
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE sources (path TEXT PRIMARY KEY, mtime REAL, rows INTEGER);
+
+CREATE TABLE verticals (
+    account_director TEXT PRIMARY KEY,
+    vertical TEXT, tier TEXT, role TEXT, scorecard REAL
+);
+
+CREATE TABLE reviews (
+    review_id INTEGER PRIMARY KEY,
+    source_id TEXT,
+    completed_at TEXT,
+    reviewer TEXT,
+    reviewer_email TEXT,
+    account TEXT,
+    account_director_raw TEXT,
+    account_director TEXT
+);
+-- One row per AD named on a review (joint reviews "A / B" credit both)
+CREATE TABLE review_ads (review_id INTEGER, account_director TEXT);
+CREATE TABLE review_scores (review_id INTEGER, section TEXT, score REAL, feedback TEXT);
+
+CREATE TABLE account_kpis (
+    account TEXT, account_director TEXT, vertical TEXT, kpi TEXT, month TEXT, value REAL
+);
+CREATE TABLE atb (account TEXT, month TEXT, value REAL);
+CREATE TABLE month_end (
+    report_month TEXT, ifm TEXT, account TEXT, account_owner TEXT, metric TEXT, value REAL
+);
+
+CREATE INDEX idx_review_ads_ad ON review_ads (account_director);
+CREATE INDEX idx_review_scores_review ON review_scores (review_id);
+CREATE INDEX idx_reviews_account ON reviews (account);
+CREATE INDEX idx_kpis_ad ON account_kpis (account_director, kpi, month);
+CREATE INDEX idx_kpis_account ON account_kpis (account, kpi, month);
+CREATE INDEX idx_kpis_vertical ON account_kpis (vertical, kpi, month);
+CREATE INDEX idx_atb_account ON atb (account, month);
+CREATE INDEX idx_month_end_ifm ON month_end (ifm, metric);
+CREATE INDEX idx_month_end_account ON month_end (account, metric);
+CREATE INDEX idx_month_end_owner ON month_end (account_owner, metric);
+"""
+
+
+def parse_number(value):
+    """Parse finance-export numbers: ' 1,234 ', ' (1,234)' -> -1234, '9.2%', ' -   ' -> None."""
+    if value is None:
+        return None
+    s = str(value).replace(",", "").replace("$", "").replace("%", "").replace(" ", "").strip()
+    if s in ("", "-", "nan"):
+        return None
+    if s.startswith("(") and s.endswith(")"):
+        s = "-" + s[1:-1]
+    try:
+        return float(s)
+    except ValueError:
+        return None
+
+
+def month_key(label):
+    """'Dec-24' -> '2024-12' (None if the label is not a month)."""
+    try:
+        return datetime.strptime(label.strip(), "%b-%y").strftime("%Y-%m")
+    except ValueError:
+        return None
+
+
+def read_csv_rows(path):
+    with open(path, encoding="utf-8-sig", newline="") as f:
+        return list(csv.reader(f))
+
+
+def iter_review_rows(path):
+    """Yield (review tuple, [(section, score, feedback)]) from the Year-End Review export."""
+    df = pd.read_csv(path, dtype=str, keep_default_na=False)
+    columns = list(df.columns)
+    pairs = section_columns(columns)
+    for record in df.itertuples(index=False, name=None):
+        row = dict(zip(columns, record))
+        raw_ad = row.get("Account Director Name", "").strip()
+        if not raw_ad or raw_ad == "Account Director Name":
+            continue
+        review = (
+            row.get("Id", ""), row.get("Completion time", ""),
+            (row.get("Enter Your Name") or row.get("Name", "")).strip(),
+            row.get("Email", "").strip(), row.get("Account Name", "").strip(),
+            raw_ad, canonical_ad_name(raw_ad),
+        )
+        sections = [(section, parse_number(row[score_col]), row[feedback_col].strip())
+                    for section, feedback_col, score_col in pairs]
+        yield review, sections
+
+
+def iter_kpi_rows(path):
+    """Yield (account, AD, vertical, kpi, month, value) from a "KPIs - BY ACCOUNT" block file."""
+    rows = read_csv_rows(path)
+    vertical = Path(path).stem
+    header_idx = next((i for i, row in enumerate(rows) if any(month_key(c) for c in row[1:3])), None)
+    if header_idx is None:
+        return
+    months = [(i, month_key(label)) for i, label in enumerate(rows[header_idx]) if i and month_key(label)]
+    account = ad = None
+    for row in rows[header_idx + 1:]:
+        label = row[0].strip() if row else ""
+        if not label:
+            continue
+        if " - " in label:
+            # Last " - " separates the AD; account names may contain dashes
+            account, _, ad = label.rpartition(" - ")
+            account, ad = account.strip(), canonical_ad_name(ad) or "Unknown"
+        elif account:
+            for col, month in months:
+                value = parse_number(row[col]) if col < len(row) else None
+                if value is not None:
+                    yield account, ad, vertical, label, month, value
+
+
+def iter_atb_rows(path):
+    """Yield (account, month, value) for "Above Base Services" portfolio rows."""
+    rows = read_csv_rows(path)
+    # Rows 1-2 hold year and month name for each value column
+    months = {}
+    for col in range(2, min(len(rows[1]), len(rows[2]))):
+        year, name = rows[1][col].strip(), rows[2][col].strip().lower()
+        if year.isdigit() and name in MONTH_NAMES:
+            months[col] = f"{year}-{MONTH_NAMES[name]:02d}"
+    for row in rows[3:]:
+        if len(row) < 2 or row[0].strip() != "Above Base Services" or "Portfolio" not in row[1]:
+            continue
+        account = row[1].replace(" Portfolio", "").strip()
+        for col, month in months.items():
+            value = parse_number(row[col]) if col < len(row) else None
+            if value is not None:
+                yield account, month, value
+
+
+def parse_month_end_label(label):
+    """'IFM-Account - Owner' -> (IFM, Account, Owner); IFM subtotal rows -> None."""
+    parts = label.strip().split(" - ")
+    if len(parts) < 2:
+        return None
+    ifm, _, account = " - ".join(parts[:-1]).partition("-")
+    if not ifm.strip() or not account.strip():
+        return None
+    return ifm.strip(), account.strip(), parts[-1].strip()
+
+
+def iter_month_end_rows(path):
+    """Yield (report_month, ifm, account, owner, metric, value) for account rows."""
+    match = re.search(r"- (\w+) (\d{4})", Path(path).stem)
+    report_month = (f"{match.group(2)}-{MONTH_NAMES[match.group(1).lower()]:02d}"
+                    if match and match.group(1).lower() in MONTH_NAMES else None)
+    rows = read_csv_rows(path)
+    header_idx = next((i for i, row in enumerate(rows) if row and row[0].strip() == "Row Labels"), None)
+    if header_idx is None:
+        return
+    names_row = rows[header_idx - 1] if rows[header_idx - 1] and rows[header_idx - 1][0].strip() == "IFM" else None
+    metrics = [(col, (names_row[col] if names_row else label.replace("Sum of ", "")).strip())
+               for col, label in enumerate(rows[header_idx]) if col and label.strip()]
+    for row in rows[header_idx + 1:]:
+        parsed = parse_month_end_label(row[0]) if row else None
+        if not parsed:
+            continue
+        ifm, account, owner = parsed
+        for col, metric in metrics:
+            value = parse_number(row[col]) if col < len(row) else None
+            if value is not None:
+                yield report_month, ifm, account, canonical_ad_name(owner), metric, value
+
+
+def ingest(db_path=DEFAULT_DB_PATH, data_dir=DATA_DIR):
+    """Rebuild the store from the files in data_dir. Returns {table: row count}."""
+    data_dir = Path(data_dir)
+    db_path = Path(db_path)
+    tmp_path = db_path.with_suffix(".tmp")
+    if tmp_path.exists():
+        tmp_path.unlink()
+
+    conn = sqlite3.connect(tmp_path)
+    conn.executescript(SCHEMA)
+    counts = {}
+
+    def record_source(path, rows):
+        conn.execute("INSERT OR REPLACE INTO sources VALUES (?, ?, ?)",
+                     (os.path.relpath(path, data_dir), os.path.getmtime(path), rows))
+
+    verticals_path = data_dir / VERTICALS_FILE
+    if verticals_path.exists():
+        table = load_dimension_table(verticals_path).astype(object).where(lambda t: t.notna(), None)
+        conn.executemany("INSERT INTO verticals VALUES (?, ?, ?, ?, ?)",
+                         [(ad, r["Vertical"], r["Tier"], r["Role"], r["Scorecard"]) for ad, r in table.iterrows()])
+        record_source(verticals_path, len(table))
+
+    reviews_path = data_dir / REVIEWS_FILE
+    if reviews_path.exists():
+        count = 0
+        for review, sections in iter_review_rows(reviews_path):
+            review_id = conn.execute(
+                "INSERT INTO reviews (source_id, completed_at, reviewer, reviewer_email, account,"
+                " account_director_raw, account_director) VALUES (?, ?, ?, ?, ?, ?, ?)", review).lastrowid
+            conn.executemany("INSERT INTO review_ads VALUES (?, ?)",
+                             [(review_id, canonical_ad_name(name)) for name in review[5].split("/") if name.strip()])
+            conn.executemany("INSERT INTO review_scores VALUES (?, ?, ?, ?)",
+                             [(review_id, section, score, feedback) for section, score, feedback in sections])
+            count += 1
+        record_source(reviews_path, count)
+
+    sources = [
+        ("account_kpis", "INSERT INTO account_kpis VALUES (?, ?, ?, ?, ?, ?)", iter_kpi_rows,
+         [data_dir / name for name in VERTICAL_KPI_FILES if (data_dir / name).exists()]),
+        ("atb", "INSERT INTO atb VALUES (?, ?, ?)", iter_atb_rows, sorted(data_dir.glob(ATB_GLOB))),
+        ("month_end", "INSERT INTO month_end VALUES (?, ?, ?, ?, ?, ?)", iter_month_end_rows,
+         sorted(data_dir.glob(MONTH_END_GLOB))),
+    ]
+    for _, sql, iterator, paths in sources:
+        for path in paths:
+            rows = list(iterator(path))
+            conn.executemany(sql, rows)
+            record_source(path, len(rows))
+
+    conn.executemany("INSERT INTO meta VALUES (?, ?)", [
+        ("schema_version", str(SCHEMA_VERSION)),
+        ("ingested_at", datetime.now().isoformat(timespec="seconds")),
+    ])
+    conn.commit()
+    for table in ["verticals", "reviews", "review_ads", "review_scores", "account_kpis", "atb", "month_end"]:
+        counts[table] = conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+    conn.execute("ANALYZE")
+    conn.close()
+    # Swap in atomically so readers never see a half-built store
+    os.replace(tmp_path, db_path)
+    return counts
+
+
+def connect(db_path=DEFAULT_DB_PATH):
+    """Open the store read-only with dict-like rows. Raises FileNotFoundError if not ingested."""
+    db_path = Path(db_path)
+    if not db_path.exists():
+        raise FileNotFoundError(f"{db_path} not found - run: python analytics_store.py ingest")
+    conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True, check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    return conn
+
+
+def _rows(cursor):
+    return [dict(row) for row in cursor.fetchall()]
+
+
+def latest_month(conn, kpi="Revenue ($)"):
+    return conn.execute("SELECT MAX(month) FROM account_kpis WHERE kpi = ?", (kpi,)).fetchone()[0]
+
+
+def revenue_by_ad(conn, vertical=None, month=None, kpi="Revenue ($)"):
+    """Per-AD total of a KPI for one month (default: latest), largest first."""
+    month = month or latest_month(conn, kpi)
+    sql = ("SELECT account_director, SUM(value) AS total, COUNT(*) AS accounts,"
+           " SUM(value > 0) AS accounts_with_value"
+           " FROM account_kpis WHERE kpi = ? AND month = ?")
+    params = [kpi, month]
+    if vertical:
+        sql += " AND vertical = ?"
+        params.append(vertical)
+    sql += " GROUP BY account_director ORDER BY total DESC"
+    return _rows(conn.execute(sql, params))
+
+
+def accounts_for_ad(conn, ad_name, month=None):
+    """One row per account owned by an AD with that month's KPIs as columns."""
+    month = month or latest_month(conn)
+    rows = conn.execute(
+        "SELECT account, vertical, kpi, value FROM account_kpis"
+        " WHERE account_director = ? AND month = ? ORDER BY account",
+        (canonical_ad_name(ad_name), month)).fetchall()
+    accounts = {}
+    for row in rows:
+        entry = accounts.setdefault(row["account"], {"account": row["account"], "vertical": row["vertical"]})
+        entry[row["kpi"]] = row["value"]
+    return list(accounts.values())
+
+
+def kpi_history(conn, account, kpi):
+    """[(month, value)] for one account's KPI in month order."""
+    return [tuple(row) for row in conn.execute(
+        "SELECT month, value FROM account_kpis WHERE account = ? AND kpi = ? ORDER BY month", (account, kpi))]
+
+
+def atb_by_account(conn, account=None):
+    sql = "SELECT account, month, value FROM atb"
+    params = []
+    if account:
+        sql += " WHERE account = ?"
+        params.append(account)
+    return _rows(conn.execute(sql + " ORDER BY account, month", params))
+
+
+def month_end_by_ifm(conn, ifm, metric="RV", report_month=None):
+    """Accounts under one IFM ranked by a Month End metric."""
+    report_month = report_month or conn.execute("SELECT MAX(report_month) FROM month_end").fetchone()[0]
+    return _rows(conn.execute(
+        "SELECT account, account_owner, value FROM month_end"
+        " WHERE ifm = ? AND metric = ? AND report_month = ? ORDER BY value DESC",
+        (ifm, metric, report_month)))
+
+
+def review_scores_for_ad(conn, ad_name):
+    """Each section score and feedback on every review naming the AD (joint reviews included)."""
+    return _rows(conn.execute(
+        "SELECT r.review_id, r.reviewer, r.account, r.completed_at, s.section, s.score, s.feedback"
+        " FROM review_ads a JOIN reviews r USING (review_id) JOIN review_scores s USING (review_id)"
+        " WHERE a.account_director = ? ORDER BY r.review_id",
+        (canonical_ad_name(ad_name),)))
+
+
+def ad_summary(conn):
+    """Reviews, average total score, vertical/tier and latest-month revenue per AD."""
+    month = latest_month(conn)
+    return _rows(conn.execute(
+        """
+        WITH totals AS (
+            SELECT a.account_director, s.review_id, SUM(s.score) AS total
+            FROM review_ads a JOIN review_scores s USING (review_id)
+            GROUP BY a.account_director, s.review_id
+        ), revenue AS (
+            SELECT account_director, SUM(value) AS revenue FROM account_kpis
+            WHERE kpi = 'Revenue ($)' AND month = ? GROUP BY account_director
+        )
+        SELECT t.account_director, COUNT(*) AS reviews, ROUND(AVG(t.total), 2) AS avg_total_score,
+               v.vertical, v.tier, r.revenue
+        FROM totals t
+        LEFT JOIN verticals v USING (account_director)
+        LEFT JOIN revenue r USING (account_director)
+        GROUP BY t.account_director ORDER BY avg_total_score DESC
+        """, (month,)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build or query the SQLite analytics store.")
+    parser.add_argument("--db", default=str(DEFAULT_DB_PATH), help="Store location")
+    sub = parser.add_subparsers(dest="command", required=True)
+    ingest_parser = sub.add_parser("ingest", help="(Re)load all source files")
+    ingest_parser.add_argument("--data-dir", default=str(DATA_DIR))
+    query_parser = sub.add_parser("query", help="Run a read-only SQL query")
+    query_parser.add_argument("sql")
+    revenue_parser = sub.add_parser("revenue-by-ad", help="Per-AD revenue for a month")
+    revenue_parser.add_argument("--vertical")
+    revenue_parser.add_argument("--month", help="YYYY-MM (default: latest)")
+    args = parser.parse_args()
+
+    if args.command == "ingest":
+        counts = ingest(args.db, args.data_dir)
+        print(f"Built {args.db}")
+        for table, count in counts.items():
+            print(f"  {table:<15} {count:>8,} rows")
+        return
+
+    try:
+        conn = connect(args.db)
+    except FileNotFoundError as e:
+        sys.exit(str(e))
+    try:
+        if args.command == "query":
+            rows = _rows(conn.execute(args.sql))
+        else:
+            rows = revenue_by_ad(conn, vertical=args.vertical, month=args.month)
+    finally:
+        conn.close()
+    if rows:
+        print(pd.DataFrame(rows).to_string(index=False))
+    else:
+        print("(no rows)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+"""
+Benchmark the data pipeline against synthetic data at several scales.
+
+For each scale a throwaway workspace is created (data/, vanilla-js-app/, reports-v2/),
+filled by generate_synthetic_data.py, and each stage is run as a subprocess from the
+repo's own scripts. Wall time, CPU time and peak RSS are recorded per stage and
+appended to a JSON history file so runs can be compared over time.
+
+The scaling exponent between consecutive scales (log(t2/t1) / log(s2/s1)) is printed
+per stage: ~1 is linear, ~2 means a quadratic regression crept in.
+
+Usage:
+    python benchmark_pipeline.py                       # scales 1 10
+    python benchmark_pipeline.py --scales 1 10 100 --stages build_data prepare_dashboard_data
+"""
+
+import argparse
+import json
+import math
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+from generate_synthetic_data import generate
+
+REPO_DIR = Path(__file__).resolve().parent
+DEFAULT_HISTORY_PATH = REPO_DIR / "docs" / "benchmark_history.json"
+
+# Flag a stage when its runtime grows faster than this power of the data size
+SUPERLINEAR_EXPONENT = 1.5
+
+# name -> (argv relative to the repo, cwd relative to the workspace)
+STAGES = {
+    "parse_vertical_csvs": ([sys.executable, str(REPO_DIR / "script2_parse_vertical_csvs.py")], "."),
+    "prepare_dashboard_data": ([sys.executable, "-c",
+                                "import sys; sys.path.insert(0, sys.argv[1]); "
+                                "from data_processor import prepare_dashboard_data; prepare_dashboard_data()",
+                                str(REPO_DIR / "streamlit-app")], "."),
+    "build_data": ([sys.executable, str(REPO_DIR / "vanilla-js-app" / "build_data.py")], "vanilla-js-app"),
+    # Aggregation shared by the two generators below (they only render from its cache)
+    "analytics_snapshot": ([sys.executable, str(REPO_DIR / "analytics_snapshot.py")], "."),
+    "generate_scorecards": ([sys.executable, str(REPO_DIR / "generate_scorecards.py")], "."),
+    "generate_enhanced_report": ([sys.executable, str(REPO_DIR / "generate_enhanced_report.py")], "."),
+}
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=REPO_DIR,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_stage(argv, cwd, log_path):
+    """Run one stage, returning wall/CPU seconds, peak RSS (KB) and the exit code."""
+    env = dict(os.environ, PYTHONPATH=str(REPO_DIR))
+    with open(log_path, "w", encoding="utf-8") as log:
+        started = time.perf_counter()
+        proc = subprocess.Popen(argv, cwd=cwd, stdout=log, stderr=subprocess.STDOUT, env=env)
+        _, status, usage = os.wait4(proc.pid, 0)
+        wall = time.perf_counter() - started
+    proc.returncode = os.waitstatus_to_exitcode(status)
+    return {
+        "wall_s": round(wall, 3),
+        "cpu_s": round(usage.ru_utime + usage.ru_stime, 3),
+        "max_rss_kb": usage.ru_maxrss,
+        "returncode": proc.returncode,
+    }
+
+
+def benchmark_scale(scale, stages, seed, keep_workspace=False):
+    workspace = Path(tempfile.mkdtemp(prefix=f"pipeline-bench-x{scale}-"))
+    (workspace / "vanilla-js-app").mkdir()
+    (workspace / "reports-v2").mkdir()
+    summary = generate(workspace / "data", scale=scale, seed=seed)
+    print(f"\nScale x{scale}: {summary['ads']} ADs, {summary['accounts']} accounts, "
+          f"{summary['reviews']} reviews  ({workspace})")
+
+    results = {}
+    for name in stages:
+        argv, cwd = STAGES[name]
+        result = run_stage(argv, workspace / cwd, workspace / f"{name}.log")
+        results[name] = result
+        status = "ok" if result["returncode"] == 0 else f"FAILED (exit {result['returncode']}, see {name}.log)"
+        print(f"  {name:<26} {result['wall_s']:>8.2f}s wall {result['cpu_s']:>8.2f}s cpu "
+              f"{result['max_rss_kb'] / 1024:>8.1f} MB  {status}")
+
+    if not keep_workspace and all(r["returncode"] == 0 for r in results.values()):
+        shutil.rmtree(workspace, ignore_errors=True)
+    return {"scale": scale, "rows": summary, "stages": results}
+
+
+def print_scaling(runs, stages):
+    if len(runs) < 2:
+        return
+    print("\nScaling exponent (1 = linear, 2 = quadratic)")
+    for name in stages:
+        exponents = []
+        for prev, cur in zip(runs, runs[1:]):
+            t1, t2 = prev["stages"][name]["wall_s"], cur["stages"][name]["wall_s"]
+            if t1 > 0 and t2 > 0:
+                exponents.append(math.log(t2 / t1) / math.log(cur["scale"] / prev["scale"]))
+        text = "  ".join(f"{e:.2f}" for e in exponents)
+        flag = "  <-- superlinear" if exponents and max(exponents) > SUPERLINEAR_EXPONENT else ""
+        print(f"  {name:<26} {text}{flag}")
+
+
+def append_history(path, record):
+    path = Path(path)
+    history = []
+    if path.exists():
+        with open(path, "r", encoding="utf-8") as f:
+            history = json.load(f)
+    history.append(record)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(history, f, indent=2)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time each pipeline stage on synthetic data.")
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 10], help="Data size multipliers")
+    parser.add_argument("--stages", nargs="+", choices=list(STAGES), default=list(STAGES), help="Stages to run")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--history", default=str(DEFAULT_HISTORY_PATH), help="JSON file results are appended to")
+    parser.add_argument("--keep-workspace", action="store_true", help="Keep generated data and outputs")
+    args = parser.parse_args()
+
+    runs = [benchmark_scale(scale, args.stages, args.seed, args.keep_workspace) for scale in sorted(args.scales)]
+    print_scaling(runs, args.stages)
+
+    append_history(args.history, {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "seed": args.seed,
+        "runs": runs,
+    })
+    print(f"\nResults appended to {args.history}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,11 @@
-import pandas as pd
-from collections import defaultdict
-from generate_report import load_data, get_score_columns, calculate_rankings
+from analytics_snapshot import load_snapshot
 
-df, _, _ = load_data()
-rankings = calculate_rankings(df)
+snapshot = load_snapshot()
 
-print(f'Total sections found: {len(rankings)}\n')
+print(f'Total sections found: {len(snapshot.sections)}\n')
 
 # Count how many sections each AD appears in
-ad_section_count = defaultdict(int)
-for section, ads in rankings.items():
-    for ad in ads:
-        ad_section_count[ad['name']] += 1
+ad_section_count = {name: ad['sections_scored'] for name, ad in snapshot.ads.items()}
 
 # Find ADs missing sections
 print('ADs MISSING SECTIONS:')
@@ -1,44 +1,12 @@
 """
 Generate Enhanced EOY Account Director Review Report with Financial KPIs
+Scores, financials, tiers and verticals come from the shared analytics snapshot
+(analytics_snapshot.py).
 """
-import pandas as pd
-import json
-from collections import defaultdict
-from pathlib import Path
+import argparse
 
-def normalize_ad_name(name):
-    """Normalize AD names to ensure consistent matching"""
-    if not name or pd.isna(name):
-        return ""
-    
-    # Name normalization mapping
-    name_map = {
-        # Remove possessive
-        "Logan Newman's": "Logan Newman",
-        
-        # Standardize David/Dave
-        "Dave Pergola": "David Pergola",
-        "Pergola, David": "David Pergola",
-        
-        # Standardize Gregory/Greg DeMedio
-        "Greg DeMedio": "Gregory DeMedio",
-        "Greg Demedio": "Gregory DeMedio",
-        "Gregory Demedio": "Gregory DeMedio",
-        
-        # Other variations
-        "Nick Trenkamp": "Nicholas Trenkamp",
-        "Nike Trenkamp": "Nicholas Trenkamp",
-        "Ayesha Nasi": "Ayesha Nasir",
-        "Gisell Langelier": "Giselle Langelier",
-        "Collen Doles": "Colleen Doles",
-        "RJ Ober": "Russell Ober",
-        "Sid Shah": "Siddarth Shah",
-        "Mike Barry": "Michael Barry",
-        "Peggy McElwee": "Peggy Shum",
-    }
-    
-    name_str = str(name).strip()
-    return name_map.get(name_str, name_str)
+from analytics_snapshot import load_snapshot
+from instrumentation import Profiler, add_profile_arguments
 
 def calculate_letter_grade(score):
     """Calculate letter grade based on total score out of 40"""
@@ -84,403 +52,6 @@ def get_grade_class(letter_grade):
     else:
         return "tier-badge"
 
-def clean_numeric_value(val):
-    """Clean malformed numeric values from CSVs
-    Handles cases like: '\"\"\"1\",\"104\"\"\"' -> 1104
-    """
-    if pd.isna(val) or val == '':
-        return None
-    
-    try:
-        # Convert to string and remove all quotes and commas
-        cleaned = str(val).replace('"', '').replace(',', '').strip()
-        if cleaned:
-            return float(cleaned)
-    except:
-        pass
-    return None
-
-def load_performance_data():
-    """Load performance review data"""
-    df = pd.read_csv("data/performance_reviews.csv", low_memory=False)
-    
-    # Split joint reviews into individual entries
-    expanded_rows = []
-    for _, row in df.iterrows():
-        ad_name = str(row.get("Account Director Name", "")).strip()
-        if "/" in ad_name:
-            names = [n.strip() for n in ad_name.split("/")]
-            for name in names:
-                new_row = row.copy()
-                new_row["Account Director Name"] = normalize_ad_name(name)
-                expanded_rows.append(new_row)
-        else:
-            row["Account Director Name"] = normalize_ad_name(ad_name)
-            expanded_rows.append(row)
-    
-    return pd.DataFrame(expanded_rows)
-
-def load_financial_data():
-    """Load all AD CSV files and aggregate financial metrics"""
-    ad_csvs_dir = Path("data/ad_csvs")
-    ad_financial_data = {}
-    
-    for csv_file in ad_csvs_dir.glob("*.csv"):
-        # Convert filename to AD name (e.g., "aaron-simpson.csv" -> "Aaron Simpson")
-        ad_name = csv_file.stem.replace('-', ' ').title()
-        # Normalize the name
-        ad_name = normalize_ad_name(ad_name)
-        
-        try:
-            df = pd.read_csv(csv_file)
-            
-            # Get unique accounts
-            accounts = df['Account'].unique().tolist()
-            
-            # Calculate metrics for Dec-25 (most recent)
-            revenue_total = 0
-            csat_values = []
-            headcount_total = 0
-            red_sites_count = 0
-            growth_values = []
-            account_revenues = {}  # Track revenue per account for sorting
-            
-            for account in accounts:
-                account_df = df[df['Account'] == account]
-                
-                # Revenue
-                account_revenue = 0
-                rev_row = account_df[account_df['KPI'] == 'Revenue ($)']
-                if not rev_row.empty and 'Dec-25' in rev_row.columns:
-                    val = rev_row['Dec-25'].values[0]
-                    cleaned_val = clean_numeric_value(val)
-                    if cleaned_val is not None:
-                        account_revenue = cleaned_val
-                        revenue_total += cleaned_val
-                account_revenues[account] = account_revenue
-                
-                # CSAT
-                csat_row = account_df[account_df['KPI'] == 'CSAT']
-                if not csat_row.empty and 'Dec-25' in csat_row.columns:
-                    val = csat_row['Dec-25'].values[0]
-                    cleaned_val = clean_numeric_value(val)
-                    if cleaned_val is not None:
-                        csat_values.append(cleaned_val)
-                
-                # Headcount
-                hc_row = account_df[account_df['KPI'] == 'Headcount']
-                if not hc_row.empty and 'Dec-25' in hc_row.columns:
-                    val = hc_row['Dec-25'].values[0]
-                    cleaned_val = clean_numeric_value(val)
-                    if cleaned_val is not None:
-                        headcount_total += int(cleaned_val)
-                
-                # Red Sites #
-                rs_row = account_df[account_df['KPI'] == 'Red Sites (#)']
-                if not rs_row.empty and 'Dec-25' in rs_row.columns:
-                    val = rs_row['Dec-25'].values[0]
-                    cleaned_val = clean_numeric_value(val)
-                    if cleaned_val is not None:
-                        red_sites_count += int(cleaned_val)
-                
-                # Growth %
-                growth_row = account_df[account_df['KPI'] == 'Growth (%)']
-                if not growth_row.empty and 'Dec-25' in growth_row.columns:
-                    val = growth_row['Dec-25'].values[0]
-                    cleaned_val = clean_numeric_value(val)
-                    if cleaned_val is not None:
-                        growth_values.append(cleaned_val)
-            
-            # Sort accounts by revenue (biggest to smallest)
-            sorted_accounts = sorted(accounts, key=lambda x: account_revenues.get(x, 0), reverse=True)
-            
-            ad_financial_data[ad_name] = {
-                'accounts': sorted_accounts,
-                'num_accounts': len(sorted_accounts),
-                'revenue_total': revenue_total,
-                'csat_avg': sum(csat_values) / len(csat_values) if csat_values else None,
-                'headcount_total': headcount_total,
-                'red_sites_count': red_sites_count,
-                'growth_avg': sum(growth_values) / len(growth_values) if growth_values else None
-            }
-            
-        except Exception as e:
-            print(f"Error processing {csv_file}: {e}")
-            continue
-    
-    return ad_financial_data
-
-def load_tier_data():
-    """Load tier assignments, vertical, and scorecard data from verticals.csv"""
-    try:
-        df = pd.read_csv("data/verticals.csv")
-        tier_data = {}
-        vertical_data = {}
-        scorecard_data = {}
-        for _, row in df.iterrows():
-            ad_name = str(row.get("Account Director", "")).strip()
-            tier = str(row.get("Tier", "")).strip()
-            vertical = str(row.get("Vertical", "")).strip()
-            scorecard = row.get("Scorecard", "")
-            if ad_name:
-                # Normalize the name
-                normalized_name = normalize_ad_name(ad_name)
-                if tier:
-                    tier_data[normalized_name] = tier
-                if vertical:
-                    vertical_data[normalized_name] = vertical
-                # Add scorecard if available
-                if pd.notna(scorecard) and scorecard != "":
-                    try:
-                        scorecard_data[normalized_name] = float(scorecard)
-                    except:
-                        pass
-        return tier_data, vertical_data, scorecard_data
-    except Exception as e:
-        print(f"Warning: Could not load tier data: {e}")
-        return {}, {}, {}
-
-def apply_manual_mappings(financial_data):
-    """Apply manual mappings for ADs with special cases"""
-    
-    # Rade Kukobat → Use Eli Lilly data
-    if "Eli Lilly" in financial_data:
-        financial_data["Rade Kukobat"] = financial_data["Eli Lilly"].copy()
-        print("  - Mapped Rade Kukobat to Eli Lilly")
-    
-    # David Pergola & Justin Homa → Calculate from Merck headcount ratio
-    # Brian Davis Merck Dec-25: Revenue=$4,077K, Headcount=345
-    # Revenue per employee = $11.82K
-    merck_rev_per_employee = 4077 / 345  # $11.82K per employee
-    
-    # David Pergola: 135 headcount (Merck Sodexo)
-    david_headcount = 135
-    david_revenue = david_headcount * merck_rev_per_employee
-    financial_data["David Pergola"] = {
-        'accounts': ['Merck Sodexo'],
-        'num_accounts': 1,
-        'revenue_total': david_revenue,
-        'csat_avg': 4.75,  # Use Brian's Merck CSAT
-        'headcount_total': david_headcount,
-        'red_sites_count': 0,  # Estimated
-        'growth_avg': 8.9,  # Use Brian's Merck growth
-        'calculated_revenue': True  # Flag for asterisk
-    }
-    print(f"  - Mapped David Pergola: {david_headcount} HC = ${david_revenue:.0f}K revenue (Merck Sodexo)")
-    
-    # Justin Homa: Keep Organon data + ADD Merck CBRE calculation
-    justin_headcount_merck = 155
-    justin_revenue_merck = justin_headcount_merck * merck_rev_per_employee
-    
-    if "Justin Homa" in financial_data:
-        # Add Merck CBRE to existing Organon data
-        organon_data = financial_data["Justin Homa"]
-        financial_data["Justin Homa"] = {
-            'accounts': ['Merck CBRE', 'Organon'],
-            'num_accounts': 2,
-            'revenue_total': justin_revenue_merck + organon_data.get('revenue_total', 0),
-            'csat_avg': 4.75,  # Use Merck CSAT
-            'headcount_total': justin_headcount_merck + organon_data.get('headcount_total', 0),
-            'red_sites_count': organon_data.get('red_sites_count', 0),
-            'growth_avg': 8.9,
-            'calculated_revenue': True  # Flag for asterisk
-        }
-        print(f"  - Mapped Justin Homa: Merck CBRE ({justin_headcount_merck} HC) + Organon = ${financial_data['Justin Homa']['revenue_total']:.0f}K total")
-    
-    # Headcount overrides (AD-confirmed adjustments)
-    headcount_overrides = {
-        'Jack Thornton': 79,
-    }
-    
-    for ad_name, confirmed_headcount in headcount_overrides.items():
-        if ad_name in financial_data:
-            old_headcount = financial_data[ad_name]['headcount_total']
-            financial_data[ad_name]['headcount_total'] = confirmed_headcount
-            financial_data[ad_name]['headcount_adjusted'] = True  # Flag for asterisk
-            print(f"  - Adjusted {ad_name} headcount: {old_headcount} -> {confirmed_headcount} (AD-confirmed)")
-    
-    # Account reassignments (transfer accounts between ADs)
-    
-    # Stuart Kelloff: Add Adobe (transfer from Rosalvina Quinonez)
-    # Adobe: $855K revenue, 106 HC
-    if "Stuart Kelloff" in financial_data:
-        adobe_revenue = 855
-        adobe_headcount = 106
-        stuart_data = financial_data["Stuart Kelloff"]
-        financial_data["Stuart Kelloff"] = {
-            'accounts': stuart_data.get('accounts', []) + ['Adobe Systems'],
-            'num_accounts': stuart_data.get('num_accounts', 0) + 1,
-            'revenue_total': stuart_data.get('revenue_total', 0) + adobe_revenue,
-            'csat_avg': stuart_data.get('csat_avg', 4.5),
-            'headcount_total': stuart_data.get('headcount_total', 0) + adobe_headcount,
-            'red_sites_count': stuart_data.get('red_sites_count', 0),
-            'growth_avg': stuart_data.get('growth_avg', 0)
-        }
-        print(f"  - Added Adobe Systems to Stuart Kelloff: +${adobe_revenue}K, +{adobe_headcount} HC")
-    
-    # Grant Frazier: Assign Meta (from Luna Duarte)
-    # Meta: $4,176K revenue, 437 HC
-    financial_data["Grant Frazier"] = {
-        'accounts': ['Meta'],
-        'num_accounts': 1,
-        'revenue_total': 4176,
-        'csat_avg': 4.74,
-        'headcount_total': 437,
-        'red_sites_count': 1,
-        'growth_avg': 30.9
-    }
-    print(f"  - Assigned Meta to Grant Frazier: $4,176K, 437 HC")
-    
-    # Taylor Wattenberg: Assign Microsoft (from TBH)
-    # Microsoft: $5,376K revenue, 600 HC
-    financial_data["Taylor Wattenberg"] = {
-        'accounts': ['Microsoft'],
-        'num_accounts': 1,
-        'revenue_total': 5376,
-        'csat_avg': 4.66,
-        'headcount_total': 600,
-        'red_sites_count': 4,
-        'growth_avg': 28.1
-    }
-    print(f"  - Assigned Microsoft to Taylor Wattenberg: $5,376K, 600 HC")
-    
-    # Rade Kukobat: Assign Eli Lilly LCC/LRL
-    # Calculate revenue based on Chad Boulton's Eli Lilly account ratio
-    # Chad: $2,075K revenue / 399 HC = $5.20K per HC
-    # Rade: 83 HC × $5.20K = $431.5K
-    eli_lilly_rev_per_hc = 2075 / 399  # Chad's Eli Lilly ratio
-    rade_headcount = 83
-    rade_revenue = eli_lilly_rev_per_hc * rade_headcount
-    
-    financial_data["Rade Kukobat"] = {
-        'accounts': ['Eli Lilly LCC/LRL'],
-        'num_accounts': 1,
-        'revenue_total': rade_revenue,
-        'csat_avg': 2.25,
-        'headcount_total': rade_headcount,
-        'red_sites_count': 1,
-        'growth_avg': 55.4,
-        'headcount_adjusted': True,  # Flag for asterisk - AD confirmed
-        'calculated_revenue': True   # Flag for asterisk - calculated from ratio
-    }
-    print(f"  - Assigned Eli Lilly LCC/LRL to Rade Kukobat: ${rade_revenue:.0f}K, {rade_headcount} HC (calculated from Chad's ratio)")
-    
-    # Isaac Calderon: Use actual audited headcount (285 instead of 340)
-    if "Isaac Calderon" in financial_data:
-        isaac_data = financial_data["Isaac Calderon"]
-        # Keep all existing data but update headcount to audited value
-        financial_data["Isaac Calderon"]['headcount_total'] = 285
-        print(f"  - Corrected Isaac Calderon headcount to 285 (from audit)")
-    
-    # Giselle Langelier: Add accounts (Medtronic, Capsida, Fuji Film)
-    financial_data["Giselle Langelier"] = {
-        'accounts': ['Medtronic', 'Capsida Biotherapeutics', 'Fuji Film'],
-        'num_accounts': 3,
-        'revenue_total': 672,
-        'csat_avg': 4.59,  # Average from the three accounts
-        'headcount_total': 98,
-        'red_sites_count': 2,
-        'growth_avg': 5.0
-    }
-    print(f"  - Assigned accounts to Giselle Langelier: $672K, 98 HC")
-    
-    # Peggy Shum: Add accounts (Chubb Insurance, Deutsche Bank)
-    financial_data["Peggy Shum"] = {
-        'accounts': ['Chubb Insurance', 'Deutsche Bank'],
-        'num_accounts': 2,
-        'revenue_total': 547,
-        'csat_avg': 4.50,  # Estimated
-        'headcount_total': 67,
-        'red_sites_count': 0,
-        'growth_avg': 0
-    }
-    print(f"  - Assigned accounts to Peggy Shum: $547K, 67 HC")
-    
-    # Gregory DeMedio: Add Abbott Labs (from LIFE SCIENCE.csv)
-    financial_data["Gregory DeMedio"] = {
-        'accounts': ['Abbott Labs'],
-        'num_accounts': 1,
-        'revenue_total': 1713,
-        'csat_avg': 4.49,
-        'headcount_total': 278,
-        'red_sites_count': 10,
-        'growth_avg': 0.8
-    }
-    print(f"  - Assigned Abbott Labs to Gregory DeMedio: $1,713K, 278 HC")
-    
-    # Keith Deuber: Assign Amazon (same as Dustin Smith)
-    # Amazon: $3,140K revenue, 733 HC (from dustin-smith.csv Dec-25 data)
-    financial_data["Keith Deuber"] = {
-        'accounts': ['Amazon'],
-        'num_accounts': 1,
-        'revenue_total': 3140,
-        'csat_avg': 4.76,
-        'headcount_total': 733,
-        'red_sites_count': 16,
-        'growth_avg': -38.7
-    }
-    print(f"  - Assigned Amazon to Keith Deuber: $3,140K, 733 HC")
-    
-    return financial_data
-
-def get_score_columns(df):
-    """Identify score columns from CSV"""
-    score_cols = []
-    section_keywords = [
-        ["Key Projects", "Initiatives"],
-        ["Value Adds", "Cost Avoidance"],
-        ["Cost Savings", "Savings Delivered"],
-        ["Innovation", "Continuous Improvement"],
-        ["Issues", "Challenges", "Accountability"],
-        ["2026", "Strategy", "Path Forward"],
-        ["Personal Goals", "Goals"],
-        ["Executive Presence", "Communication"]
-    ]
-    
-    for col in df.columns:
-        if "Comment" in col or "comment" in col:
-            continue
-        for keywords in section_keywords:
-            if any(keyword in col for keyword in keywords):
-                score_cols.append(col)
-                break
-    
-    return score_cols
-
-def calculate_rankings(df):
-    """Calculate average scores for each AD in each section"""
-    rankings = {}
-    score_cols = get_score_columns(df)
-    
-    for score_col in score_cols:
-        ad_scores = defaultdict(list)
-        
-        for _, row in df.iterrows():
-            ad_name = str(row.get("Account Director Name", "")).strip()
-            if not ad_name or ad_name == "nan":
-                continue
-            score = row.get(score_col)
-            if pd.notna(score) and score != "":
-                try:
-                    ad_scores[ad_name].append(float(score))
-                except:
-                    pass
-        
-        section_rankings = []
-        for ad_name, scores in ad_scores.items():
-            if scores:
-                avg_score = sum(scores) / len(scores)
-                section_rankings.append({
-                    "name": ad_name,
-                    "avg_score": round(avg_score, 2),
-                    "num_reviews": len(scores)
-                })
-        
-        section_rankings.sort(key=lambda x: x["avg_score"], reverse=True)
-        rankings[score_col] = section_rankings
-    
-    return rankings
-
 def format_currency(value):
     """Format currency with proper scale (millions for >= 1000K)"""
     if value >= 1000:
@@ -490,7 +61,7 @@ def format_currency(value):
     else:
         return "N/A"
 
-def generate_enhanced_html(rankings, df, financial_data, tier_data, scorecard_data):
+def generate_enhanced_html(snapshot):
     """Generate enhanced HTML with tier-based rankings"""
     
     html = """<!DOCTYPE html>
@@ -1152,40 +723,21 @@ def generate_enhanced_html(rankings, df, financial_data, tier_data, scorecard_da
     <!-- OVERALL PERFORMANCE RANKINGS -->
 """
     
-    # Calculate overall rankings
-    overall_scores = defaultdict(lambda: {"total": 0, "count": 0})
-    for section_name, section_data in rankings.items():
-        for ad_data in section_data:
-            overall_scores[ad_data['name']]["total"] += ad_data['avg_score']
-            overall_scores[ad_data['name']]["count"] += 1
-    
+    # Overall rankings (snapshot order: highest total first)
     overall_rankings = []
-    for ad_name, data in overall_scores.items():
-        avg = data["total"] / data["count"] if data["count"] > 0 else 0
-        total_out_of_40 = data["total"]
-        
-        # Get financial data
-        fin_data = financial_data.get(ad_name, {})
-        
-        # Get tier data
-        tier = tier_data.get(ad_name, "Unassigned")
-        
-        # Get vertical data
-        vertical = vertical_data.get(ad_name, "Unassigned")
-        
-        # Calculate letter grade
-        letter_grade = calculate_letter_grade(total_out_of_40)
+    for ad_name, ad in snapshot.ads.items():
+        fin_data = ad['financials']
         
         # Get scorecard data (use from verticals.csv if available, otherwise use csat_avg)
-        scorecard = scorecard_data.get(ad_name, fin_data.get('csat_avg'))
+        scorecard = ad['scorecard'] if ad['scorecard'] is not None else fin_data.get('csat_avg')
         
         overall_rankings.append({
             "name": ad_name,
-            "avg": round(avg, 2),
-            "total": round(total_out_of_40, 1),
-            "tier": tier,
-            "vertical": vertical,
-            "letter_grade": letter_grade,
+            "avg": ad['mean_score'],
+            "total": round(ad['total_score'], 1),
+            "tier": ad['tier'] or "Unassigned",
+            "vertical": ad['vertical'] or "Unassigned",
+            "letter_grade": calculate_letter_grade(ad['total_score']),
             "accounts": fin_data.get('accounts', []),
             "num_accounts": fin_data.get('num_accounts', 0),
             "revenue": fin_data.get('revenue_total', 0),
@@ -1196,8 +748,6 @@ def generate_enhanced_html(rankings, df, financial_data, tier_data, scorecard_da
             "headcount_adjusted": fin_data.get('headcount_adjusted', False)
         })
     
-    overall_rankings.sort(key=lambda x: x["total"], reverse=True)
-    
     # ==================== CREATE ALL GROUPINGS ====================
     # Revenue tier groups
     revenue_tier_groups = {
@@ -1932,33 +1482,27 @@ def generate_enhanced_html(rankings, df, financial_data, tier_data, scorecard_da
 
 # Main execution
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate the enhanced EOY report.")
+    add_profile_arguments(parser)
+    profiler = Profiler.from_args(parser.parse_args(), "generate_enhanced_report")
+
     print("Generating Enhanced EOY Report with Tier-Based Rankings...")
     
-    print("Loading performance review data...")
-    df = load_performance_data()
-    
-    print("Loading financial data from AD CSVs...")
-    financial_data = load_financial_data()
-    print(f"  - Loaded financial data for {len(financial_data)} ADs")
-    
-    print("Applying manual mappings...")
-    financial_data = apply_manual_mappings(financial_data)
-    
-    print("Loading tier data, vertical, and scorecard data from verticals.csv...")
-    tier_data, vertical_data, scorecard_data = load_tier_data()
-    print(f"  - Loaded tier data for {len(tier_data)} ADs")
-    print(f"  - Loaded vertical data for {len(vertical_data)} ADs")
-    print(f"  - Loaded scorecard data for {len(scorecard_data)} ADs")
-    
-    print("Calculating performance rankings...")
-    rankings = calculate_rankings(df)
+    print("Loading analytics snapshot...")
+    with profiler.stage("load_snapshot"):
+        snapshot = load_snapshot()
+    print(f"  - {len(snapshot.ads)} ranked ADs, financial data for "
+          f"{sum(1 for ad in snapshot.ads.values() if ad['financials'])}, tiers for "
+          f"{sum(1 for ad in snapshot.ads.values() if ad['tier'])}")
     
     print("Generating enhanced HTML report with performance grades...")
-    html_content = generate_enhanced_html(rankings, df, financial_data, tier_data, scorecard_data)
+    with profiler.stage("render"):
+        html_content = generate_enhanced_html(snapshot)
     
     print("Writing report file...")
-    with open("EOY_Report_2025_Enhanced.html", "w", encoding="utf-8") as f:
-        f.write(html_content)
+    with profiler.stage("write"):
+        with open("EOY_Report_2025_Enhanced.html", "w", encoding="utf-8") as f:
+            f.write(html_content)
     
     print("\nSUCCESS! Enhanced report generated: EOY_Report_2025_Enhanced.html")
     print("  - Overall Performance Rankings")
@@ -1969,3 +1513,4 @@ if __name__ == "__main__":
     print("  - Performance scores + Financial KPIs integrated")
     print("\nTo convert to PDF, run:")
     print("  python convert_to_pdf.py")
+    profiler.finish()
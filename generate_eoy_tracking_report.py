@@ -1,7 +1,9 @@
-import csv
 from collections import defaultdict
 from datetime import datetime
 
+from analytics_snapshot import load_snapshot
+from staff_dimensions import canonical_ad_name
+
 # Review time data
 review_schedule = {
     'Week 1 (Jan 6-10)': {
@@ -65,47 +67,10 @@ name_normalize = {
     'Brian Davis Redo': 'Brian Davis'       # Consolidate redo
 }
 
-# Read verticals data
-verticals_data = {}
-with open('data/verticals.csv', 'r', encoding='utf-8') as f:
-    reader = csv.DictReader(f)
-    for row in reader:
-        ad_name = row['Account Director'].strip()
-        verticals_data[ad_name] = {
-            'vertical': row['Vertical'].strip(),
-            'tier': row['Tier'].strip()
-        }
-
-# Read performance reviews to get accounts and reviewers
-with open('data/performance_reviews.csv', 'r', encoding='utf-8') as f:
-    reader = csv.DictReader(f)
-    reviews_data = list(reader)
-
-# Build AD info
-ad_info = {}
-ad_reviewers = defaultdict(set)
-ad_accounts = defaultdict(set)
-
-for row in reviews_data:
-    ad = row['Account Director Name'].strip()
-    
-    # Normalize AD names
-    ad_normalized = ad
-    for old, new in [('Ayesha Nasi', 'Ayesha Nasir'), ('Dave Pergola', 'David Pergola'),
-                     ('Gisell Langelier', 'Giselle Langelier'), ('Greg DeMedio', 'Gregory DeMedio'),
-                     ('Greg Demedio', 'Gregory DeMedio'), ('Nike Trenkamp', 'Nick Trenkamp'),
-                     ('Brian Davis / Justin Homa', 'Brian Davis'), ("Logan Newman's", 'Logan Newman')]:
-        if ad == old:
-            ad_normalized = new
-            break
-    
-    reviewer = row['Name'].strip() if row['Name'].strip() else row.get('Enter Your Name', '').strip()
-    account = row['Account Name'].strip()
-    
-    if reviewer:
-        ad_reviewers[ad_normalized].add(reviewer)
-    if account:
-        ad_accounts[ad_normalized].add(account)
+# Verticals and tiers from the analytics snapshot, keyed by canonical AD name
+snapshot = load_snapshot()
+verticals_data = {name: {'vertical': dims['vertical'], 'tier': dims['tier']}
+                  for name, dims in snapshot.staff.items()}
 
 # Calculate statistics
 completed_reviews = []
@@ -141,7 +106,7 @@ vertical_stats = defaultdict(lambda: {'count': 0, 'time': 0})
 tier_stats = defaultdict(lambda: {'count': 0, 'time': 0})
 
 for review in completed_reviews + planned_reviews:
-    ad_name = review['name']
+    ad_name = canonical_ad_name(review['name'])
     if ad_name in verticals_data:
         vert = verticals_data[ad_name]['vertical']
         tier = verticals_data[ad_name]['tier']
@@ -689,8 +654,9 @@ for week in sorted(planned_by_week.keys()):
     
     for review in week_reviews:
         ad_name = review['name']
-        vertical = verticals_data.get(ad_name, {}).get('vertical', 'TBD')
-        tier = verticals_data.get(ad_name, {}).get('tier', 'TBD')
+        dims = verticals_data.get(canonical_ad_name(ad_name), {})
+        vertical = dims.get('vertical', 'TBD')
+        tier = dims.get('tier', 'TBD')
         
         html += f"""
                         <tr>
@@ -2,17 +2,12 @@
 Generate Account Director Highlights & Development Report
 Includes: Best Practices, Key Achievements, and Follow-Up Items
 """
-import json
+from analytics_snapshot import load_snapshot
 
 def load_data():
-    """Load best practices and follow-up items"""
-    with open("data/best-practices.json", "r", encoding="utf-8") as f:
-        best_practices = json.load(f)
-    
-    with open("data/follow-up-questions.json", "r", encoding="utf-8") as f:
-        follow_ups = json.load(f)
-    
-    return best_practices, follow_ups
+    """Best practices and follow-up items from the analytics snapshot (canonical AD names)"""
+    snapshot = load_snapshot()
+    return snapshot.best_practices, snapshot.follow_ups
 
 def generate_html(best_practices, follow_ups):
     """Generate the highlights report HTML"""
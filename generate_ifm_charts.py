@@ -1,125 +1,193 @@
 #!/usr/bin/env python3
 """
 Generate per-IFM charts (HTML + PDF) with Account and Account Owner.
-Creates a separate chart and PDF for each IFM.
+Creates a separate chart and PDF for each IFM and month.
+
+Each "Month End Ranking - <Month>.csv" in data/ is read once and split by IFM in memory
+(split_month_end_by_ifm.read_month_end_by_ifm). All PDFs are then printed from a single
+Chromium, several pages at a time. --combined also writes one PDF per month with a
+bookmark per IFM (Playwright >= 1.42 for the PDF outline).
 """
 
-import csv
+import argparse
+import asyncio
+import importlib.util
 from html import escape as html_escape
 from pathlib import Path
 
-INPUT_DIR = Path("data/month_end_by_ifm")
+from split_month_end_by_ifm import read_month_end_by_ifm
+
+# PDFs need Playwright; without it only the HTML charts are written
+HAS_PLAYWRIGHT = importlib.util.find_spec("playwright") is not None
+
+DATA_DIR = Path("data")
+MONTH_END_PREFIX = "Month End Ranking - "
 OUTPUT_DIR = Path("data/ifm_charts")
 PDF_DIR = Path("data/ifm_charts/pdf")
 
+DEFAULT_CONCURRENCY = 4
+PDF_MARGIN = {"top": "0.5in", "right": "0.5in", "bottom": "0.5in", "left": "0.5in"}
+
+CHART_STYLE = """
+  body { font-family: system-ui; margin: 2rem; background: #f8f8f8; }
+  h1 { color: #2A4B8F; }
+  .subtitle { color: #646464; margin-bottom: 1.5rem; }
+  table { border-collapse: collapse; background: white; box-shadow: 0 2px 8px rgba(0,0,0,.08); }
+  th, td { padding: 10px 16px; text-align: left; border-bottom: 1px solid #e0e0e0; }
+  th { background: #2A4B8F; color: white; font-weight: 600; }
+  tr:hover { background: #f5f5f5; }
+  section + section { break-before: page; }
+  @media print { body { background: white; margin: 0.5in; } table { box-shadow: none; } }
+"""
 
-def generate_html_chart(ifm: str, rows: list[dict]) -> Path:
-    """Generate HTML chart for one IFM."""
-    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-    html_path = OUTPUT_DIR / f"{ifm}_January_2026.html"
 
+def month_end_files(month: str | None = None) -> list[tuple[str, Path]]:
+    """(month label, path) for every Month End Ranking CSV, or just the one for month."""
+    files = []
+    for csv_path in sorted(DATA_DIR.glob(f"{MONTH_END_PREFIX}*.csv")):
+        label = csv_path.stem[len(MONTH_END_PREFIX):].strip()
+        if month is None or label == month:
+            files.append((label, csv_path))
+    return files
+
+
+def chart_rows(records: list[dict]) -> list[dict]:
+    """Account/owner rows for one IFM, sorted by account."""
+    rows = [
+        {"Account": r["account"].strip(), "Account Owner": r["account_owner"].strip() or "—"}
+        for r in records if r["account"].strip()
+    ]
+    rows.sort(key=lambda r: r["Account"].upper())
+    return rows
+
+
+def render_chart_section(ifm: str, month: str, rows: list[dict]) -> str:
     html_rows = "".join(
         f'<tr><td>{html_escape(r["Account"])}</td><td>{html_escape(r["Account Owner"])}</td></tr>'
         for r in rows
     )
-
-    html = f"""<!DOCTYPE html>
-<html>
-<head><meta charset="utf-8"><title>{html_escape(ifm)} - Accounts & Owners</title>
-<style>
-  body {{ font-family: system-ui; margin: 2rem; background: #f8f8f8; }}
-  h1 {{ color: #2A4B8F; }}
-  .subtitle {{ color: #646464; margin-bottom: 1.5rem; }}
-  table {{ border-collapse: collapse; background: white; box-shadow: 0 2px 8px rgba(0,0,0,.08); }}
-  th, td {{ padding: 10px 16px; text-align: left; border-bottom: 1px solid #e0e0e0; }}
-  th {{ background: #2A4B8F; color: white; font-weight: 600; }}
-  tr:hover {{ background: #f5f5f5; }}
-  @media print {{ body {{ background: white; margin: 0.5in; }} table {{ box-shadow: none; }} }}
-</style>
-</head>
-<body>
+    return f"""<section>
 <h1>{html_escape(ifm)} — Accounts & Account Owners</h1>
-<p class="subtitle">January 2026 • {len(rows)} accounts</p>
+<p class="subtitle">{html_escape(month)} • {len(rows)} accounts</p>
 <table>
 <thead><tr><th>Account</th><th>Account Owner</th></tr></thead>
 <tbody>{html_rows}</tbody>
 </table>
+</section>"""
+
+
+def render_document(title: str, body: str) -> str:
+    return f"""<!DOCTYPE html>
+<html>
+<head><meta charset="utf-8"><title>{html_escape(title)}</title>
+<style>{CHART_STYLE}</style>
+</head>
+<body>
+{body}
 </body>
 </html>"""
+
+
+def generate_html_chart(ifm: str, month: str, rows: list[dict]) -> Path:
+    """Generate HTML chart for one IFM."""
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    html_path = OUTPUT_DIR / f"{ifm}_{month.replace(' ', '_')}.html"
+    html = render_document(f"{ifm} - Accounts & Owners", render_chart_section(ifm, month, rows))
     html_path.write_text(html, encoding="utf-8")
     return html_path
 
 
-def convert_to_pdf(html_path: Path, pdf_path: Path) -> bool:
-    """Convert HTML to PDF. Returns True if successful."""
-    try:
-        from playwright.sync_api import sync_playwright
-    except ImportError:
-        return False
+def generate_combined_chart(month: str, charts: list[tuple[str, list[dict]]]) -> Path:
+    """One HTML with every IFM on its own page; each IFM heading becomes a PDF bookmark."""
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    html_path = OUTPUT_DIR / f"All_IFMs_{month.replace(' ', '_')}.html"
+    body = "\n".join(render_chart_section(ifm, month, rows) for ifm, rows in charts)
+    html_path.write_text(render_document(f"IFM Accounts & Owners - {month}", body), encoding="utf-8")
+    return html_path
+
 
+async def _print_pdfs(jobs: list[tuple[Path, Path, bool]], concurrency: int) -> list[bool]:
+    from playwright.async_api import async_playwright
+
+    async with async_playwright() as p:
+        browser = await p.chromium.launch()
+        context = await browser.new_context()
+        slots = asyncio.Semaphore(max(1, concurrency))
+
+        async def print_one(html_path: Path, pdf_path: Path, outline: bool) -> bool:
+            async with slots:
+                page = await context.new_page()
+                try:
+                    await page.goto(html_path.resolve().as_uri(), wait_until="load")
+                    options = {"outline": True} if outline else {}
+                    await page.pdf(path=str(pdf_path), format="Letter", print_background=True,
+                                   margin=PDF_MARGIN, **options)
+                    return True
+                except Exception as e:
+                    print(f"  {html_path.name} -> [error] {e}")
+                    return False
+                finally:
+                    await page.close()
+
+        results = await asyncio.gather(*(print_one(*job) for job in jobs))
+        await browser.close()
+    return list(results)
+
+
+def convert_to_pdf(jobs: list[tuple[Path, Path, bool]], concurrency: int = DEFAULT_CONCURRENCY) -> list[bool]:
+    """Print (html_path, pdf_path, outline) jobs in one browser session. All False without Playwright."""
+    if not HAS_PLAYWRIGHT:
+        return [False] * len(jobs)
+    PDF_DIR.mkdir(parents=True, exist_ok=True)
     try:
-        with sync_playwright() as p:
-            browser = p.chromium.launch()
-            page = browser.new_page()
-            html_file = html_path.resolve()
-            page.goto(f"file:///{html_file.as_posix()}")
-            page.wait_for_load_state("networkidle")
-            PDF_DIR.mkdir(parents=True, exist_ok=True)
-            page.pdf(
-                path=str(pdf_path),
-                format="Letter",
-                print_background=True,
-                margin={"top": "0.5in", "right": "0.5in", "bottom": "0.5in", "left": "0.5in"},
-            )
-            browser.close()
-        return True
-    except Exception:
-        return False
+        return asyncio.run(_print_pdfs(jobs, concurrency))
+    except Exception as e:  # e.g. Chromium not installed
+        print(f"  [PDF] Browser unavailable: {e}")
+        return [False] * len(jobs)
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Per-IFM account/owner charts (HTML + PDF) from the Month End Ranking.")
+    parser.add_argument("--month", help='Only this month, e.g. "January 2026" (default: every Month End Ranking file)')
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY,
+                        help=f"Pages printing PDFs at once (default {DEFAULT_CONCURRENCY})")
+    parser.add_argument("--combined", action="store_true",
+                        help="Also write one PDF per month with a bookmark for each IFM")
+    parser.add_argument("--no-pdf", action="store_true", help="HTML charts only")
+    args = parser.parse_args()
+
     print("=" * 60)
     print("IFM Charts & PDFs - Account + Account Owner")
     print("=" * 60)
 
-    generated = []
-    for csv_path in sorted(INPUT_DIR.glob("*_January_2026.csv")):
-        ifm = csv_path.stem.replace("_January_2026", "")
-        rows = []
-        with open(csv_path, encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                account = row.get("Account", "").strip()
-                owner = row.get("Account Owner", "").strip()
-                if account:
-                    rows.append({"Account": account, "Account Owner": owner or "—"})
-
-        if not rows:
-            continue
-
-        rows.sort(key=lambda r: r["Account"].upper())
-        html_path = generate_html_chart(ifm, rows)
-        generated.append((ifm, html_path, len(rows)))
-        print(f"  {ifm}: {len(rows)} accounts -> {html_path.name}")
+    generated = []  # (name, html_path, pdf_path, outline)
+    for month, csv_path in month_end_files(args.month):
+        _, by_ifm = read_month_end_by_ifm(csv_path)
+        charts = [(ifm, chart_rows(by_ifm[ifm])) for ifm in sorted(by_ifm)]
+        charts = [(ifm, rows) for ifm, rows in charts if rows]
+
+        print(f"\n{month}: {len(charts)} IFMs")
+        for ifm, rows in charts:
+            html_path = generate_html_chart(ifm, month, rows)
+            generated.append((ifm, html_path, PDF_DIR / f"{html_path.stem}.pdf", False))
+            print(f"  {ifm}: {len(rows)} accounts -> {html_path.name}")
+
+        if args.combined and charts:
+            html_path = generate_combined_chart(month, charts)
+            generated.append((f"All IFMs ({month})", html_path, PDF_DIR / f"{html_path.stem}.pdf", True))
+            print(f"  All IFMs -> {html_path.name}")
 
     print(f"\nCreated {len(generated)} HTML charts in {OUTPUT_DIR}/")
+    if args.no_pdf or not generated:
+        print("=" * 60)
+        return
 
     # PDF generation
-    PDF_DIR.mkdir(parents=True, exist_ok=True)
-    try:
-        from playwright.sync_api import sync_playwright
-        has_playwright = True
-    except ImportError:
-        has_playwright = False
-
-    if has_playwright:
-        print("\nGenerating PDFs...")
-        for ifm, html_path, _ in generated:
-            pdf_path = PDF_DIR / f"{ifm}_January_2026.pdf"
-            if convert_to_pdf(html_path, pdf_path):
-                print(f"  {ifm} -> {pdf_path.name}")
-            else:
-                print(f"  {ifm} -> [skipped]")
+    if HAS_PLAYWRIGHT:
+        print(f"\nGenerating PDFs ({args.concurrency} at a time)...")
+        results = convert_to_pdf([(html, pdf, outline) for _, html, pdf, outline in generated], args.concurrency)
+        for (name, _, pdf_path, _), ok in zip(generated, results):
+            print(f"  {name} -> {pdf_path.name if ok else '[skipped]'}")
         print(f"\nPDFs saved to {PDF_DIR}/")
     else:
         print("\n[PDF] Playwright not installed. HTML charts ready.")
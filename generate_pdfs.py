@@ -3,10 +3,13 @@ PDF Generator for Account Director Reports
 Uses Playwright to convert HTML reports to PDF with perfect formatting
 """
 
+import argparse
 import os
 import sys
 from pathlib import Path
 
+from instrumentation import Profiler, add_profile_arguments
+
 try:
     from playwright.sync_api import sync_playwright
 except ImportError:
@@ -54,8 +57,9 @@ def convert_html_to_pdf(html_path, pdf_path):
         browser.close()
 
 
-def main():
+def main(profiler=None):
     """Generate PDFs for all HTML reports"""
+    profiler = profiler or Profiler("generate_pdfs")
     
     print("=" * 70)
     print("PDF GENERATION - Account Director Reports")
@@ -97,7 +101,8 @@ def main():
     for html_path, pdf_path in reports:
         try:
             print(f"Converting: {html_path.name} -> {pdf_path.name}...", end=" ")
-            convert_html_to_pdf(html_path, pdf_path)
+            with profiler.stage("render_pdf"):
+                convert_html_to_pdf(html_path, pdf_path)
             print("[OK]")
             success_count += 1
         except Exception as e:
@@ -110,5 +115,9 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Convert the HTML reports to PDF.")
+    add_profile_arguments(parser)
+    profiler = Profiler.from_args(parser.parse_args(), "generate_pdfs")
+    main(profiler)
+    profiler.finish()
 
@@ -1,137 +1,168 @@
 """
 Generate PNG images from the enhanced report for PowerPoint presentations.
 Automatically splits long rankings into multiple slides.
+
+Every slide is clipped to its report section and captured on one of several pages of a
+single browser, concurrently. Pages wait on the unlocked report and loaded fonts rather
+than fixed sleeps, so the same report always produces the same images.
 """
 
-import os
-from pathlib import Path
-from playwright.sync_api import sync_playwright
+import argparse
+import asyncio
+import re
 import time
+from pathlib import Path
+
+REPORT_PATH = Path('EOY_Report_2025_Enhanced.html')
+OUTPUT_DIR = Path('ranking_images')
+REPORT_PASSWORD = 'SBM2025'
+
+VIEWPORT = {'width': 1920, 'height': 1080}
+SPLIT_POINT = 18  # rows on the first slide of a ranking; the rest go on a "Continued" slide
+DEFAULT_PAGES = 4
+
+# One call per page: every section's title and table row count, in document order
+SECTIONS_JS = """
+() => Array.from(document.querySelectorAll('.section')).map(section => ({
+    title: section.querySelector('h2')?.textContent.trim() || '',
+    rows: section.querySelector('table tbody')?.querySelectorAll('tr').length || 0,
+}))
+"""
+
+# Show only rows [start, end) of one section, retitle it, and return its box in page coordinates
+APPLY_SLIDE_JS = """
+([index, start, end, heading]) => {
+    const section = document.querySelectorAll('.section')[index];
+    const rows = section.querySelectorAll('table tbody tr');
+    rows.forEach((row, idx) => { row.style.display = idx >= start && idx < end ? '' : 'none'; });
+    const h2 = section.querySelector('h2');
+    if (h2) h2.textContent = heading;
+    const box = section.getBoundingClientRect();
+    return {x: box.left + window.scrollX, y: box.top + window.scrollY, width: box.width, height: box.height};
+}
+"""
+
+
+def slugify(title):
+    return re.sub(r'[^a-z0-9]+', '_', title.lower()).strip('_')
+
+
+def plan_slides(sections, all_sections=False):
+    """
+    Split section tables into slides: (filename, section index, first row, end row, heading).
+
+    The overall rankings (first section) keep their original file names; other sections
+    are included with all_sections.
+    """
+    slides = []
+    for index, section in enumerate(sections if all_sections else sections[:1]):
+        total = section['rows']
+        if total == 0:
+            continue
+        title = section['title']
+        if index == 0:
+            parts = [('overall_rankings_top18', f'{title} (Top {SPLIT_POINT})'),
+                     ('overall_rankings_remaining', f'{title} (Continued)')]
+        else:
+            slug = slugify(title)
+            parts = [(slug if total <= SPLIT_POINT else f'{slug}_top{SPLIT_POINT}',
+                      title if total <= SPLIT_POINT else f'{title} (Top {SPLIT_POINT})'),
+                     (f'{slug}_remaining', f'{title} (Continued)')]
+        ranges = [(0, min(total, SPLIT_POINT)), (SPLIT_POINT, total)]
+        for (name, heading), (start, end) in zip(parts, ranges):
+            if end > start:
+                slides.append((f'{len(slides) + 1:02d}_{name}.png', index, start, end, heading))
+    return slides
+
+
+async def open_report_page(context, html_file):
+    """Open the report, unlock it and wait until it is laid out with its final fonts."""
+    page = await context.new_page()
+    await page.goto(html_file.as_uri(), wait_until='load')
+    await page.fill('#passwordInput', REPORT_PASSWORD)
+    await page.click('.password-btn')
+    await page.wait_for_selector('#reportContent.unlocked', state='visible')
+    await page.evaluate("document.querySelector('.landing-page')?.remove()")
+    await page.evaluate('document.fonts.ready.then(() => true)')
+    return page
+
+
+async def capture_slide(pages, slide, output_dir):
+    filename, index, start, end, heading = slide
+    page = await pages.get()
+    try:
+        clip = await page.evaluate(APPLY_SLIDE_JS, [index, start, end, heading])
+        await page.screenshot(path=str(output_dir / filename), clip=clip, full_page=True,
+                              animations='disabled', caret='hide')
+    finally:
+        pages.put_nowait(page)
+    print(f"  OK Saved: {filename} ({heading}, rows {start + 1}-{end})")
+
+
+async def capture_all(html_file, output_dir, page_count, all_sections):
+    from playwright.async_api import async_playwright
+
+    async with async_playwright() as p:
+        print("Launching browser...")
+        browser = await p.chromium.launch()
+        context = await browser.new_context(viewport=VIEWPORT, device_scale_factor=1)
+
+        print("Bypassing password protection...")
+        first = await open_report_page(context, html_file)
+        sections = await first.evaluate(SECTIONS_JS)
+        slides = plan_slides(sections, all_sections)
+        print(f"  Found {sections[0]['rows'] if sections else 0} ADs in the overall rankings")
+
+        page_count = max(1, min(page_count, len(slides)))
+        others = await asyncio.gather(*(open_report_page(context, html_file) for _ in range(page_count - 1)))
+        pages = asyncio.Queue()
+        for page in [first, *others]:
+            pages.put_nowait(page)
+
+        print(f"\nCapturing {len(slides)} slide(s) on {page_count} page(s)...")
+        await asyncio.gather(*(capture_slide(pages, slide, output_dir) for slide in slides))
+        await browser.close()
 
-def generate_ranking_images():
+
+def generate_ranking_images(page_count=DEFAULT_PAGES, all_sections=False):
     """Generate PNG images of ranking sections from the HTML report"""
-    
+
     # Create output directory
-    output_dir = Path('ranking_images')
+    output_dir = OUTPUT_DIR
     output_dir.mkdir(exist_ok=True)
-    
+
     print("Generating ranking images for PowerPoint...")
     print(f"Output directory: {output_dir.absolute()}\n")
-    
+
     # Check if HTML report exists
-    html_file = Path('EOY_Report_2025_Enhanced.html').absolute()
+    html_file = REPORT_PATH.absolute()
     if not html_file.exists():
         print(f"ERROR: {html_file} not found. Please generate the report first.")
         return
-    
+
     print(f"Reading report: {html_file}")
-    
-    with sync_playwright() as p:
-        print("Launching browser...")
-        browser = p.chromium.launch()
-        page = browser.new_page(viewport={'width': 1920, 'height': 1080})
-        
-        # Load the HTML file
-        page.goto(f'file:///{html_file}')
-        page.wait_for_load_state('networkidle')
-        
-        print("Bypassing password protection...")
-        # Enter the password automatically
-        page.fill('#passwordInput', 'SBM2025')
-        page.click('.password-btn')
-        time.sleep(1)
-        
-        # Remove landing page
-        page.evaluate("""
-            document.querySelector('.landing-page')?.remove();
-            console.log('Landing page removed');
-        """)
-        
-        time.sleep(1)
-        
-        print("\nCapturing Overall Rankings...")
-        
-        # Get the first table (overall rankings) and count real data rows
-        total_rows = page.evaluate("""
-            const firstTable = document.querySelector('table');
-            const tbody = firstTable?.querySelector('tbody');
-            const rows = tbody?.querySelectorAll('tr') || [];
-            rows.length;
-        """)
-        print(f"  Found {total_rows} ADs to capture")
-        
-        if total_rows > 0:
-            # Split into two parts
-            split_point = 18
-            
-            # Part 1: Top 18
-            print(f"\n1. Capturing Top 18 ADs...")
-            page.evaluate(f"""
-                const firstSection = document.querySelector('.section');
-                const table = firstSection.querySelector('table');
-                const tbody = table.querySelector('tbody');
-                const allRows = Array.from(tbody.querySelectorAll('tr'));
-                
-                // Hide rows after {split_point}
-                allRows.forEach((row, idx) => {{
-                    if (idx >= {split_point}) {{
-                        row.style.display = 'none';
-                    }}
-                }});
-                
-                // Update header
-                const h2 = firstSection.querySelector('h2');
-                if (h2) h2.textContent = 'Overall Performance Rankings (Top 18)';
-            """)
-            
-            time.sleep(1)
-            page.screenshot(path=str(output_dir / '01_overall_rankings_top18.png'), full_page=False)
-            print(f"  OK Saved: 01_overall_rankings_top18.png")
-            
-            # Part 2: Remaining ADs
-            print(f"\n2. Capturing Remaining {total_rows - split_point} ADs...")
-            page.evaluate(f"""
-                const firstSection = document.querySelector('.section');
-                const table = firstSection.querySelector('table');
-                const tbody = table.querySelector('tbody');
-                const allRows = Array.from(tbody.querySelectorAll('tr'));
-                
-                // Show all rows first
-                allRows.forEach(row => row.style.display = '');
-                
-                // Hide rows before {split_point}
-                allRows.forEach((row, idx) => {{
-                    if (idx < {split_point}) {{
-                        row.style.display = 'none';
-                    }}
-                }});
-                
-                // Update header
-                const h2 = firstSection.querySelector('h2');
-                if (h2) h2.textContent = 'Overall Performance Rankings (Continued)';
-            """)
-            
-            time.sleep(1)
-            page.screenshot(path=str(output_dir / '02_overall_rankings_remaining.png'), full_page=False)
-            print(f"  OK Saved: 02_overall_rankings_remaining.png")
-        
-        print("\n3. All images captured successfully!")
-        
-        browser.close()
-    
-    print(f"\n[OK] Image generation complete!")
+    started = time.perf_counter()
+    asyncio.run(capture_all(html_file, output_dir, page_count, all_sections))
+
+    print(f"\n[OK] Image generation complete in {time.perf_counter() - started:.1f}s!")
     print(f"\nImages saved to: {output_dir.absolute()}")
     print("\nGenerated images:")
     for img in sorted(output_dir.glob('*.png')):
         size_kb = img.stat().st_size / 1024
         print(f"  - {img.name} ({size_kb:.1f} KB)")
-    
+
     print("\n[READY] Images ready for PowerPoint!")
     print("   Drag and drop the PNG files into your presentation.")
 
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Capture ranking slides from the enhanced EOY report.")
+    parser.add_argument('--pages', type=int, default=DEFAULT_PAGES,
+                        help=f"Browser pages capturing in parallel (default {DEFAULT_PAGES})")
+    parser.add_argument('--all-sections', action='store_true',
+                        help="Also capture the tier and vertical rankings, not just the overall rankings")
+    args = parser.parse_args()
     try:
-        generate_ranking_images()
+        generate_ranking_images(args.pages, args.all_sections)
     except ImportError:
         print("\n[ERROR] Playwright not installed")
         print("\nPlease install it with:")
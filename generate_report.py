@@ -1,117 +1,15 @@
 """
 Generate comprehensive EOY Account Director Review Report - FIXED VERSION
+Rankings and feedback come from the shared analytics snapshot (analytics_snapshot.py).
 """
-import pandas as pd
-import json
-from collections import defaultdict
+from analytics_snapshot import load_snapshot
 
-def load_data():
-    """Load all data files"""
-    df = pd.read_csv("data/performance_reviews.csv", low_memory=False)
-    
-    # Split joint reviews into individual entries
-    expanded_rows = []
-    for _, row in df.iterrows():
-        ad_name = str(row.get("Account Director Name", "")).strip()
-        if "/" in ad_name:
-            # Split joint reviews
-            names = [n.strip() for n in ad_name.split("/")]
-            for name in names:
-                new_row = row.copy()
-                new_row["Account Director Name"] = name
-                expanded_rows.append(new_row)
-        else:
-            expanded_rows.append(row)
-    
-    df = pd.DataFrame(expanded_rows)
-    
-    with open("data/follow-up-questions.json", "r", encoding="utf-8") as f:
-        follow_ups = json.load(f)
-    
-    with open("data/best-practices.json", "r", encoding="utf-8") as f:
-        best_practices = json.load(f)
-    
-    return df, follow_ups, best_practices
-
-def get_score_columns(df):
-    """Identify score columns from CSV - uses flexible matching"""
-    score_cols = []
-    
-    # Define keywords for each section (flexible matching)
-    section_keywords = [
-        ["Key Projects", "Initiatives"],
-        ["Value Adds", "Cost Avoidance"],
-        ["Cost Savings", "Savings Delivered"],
-        ["Innovation", "Continuous Improvement"],
-        ["Issues", "Challenges", "Accountability"],
-        ["2026", "Strategy", "Path Forward"],
-        ["Personal Goals", "Goals"],
-        ["Executive Presence", "Communication"]
-    ]
-    
-    for col in df.columns:
-        # Skip comment columns
-        if "Comment" in col or "comment" in col:
-            continue
-        
-        # Check if column matches any section keywords
-        for keywords in section_keywords:
-            if any(keyword in col for keyword in keywords):
-                score_cols.append(col)
-                break  # Found a match, move to next column
-    
-    return score_cols
-
-def get_comment_column(df, score_col):
-    """Find the comment column that corresponds to a score column"""
-    # Look for the column immediately before the score column
-    cols = list(df.columns)
-    score_idx = cols.index(score_col)
-    if score_idx > 0:
-        return cols[score_idx - 1]
-    return None
-
-def calculate_rankings(df):
-    """Calculate average scores for each AD in each section"""
-    rankings = {}
-    score_cols = get_score_columns(df)
-    
-    for score_col in score_cols:
-        # Extract section name
-        section_name = score_col
-        ad_scores = defaultdict(list)
-        
-        for _, row in df.iterrows():
-            ad_name = str(row.get("Account Director Name", "")).strip()
-            if not ad_name or ad_name == "nan":
-                continue
-                
-            score = row.get(score_col)
-            if pd.notna(score) and score != "":
-                try:
-                    ad_scores[ad_name].append(float(score))
-                except:
-                    pass
-        
-        # Calculate averages
-        section_rankings = []
-        for ad_name, scores in ad_scores.items():
-            if scores:
-                avg_score = sum(scores) / len(scores)
-                section_rankings.append({
-                    "name": ad_name,
-                    "avg_score": round(avg_score, 2),
-                    "num_reviews": len(scores)
-                })
-        
-        # Sort by score descending
-        section_rankings.sort(key=lambda x: x["avg_score"], reverse=True)
-        rankings[section_name] = section_rankings
-    
-    return rankings
+def format_score(score):
+    """5.0 -> '5', 4.5 -> '4.5'"""
+    return f"{score:g}"
 
 
-def generate_html(rankings, df, follow_ups, best_practices):
+def generate_html(snapshot):
     """Generate the HTML report"""
     
     html = """<!DOCTYPE html>
@@ -271,26 +169,11 @@ def generate_html(rankings, df, follow_ups, best_practices):
         </p>
 """
     
-    # Calculate overall rankings across all sections
-    overall_scores = defaultdict(lambda: {"total": 0, "count": 0})
-    for section_name, section_data in rankings.items():
-        for ad_data in section_data:
-            overall_scores[ad_data['name']]["total"] += ad_data['avg_score']
-            overall_scores[ad_data['name']]["count"] += 1
-    
-    # Calculate averages and sort
-    overall_rankings = []
-    for ad_name, data in overall_scores.items():
-        avg = data["total"] / data["count"] if data["count"] > 0 else 0
-        # Total is sum of all section averages (each section max 5, so 8 sections = max 40)
-        total_out_of_40 = data["total"]
-        overall_rankings.append({
-            "name": ad_name, 
-            "avg": round(avg, 2),
-            "total": round(total_out_of_40, 1)
-        })
-    
-    overall_rankings.sort(key=lambda x: x["total"], reverse=True)
+    # Overall ranking: total is the sum of section averages (each section max 5, so 8 sections = max 40)
+    overall_rankings = [
+        {"name": ad["name"], "avg": ad["mean_score"], "total": round(ad["total_score"], 1)}
+        for ad in snapshot.ads.values()
+    ]
     
     html += """
         <h2 style="margin-top: 15px;">Overall Performance Rankings</h2>
@@ -342,12 +225,8 @@ def generate_html(rankings, df, follow_ups, best_practices):
 """
     
     # Generate section rankings with feedback
-    score_cols = get_score_columns(df)
-    
-    for idx, score_col in enumerate(score_cols, 1):
-        section_name = score_col
-        section_data = rankings.get(section_name, [])
-        comment_col = get_comment_column(df, score_col)
+    for idx, section_name in enumerate(snapshot.sections, 1):
+        section_data = [snapshot.ads[name] for name in snapshot.section_rankings[section_name]]
         
         html += f"""
     <div class="section">
@@ -371,8 +250,8 @@ def generate_html(rankings, df, follow_ups, best_practices):
                 <tr class="{row_class}">
                     <td><strong>#{rank}</strong></td>
                     <td>{ad_data['name']}</td>
-                    <td><strong>{ad_data['avg_score']}</strong>/5.0</td>
-                    <td>{ad_data['num_reviews']}</td>
+                    <td><strong>{ad_data['scores'][section_name]}</strong>/5.0</td>
+                    <td>{ad_data['counts'][section_name]}</td>
                 </tr>
 """
         
@@ -385,42 +264,24 @@ def generate_html(rankings, df, follow_ups, best_practices):
         
         # Add detailed feedback for ALL ADs
         for ad_data in section_data:
-            ad_name = ad_data['name']
-            
-            # Get feedback
-            feedback_list = []
-            for _, row in df.iterrows():
-                if str(row.get("Account Director Name", "")).strip() == ad_name:
-                    reviewer = str(row.get("Enter Your Name", "Anonymous")).strip()
-                    score = row.get(score_col)
-                    comment = row.get(comment_col) if comment_col else None
-                    
-                    if pd.notna(comment) and str(comment).strip() and str(comment) != "nan":
-                        feedback_list.append({
-                            "reviewer": reviewer if reviewer != "nan" else "Anonymous",
-                            "score": score if pd.notna(score) else "N/A",
-                            "comment": str(comment).strip()
-                        })
+            feedback_list = ad_data['feedback'][section_name]
             
             if feedback_list:
                 html += f"""
         <div class="ad-feedback">
-            <h4>{ad_name} (Avg: {ad_data['avg_score']}/5.0)</h4>
+            <h4>{ad_data['name']} (Avg: {ad_data['scores'][section_name]}/5.0)</h4>
 """
                 for fb in feedback_list:
-                    try:
-                        score_val = int(float(fb['score'])) if fb['score'] != "N/A" else 3
-                    except:
-                        score_val = 3
+                    score_val = int(fb['score']) if fb['score'] is not None else 3
                     score_class = f"score-{score_val}"
-                    score_display = f"{fb['score']}/5" if fb['score'] != "N/A" else "N/A"
+                    score_display = f"{format_score(fb['score'])}/5" if fb['score'] is not None else "N/A"
                     
                     html += f"""
             <div class="reviewer-name">
                 {fb['reviewer']}
                 <span class="score-badge {score_class}">{score_display}</span>
             </div>
-            <p style="margin: 5px 0 10px 0;">{fb['comment']}</p>
+            <p style="margin: 5px 0 10px 0;">{fb['text']}</p>
 """
                 
                 html += """
@@ -442,18 +303,15 @@ def generate_html(rankings, df, follow_ups, best_practices):
 # Main execution
 if __name__ == "__main__":
     print("🔧 Generating FIXED EOY Report...")
-    print("📂 Loading data...")
-    df, follow_ups, best_practices = load_data()
-    
-    print("📊 Calculating rankings...")
-    rankings = calculate_rankings(df)
+    print("📂 Loading analytics snapshot...")
+    snapshot = load_snapshot()
     
-    print(f"✅ Found {len(rankings)} sections")
-    for section, data in rankings.items():
-        print(f"   • {section}: {len(data)} ADs ranked")
+    print(f"✅ Found {len(snapshot.sections)} sections")
+    for section in snapshot.sections:
+        print(f"   • {section}: {len(snapshot.section_rankings[section])} ADs ranked")
     
     print("📝 Generating HTML...")
-    html_content = generate_html(rankings, df, follow_ups, best_practices)
+    html_content = generate_html(snapshot)
     
     print("💾 Writing report file...")
     with open("EOY_Report_2025.html", "w", encoding="utf-8") as f:
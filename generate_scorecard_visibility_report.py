@@ -2,147 +2,276 @@
 Generate Consolidated Scorecard Visibility Report as PDF.
 Top 55 accounts, organized by IFM. Accounts with multiple IFMs appear under each.
 Requires: pip install reportlab
+
+Accounts, IFMs and ADs (account owners) come from the Month End Ranking in the analytics
+store (python analytics_store.py ingest); the top N are ranked by RV summed across IFMs, and
+accounts with SCR notes for the month are always included. SCR notes are kept in
+data/scorecard_visibility_notes.csv (Account, Site, Month, IFM, AD, Note), keyed by the
+month-end account name. IFM ("CBRE; Direct") and AD are the curated attribution for the site:
+a noted site is listed under its IFMs with its AD rather than the month-end placement (a
+blank IFM or AD falls back to the month end). A report for month M shows the notes for M
+and M+1 (January reviews are held in February, February reviews in March).
+
+    python generate_scorecard_visibility_report.py                  # every month in the store
+    python generate_scorecard_visibility_report.py --month 2026-01 --top 100
 """
+import argparse
+import csv
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import letter
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak
-from reportlab.lib.enums import TA_LEFT, TA_CENTER
-from datetime import datetime
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
+from reportlab.lib.enums import TA_CENTER
+from xml.sax.saxutils import escape
 
+from analytics_store import DEFAULT_DB_PATH, connect
 
-# Data: (Account, AD, IFMs, Jan notes, Feb notes)
-# Accounts repeated under each IFM per user Option B
-RAW_ENTRIES = [
-    ("Deutsche Bank – NY", "Peggy Shum", ["CBRE"], "January SCR (held Feb 2/4): In Person – Score 5", "February SCR (scheduled 3/4): In Person"),
-    ("Wells Fargo", "Colleen Doles", ["JLL"], "January SCR (held 2/6)", "February SCR: TBD (RFP cycle in progress)"),
-    ("Citi Bank – San Antonio", "Berenday Escamilla", ["C&W"], "January SCR (held 2/4): Virtual – Score 5", "February SCR (3/4): Virtual"),
-    ("USAA", "Berenday Escamilla", ["CBRE"], "January SCR (held 1/27): Virtual – Score 5", "February SCR (3/24): Virtual"),
-    ("Charles Schwab", "Tiffany Purifoy", ["Direct"], "January SCR (held 2/5)", "February SCR: TBD"),
-    ("Fidelity", "Tiffany Purifoy", ["CBRE"], "January SCR (held 2/6)", "February SCR: TBD"),
-    ("State Farm", "Tiffany Purifoy", ["CBRE"], "January SCR (held 2/6)", "February SCR: TBD"),
-    ("T. Rowe Price", "Tiffany Purifoy", ["JLL"], "January SCR (February meeting; brief due to transition)", "February SCR: TBD"),
-    ("Geico", "Corey Wallace", ["CBRE"], "January SCR (held 2/11): Score 5", "February SCR: TBD"),
-    ("Eli Lilly", "Chad Boulton", ["CBRE"], "January SCR (held 2/5–2/13): In Person – All locations scored 5", "February SCR (scheduled 3/5 + 1st week March sites): In Person"),
-    ("Medtronic", "Giselle Langelier", ["Direct"], "January SCR (held 2/4–2/10): In Person – All 5's. Carlsbad = Quarterly cadence", "February SCR (3/5–3/6): In Person"),
-    ("Bayer", "Isaac Calderon", ["Direct", "EMCOR", "JLL"], "January SCR (held 2/3–2/6): In Person – Scores 4–5. Cambridge = Quarterly", "February SCR (3/2–3/6): In Person"),
-    ("Millipore Sigma", "Isaac Calderon", ["Direct"], "January SCR (held 2/4): Virtual – 4.5", "February SCR: TBD"),
-    ("IQVIA", "Patrick Murtha", ["CBRE"], "January SCR (held 2/12): Virtual", "February SCR (3/12): Virtual"),
-    ("Biogen", "Rafaed Ortiz", ["CBRE"], "January SCR (held 2/5): Virtual – Cambridge: 5.0, Pharma: 4.75, Bio: 4.25", "February SCR: To be scheduled (Virtual; within first 5 business days)"),
-    ("Google", "Paul Rhodes", ["JLL"], "January SCR (February review): Bay: 4.75, America: 4.77", "February SCR: America 3/27 (Virtual); Bay: Monthly (In Person preferred). Bi-Annual SBR: Tentative 3/18"),
-    ("Microsoft Puget Sound", "Taylor Wattenberg", ["CBRE"], "January SCR (held 2/5): In Person – Score 5", "February SCR (3/6): In Person"),
-    ("NVIDIA", "Stuart Kelloff", ["CBRE"], "January SCR (delivered with QBR in Feb): Score 5", "February SCR (3/19): In Person"),
-    ("Lockheed Martin", "Benjamin Ehrenberg", ["Direct", "EMCOR"], "January SCR (held 1/28–2/5): In Person", "February SCR (3/3–3/4): In Person"),
-    ("Northrop Grumman", "Jennifer Segovia", ["JLL"], "January SCR (held 2/6): Phone", "February SCR (3/6 recurring): Monthly cadence"),
-    ("General Dynamics", "Jennifer Segovia", ["Direct"], "January SCR (held 2/11): In Person", "February SCR (3/6 recurring): Monthly cadence"),
-    ("GE Vernova Hitachi", "Logan Newman", ["JLL"], "January SCR (held 2/12)", "February SCR (3/5 or 3/12): In Person"),
-    ("GE Aerospace", "Logan Newman", ["Direct"], "January SCR (held 2/13)", "February SCR (3/13): Virtual"),
-    ("Amentum / GE Vernova", "Logan Newman", ["Amentum"], "January SCR (held 2/24)", "February SCR (3/10): Virtual"),
-    ("GE Healthcare", "Kimberly Wittekind", ["Direct"], "January SCR (held 2/3–2/13): In Person", "February SCR (3/3): In Person"),
-    ("Ball / Mars", "Aaron Simpson", ["CBRE"], "January SCR (held 2/9)", "February SCR (3/9): Virtual (QBR in person expected)"),
-    ("Nike", "Jack Thornton", ["CBRE", "Direct"], "January SCR (February review): In Person – Score 5", "February SCR (Before 3/10): In Person"),
-    ("Nestlé", "Kimberly Wittekind", ["Direct"], "January SCR (held 2/9–2/12): Virtual", "February SCR: Partially confirmed; some TBD"),
-    ("P&G", "Nicholas Trenkamp", ["JLL"], "January SCR (held 2/6)", "February SCR: TBD"),
-    ("Cigna", "Julie Bianchi", ["CBRE", "Direct"], "January SCR (held 2/5): Virtual – Score 4.88", "February SCR (3/5): Virtual"),
-    ("Elevance", "Julie Bianchi", ["C&W", "Direct"], "January SCR (held 2/6): Virtual – Score 4.92", "February SCR (3/6): Virtual"),
-    ("Cardinal Health", "Patrick Murtha", ["Direct", "JLL"], "January SCR (held 2/5): Virtual", "February SCR (3/5): Virtual"),
-    ("McKesson", "Patrick Murtha", ["C&W"], "January SCR: Quarterly (last held 12/8)", "February SCR: Next review first week April"),
-]
-
-def build_ifm_sections():
-    """Group entries by IFM. Each account appears under every IFM it belongs to."""
-    ifm_order = ["CBRE", "Direct", "JLL", "C&W", "Amentum", "EMCOR"]
-    sections = {ifm: [] for ifm in ifm_order}
-    for account, ad, ifms, jan, feb in RAW_ENTRIES:
-        for ifm in ifms:
-            if ifm in sections:
-                sections[ifm].append((account, ad, jan, feb))
-    return sections
-
-def create_pdf(output_path="Consolidated_Scorecard_Visibility_Report.pdf"):
-    doc = SimpleDocTemplate(
-        output_path,
-        pagesize=letter,
-        rightMargin=0.6*inch,
-        leftMargin=0.6*inch,
-        topMargin=0.6*inch,
-        bottomMargin=0.6*inch,
-    )
-    styles = getSampleStyleSheet()
-    title_style = ParagraphStyle(
+NOTES_PATH = Path("data/scorecard_visibility_notes.csv")
+OUTPUT_PATTERN = "Consolidated_Scorecard_Visibility_Report_{month}.pdf"
+DEFAULT_TOP = 55
+RANK_METRIC = "RV"
+
+# Styles are built once per process and shared by every report it renders
+_styles = getSampleStyleSheet()
+STYLES = {
+    "title": ParagraphStyle(
         name="ReportTitle",
-        parent=styles["Heading1"],
+        parent=_styles["Heading1"],
         fontSize=20,
         spaceAfter=4,
         alignment=TA_CENTER,
         textColor=colors.HexColor("#1e3a5f"),
-    )
-    subtitle_style = ParagraphStyle(
+    ),
+    "subtitle": ParagraphStyle(
         name="Subtitle",
-        parent=styles["Normal"],
+        parent=_styles["Normal"],
         fontSize=10,
         alignment=TA_CENTER,
         spaceAfter=20,
         textColor=colors.HexColor("#64748b"),
-    )
-    ifm_style = ParagraphStyle(
+    ),
+    "ifm": ParagraphStyle(
         name="IFMHeading",
-        parent=styles["Heading2"],
+        parent=_styles["Heading2"],
         fontSize=13,
         spaceBefore=22,
         spaceAfter=12,
         textColor=colors.HexColor("#1e40af"),
         borderPadding=4,
-    )
-    sub_style = ParagraphStyle(
+    ),
+    "account": ParagraphStyle(
         name="AccountName",
-        parent=styles["Normal"],
+        parent=_styles["Normal"],
         fontSize=11,
         spaceBefore=10,
         spaceAfter=3,
         fontName="Helvetica-Bold",
         textColor=colors.HexColor("#0f172a"),
-    )
-    body_style = ParagraphStyle(
+    ),
+    "body": ParagraphStyle(
         name="Body",
-        parent=styles["Normal"],
+        parent=_styles["Normal"],
         fontSize=9,
         spaceAfter=2,
         leftIndent=14,
         textColor=colors.HexColor("#334155"),
-    )
+    ),
+}
+
+
+def month_name(month):
+    """'2026-01' -> 'January'."""
+    return datetime.strptime(month, "%Y-%m").strftime("%B")
+
+
+def next_month(month):
+    year, mon = map(int, month.split("-"))
+    return f"{year + mon // 12}-{mon % 12 + 1:02d}"
+
+
+def split_ifms(value):
+    """'Direct; EMCOR' -> ['Direct', 'EMCOR']."""
+    return [ifm.strip() for ifm in (value or "").split(";") if ifm.strip()]
+
 
+def load_notes(path=NOTES_PATH):
+    """
+    {(account, month): [(site, note, ifms, ad), ...]} in file order; empty if the file is
+    missing. ifms is the curated IFM list ([] to use the month end), ad the curated AD or "".
+    """
+    notes = defaultdict(list)
+    if not Path(path).exists():
+        return notes
+    with open(path, encoding="utf-8", newline="") as f:
+        for row in csv.DictReader(f):
+            notes[(row["Account"].strip(), row["Month"].strip())].append(
+                (row.get("Site", "").strip(), row["Note"].strip(),
+                 split_ifms(row.get("IFM")), (row.get("AD") or "").strip()))
+    return notes
+
+
+def noted_sites(notes, months):
+    """{account: [(site, ifms, ad), ...]} for the notes in `months`, one entry per site."""
+    sites = {}
+    for (account, month), entries in notes.items():
+        if month not in months:
+            continue
+        for site, _, ifms, ad in entries:
+            known = sites.setdefault(account, {})
+            if site not in known or not known[site][0]:
+                known[site] = (ifms, ad)
+    return {account: [(site, ifms, ad) for site, (ifms, ad) in known.items()]
+            for account, known in sites.items()}
+
+
+def load_report_months(conn):
+    return [row[0] for row in conn.execute(
+        "SELECT DISTINCT report_month FROM month_end WHERE report_month IS NOT NULL ORDER BY report_month")]
+
+
+def build_ifm_sections(conn, month, top=DEFAULT_TOP, sites=None):
+    """
+    Top accounts by RV for one month plus the noted accounts, grouped by IFM. An account
+    appears under every IFM it belongs to; a noted site (see noted_sites) under its curated
+    IFMs (or the account's month-end IFMs if none are given) with its curated AD instead,
+    and the account's RV for that IFM (None if the month end has none).
+    Returns [(ifm, [(account, site, ad, rv), ...]), ...], largest IFM first.
+    """
+    sites = sites or {}
+    tracked = sorted(sites)
+    rows = conn.execute(
+        f"""
+        WITH top_accounts AS (
+            SELECT account FROM month_end WHERE report_month = ? AND metric = ?
+            GROUP BY account ORDER BY SUM(value) DESC LIMIT ?
+        )
+        SELECT ifm, account, account_owner, SUM(value) AS rv FROM month_end
+        WHERE report_month = ? AND metric = ?
+          AND (account IN (SELECT account FROM top_accounts) OR account IN ({",".join("?" * len(tracked))}))
+        GROUP BY ifm, account, account_owner ORDER BY rv DESC
+        """, (month, RANK_METRIC, top, month, RANK_METRIC, *tracked)).fetchall()
+    sections = defaultdict(list)
+    totals = defaultdict(float)
+    ifm_rv = defaultdict(float)
+    owners = defaultdict(list)
+    account_ifms = defaultdict(list)
+    for ifm, account, owner, rv in rows:
+        ifm_rv[(ifm, account)] += rv
+        if ifm not in account_ifms[account]:
+            account_ifms[account].append(ifm)
+        if owner and owner not in owners[(ifm, account)]:
+            owners[(ifm, account)].append(owner)
+        if account not in sites:
+            sections[ifm].append((account, "", owner, rv))
+            totals[ifm] += rv
+    for account in tracked:
+        for site, ifms, ad in sites[account]:
+            for ifm in ifms or account_ifms[account]:
+                rv = ifm_rv.get((ifm, account))
+                sections[ifm].append((account, site, ad or ", ".join(owners[(ifm, account)]), rv))
+                totals[ifm] += rv or 0.0
+    for entries in sections.values():
+        entries.sort(key=lambda entry: -(entry[3] or 0.0))
+    return [(ifm, sections[ifm]) for ifm in sorted(sections, key=lambda ifm: -totals[ifm])]
+
+
+def build_story(month, sections, notes, top):
+    months = [month, next_month(month)]
     story = []
 
     # Title block
-    story.append(Paragraph("Consolidated Scorecard Visibility Report", title_style))
+    story.append(Paragraph("Consolidated Scorecard Visibility Report", STYLES["title"]))
     story.append(Paragraph(
-        f"Top 55 Accounts &middot; January Reviews held in February &middot; February Reviews held in March",
-        subtitle_style
+        f"Top {top} Accounts + Tracked &middot; {month_name(months[0])} Reviews held in {month_name(months[1])}"
+        f" &middot; {month_name(months[1])} Reviews held in {month_name(next_month(months[1]))}",
+        STYLES["subtitle"]
     ))
     story.append(Paragraph(
         f"Report Date: {datetime.now().strftime('%B %d, %Y')}",
-        subtitle_style
+        STYLES["subtitle"]
     ))
     story.append(Spacer(1, 0.25*inch))
 
-    sections = build_ifm_sections()
-    for ifm in ["CBRE", "Direct", "JLL", "C&W", "Amentum", "EMCOR"]:
-        entries = sections.get(ifm, [])
-        if not entries:
-            continue
-        story.append(Paragraph(f"IFM: {ifm}", ifm_style))
-        for account, ad, jan, feb in entries:
-            story.append(Paragraph(f"{account}", sub_style))
-            story.append(Paragraph(f"<b>AD:</b> {ad}", body_style))
-            story.append(Paragraph(f"<b>January SCR:</b> {jan}", body_style))
-            story.append(Paragraph(f"<b>February SCR:</b> {feb}", body_style))
+    for ifm, entries in sections:
+        story.append(Paragraph(f"IFM: {escape(ifm)}", STYLES["ifm"]))
+        for account, site, ad, rv in entries:
+            story.append(Paragraph(escape(site or account), STYLES["account"]))
+            rv_text = f"{rv:,.2f}" if rv is not None else "n/a"
+            story.append(Paragraph(f"<b>AD:</b> {escape(ad or 'TBH')} &middot; <b>{RANK_METRIC}:</b> {rv_text}",
+                                   STYLES["body"]))
+            for m in months:
+                entries_for_month = [note for note_site, note, _, _ in notes.get((account, m), [])
+                                     if note_site == site]
+                if not entries_for_month:
+                    story.append(Paragraph(f"<b>{month_name(m)} SCR:</b> not recorded", STYLES["body"]))
+                for note in entries_for_month:
+                    story.append(Paragraph(escape(note), STYLES["body"]))
             story.append(Spacer(1, 4))
         story.append(Spacer(1, 6))
+    return story
+
+
+def create_pdf(month, output_path, top=DEFAULT_TOP, db_path=DEFAULT_DB_PATH, notes_path=NOTES_PATH):
+    """Render one month's report. Runs in a worker process, so it opens its own connection."""
+    notes = load_notes(notes_path)
+    sites = noted_sites(notes, (month, next_month(month)))
+    conn = connect(db_path)
+    try:
+        sections = build_ifm_sections(conn, month, top, sites)
+    finally:
+        conn.close()
+
+    doc = SimpleDocTemplate(
+        str(output_path),
+        pagesize=letter,
+        rightMargin=0.6*inch,
+        leftMargin=0.6*inch,
+        topMargin=0.6*inch,
+        bottomMargin=0.6*inch,
+    )
+    doc.build(build_story(month, sections, notes, top))
+
+    listed = {account for _, entries in sections for account, _, _, _ in entries}
+    return str(output_path), sum(len(entries) for _, entries in sections), sorted(set(sites) - listed)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Consolidated scorecard visibility report(s) from the Month End Ranking.")
+    parser.add_argument("--month", action="append", help="YYYY-MM (repeatable; default: every month in the store)")
+    parser.add_argument("--top", type=int, default=DEFAULT_TOP, help=f"Accounts ranked by {RANK_METRIC} (default {DEFAULT_TOP})")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: one per CPU)")
+    parser.add_argument("--db", default=str(DEFAULT_DB_PATH))
+    args = parser.parse_args()
+
+    try:
+        conn = connect(args.db)
+    except FileNotFoundError as e:
+        raise SystemExit(str(e))
+    months = args.month or load_report_months(conn)
+    conn.close()
+    if not months:
+        raise SystemExit("No Month End Ranking data in the store.")
+
+    started = time.perf_counter()
+    jobs = [(month, OUTPUT_PATTERN.format(month=month), args.top, args.db) for month in months]
+    if len(jobs) == 1:
+        results = [create_pdf(*jobs[0])]
+    else:
+        with ProcessPoolExecutor(max_workers=args.workers) as pool:
+            results = list(pool.map(create_pdf, *zip(*jobs)))
 
-    doc.build(story)
-    print(f"SUCCESS: PDF saved to {output_path}")
+    for output_path, count, unlisted in results:
+        print(f"SUCCESS: PDF saved to {output_path} ({count} IFM entries)")
+        if unlisted:
+            print(f"  Notes for accounts not in the month-end data: {', '.join(unlisted)}")
+    print(f"Built {len(results)} report(s) in {time.perf_counter() - started:.2f}s")
 
 if __name__ == "__main__":
-    create_pdf()
+    main()
@@ -1,12 +1,16 @@
 """
 Generate individual HTML scorecards for Account Directors.
 Includes sections from CSV reviews, best practices from transcripts, and follow-up questions.
+Per-AD scores, feedback, tiers and follow-ups come from the shared analytics snapshot
+(analytics_snapshot.py), keyed by canonical verticals.csv names.
 """
 
-import json
-import pandas as pd
+import argparse
 from datetime import datetime
 
+from analytics_snapshot import load_snapshot
+from instrumentation import Profiler, add_profile_arguments
+
 # Section names matching the CSV
 SCORING_SECTIONS = [
     "Key Projects & Initiatives",
@@ -19,169 +23,21 @@ SCORING_SECTIONS = [
     "Executive Presence & Presentation Skills"
 ]
 
-# Name normalization to match verticals.csv (canonical names) and JSON files
-NAME_NORMALIZATION = {
-    # Variants to canonical verticals.csv names
-    "David Pergola": "David Pergola",  # Keep as is in verticals
-    "Dave Pergola": "David Pergola",
-    "Pergola, David": "David Pergola",
-    "Greg DeMedio": "Gregory DeMedio",
-    "Greg Demedio": "Gregory DeMedio",
-    "Gregory Demedio": "Gregory DeMedio",
-    "Gisell Langelier": "Giselle Langelier",
-    "Nick Trenkamp": "Nicholas Trenkamp",
-    "Nike Trenkamp": "Nicholas Trenkamp",
-    "Mike Barry": "Mike Barry",  # Keep as Mike in verticals
-    "Michael Barry": "Mike Barry",
-    "Logan Newman's": "Logan Newman",
-    "Ayesha Nasi": "Ayesha Nasir",
-    "Josh Grady": "Joshua Grady",
-    # Trailing spaces and ellipses - these need to be handled dynamically
-}
-
-# JSON normalization (for follow-up-questions.json and best-practices.json which use different names)
-JSON_NAME_NORMALIZATION = {
-    "David Pergola": "Dave Pergola",
-    "Mike Barry": "Michael Barry",
-    "Joshua Grady": "Josh Grady",
-    "Jennifer Segovia": "Jen Segovia",
-}
-
-def normalize_name_to_canonical(name):
-    """Normalize AD name to canonical verticals.csv name."""
-    if not name:
-        return name
-    # Strip whitespace and common suffixes
-    cleaned = name.strip().rstrip('...').rstrip(' ').strip()
-    # Apply normalization mapping
-    return NAME_NORMALIZATION.get(cleaned, cleaned)
-
-def normalize_name_for_json(name):
-    """Normalize AD name to match JSON keys (best-practices.json and follow-up-questions.json)."""
-    canonical = normalize_name_to_canonical(name)
-    return JSON_NAME_NORMALIZATION.get(canonical, canonical)
-
-def load_review_data():
-    """Load performance review data from CSV."""
-    df = pd.read_csv("data/performance_reviews.csv", low_memory=False)
-    return df
-
-def load_best_practices():
-    """Load best practices from JSON."""
-    with open("data/best-practices.json", "r", encoding="utf-8") as f:
-        return json.load(f)
-
-def load_follow_up_questions():
-    """Load follow-up questions from JSON."""
-    with open("data/follow-up-questions.json", "r", encoding="utf-8") as f:
-        return json.load(f)
-
-def load_verticals():
-    """Load tier data from verticals.csv."""
-    try:
-        df = pd.read_csv("data/verticals.csv")
-        verticals = {}
-        for _, row in df.iterrows():
-            ad_name = str(row.get("Account Director", "")).strip()
-            tier = str(row.get("Tier", "")).strip()
-            verticals[ad_name] = tier if tier else "Unassigned"
-        return verticals
-    except Exception as e:
-        print(f"Warning: Could not load verticals.csv: {e}")
-        return {}
-
-def calculate_aggregate_scores(df, ad_name):
-    """Calculate aggregate scores for an AD across all their reviews."""
-    # Strip trailing spaces from AD name in comparison
-    ad_reviews = df[df["Account Director Name"].str.strip() == ad_name.strip()]
-    
-    # EXCLUDE joint reviews for Justin Homa (per user request)
-    # For all other ADs, include joint reviews that contain their name
-    if ad_name.strip() != "Justin Homa":
-        # e.g., "Brian Davis / Justin Homa" should be included for Brian but NOT Justin
-        joint_reviews = df[df["Account Director Name"].str.contains("/", na=False)]
-        for idx, row in joint_reviews.iterrows():
-            joint_name = str(row["Account Director Name"]).strip()
-            # Check if this AD is part of the joint review
-            if ad_name.strip() in joint_name:
-                # Add this joint review to ad_reviews
-                ad_reviews = pd.concat([ad_reviews, pd.DataFrame([row])], ignore_index=True)
-    
-    if ad_reviews.empty:
-        return None
-    
-    scores = {}
-    feedback = {}
-    
-    for idx, section in enumerate(SCORING_SECTIONS):
-        score_col = section
-        # The pattern in CSV: Comment column, then Score column
-        # Score columns are at indices 9, 11, 13, 15, 17, 19, 21, 23
-        score_col_idx = 9 + (idx * 2)
-        
-        section_scores = []
-        section_feedback = []
-        
-        for _, row in ad_reviews.iterrows():
-            try:
-                # Get score
-                if score_col_idx < len(row):
-                    score = row.iloc[score_col_idx]
-                    if pd.notna(score) and str(score).strip():
-                        try:
-                            section_scores.append(float(score))
-                        except (ValueError, TypeError):
-                            pass
-                
-                # Get feedback (one column before score)
-                feedback_col_idx = score_col_idx - 1
-                if feedback_col_idx < len(row):
-                    fb = str(row.iloc[feedback_col_idx])
-                    if fb and fb.lower() not in ['nan', 'none', '']:
-                        reviewer_name = str(row.get("Enter Your Name", "")).strip()
-                        if not reviewer_name or reviewer_name.lower() == "nan":
-                            reviewer_name = "Anonymous"
-                        section_feedback.append({
-                            "reviewer": reviewer_name,
-                            "text": fb.strip()
-                        })
-            except Exception as e:
-                print(f"Error processing row for {ad_name}, section {section}: {e}")
-                continue
-        
-        # Calculate average score (skip if no scores, don't use 0)
-        if section_scores:
-            scores[section] = round(sum(section_scores) / len(section_scores), 2)
-        else:
-            scores[section] = None  # Not scored, will display as N/A
-        
-        feedback[section] = section_feedback
-    
-    # Calculate total score - only count sections that were actually scored
-    scored_sections = [s for s in scores.values() if s is not None]
-    total_score = sum(scored_sections) if scored_sections else 0
-    max_possible = len(scored_sections) * 5  # 5 points per section
-    
-    # Extract reviewer names
-    reviewers = []
-    for _, row in ad_reviews.iterrows():
-        reviewer_name = str(row.get("Enter Your Name", "")).strip()
-        # Handle NaN, empty, or missing values
-        if not reviewer_name or reviewer_name.lower() == "nan":
-            reviewer_name = "Anonymous"
-        if reviewer_name not in reviewers:
-            reviewers.append(reviewer_name)
-    
+def scorecard_data(ad):
+    """Scorecard fields for one snapshot AD aggregate (averages are out of the sections scored)."""
+    max_possible = ad["sections_scored"] * 5  # 5 points per section
     return {
-        "ad_name": ad_name.strip(),
-        "account": ad_reviews.iloc[0].get("Account Name", "N/A"),
-        "review_count": len(ad_reviews),
-        "reviewers": reviewers,
-        "total_score": round(total_score, 2),
+        "ad_name": ad["name"],
+        "account": ad["account"],
+        "review_count": ad["review_count"],
+        "reviewers": ad["reviewers"],
+        "total_score": round(ad["total_score"], 2),
         "max_possible": max_possible,
-        "avg_score": round(total_score / max_possible, 2) if max_possible > 0 else 0,
-        "scores": scores,
-        "feedback": feedback
+        "avg_score": round(ad["total_score"] / max_possible, 2) if max_possible > 0 else 0,
+        "scores": ad["scores"],
+        # Own reviews' feedback first, then joint reviews'
+        "feedback": {section: sorted(items, key=lambda fb: fb["joint"]) for section, items in ad["feedback"].items()},
+        "tier": ad["tier"] or "Unassigned",
     }
 
 # Best practices removed from scorecards per user request
@@ -823,63 +679,44 @@ def generate_scorecard_html(ad_data, best_practices, follow_ups):
     
     return html
 
-def generate_all_scorecards():
+def generate_all_scorecards(profiler=None):
     """Generate scorecards for all Account Directors."""
-    print("Loading data...")
-    df = load_review_data()
-    follow_up_data = load_follow_up_questions()
-    verticals_data = load_verticals()
-    
-    # Normalize all AD names in the DataFrame to canonical names BEFORE processing
-    print("Normalizing AD names to match verticals.csv...")
-    df["Account Director Name"] = df["Account Director Name"].apply(
-        lambda x: normalize_name_to_canonical(x) if pd.notna(x) else x
-    )
-    
-    # Get unique canonical AD names
-    ad_names = df["Account Director Name"].unique()
-    ad_names = [name for name in ad_names if pd.notna(name) and str(name).strip() != "" and name != "Account Director Name"]
+    profiler = profiler or Profiler("generate_scorecards")
+    print("Loading analytics snapshot...")
+    with profiler.stage("load_snapshot"):
+        snapshot = load_snapshot()
     
-    # Filter out joint review names (e.g., "Brian Davis / Justin Homa")
-    # We'll add those reviews to each individual AD's report
-    ad_names = [name for name in ad_names if '/' not in str(name)]
+    print(f"Found {len(snapshot.ads)} Account Directors")
     
-    print(f"Found {len(ad_names)} Account Directors")
-    
-    for ad_name in ad_names:
+    for ad_name, ad in snapshot.ads.items():
         print(f"\nGenerating scorecard for {ad_name}...")
+        ad_data = scorecard_data(ad)
         
-        # Get aggregate data (now all reviews with variants are under the canonical name)
-        ad_data = calculate_aggregate_scores(df, ad_name)
-        if not ad_data:
-            print(f"  No review data found for {ad_name}")
-            continue
-        
-        # Normalize name for JSON lookups (use different mapping for JSON files)
-        json_name = normalize_name_for_json(ad_name)
-        
-        # Add tier data (use canonical name for verticals.csv lookup)
-        ad_data['tier'] = verticals_data.get(ad_name.strip(), 'Unassigned')
-        
-        # Get follow-ups (no best practices in scorecards) - use JSON normalized name
-        follow_ups = follow_up_data.get(json_name, [])
+        # Get follow-ups (no best practices in scorecards)
+        follow_ups = snapshot.follow_ups.get(ad_name, [])
         
         print(f"  Found {len(follow_ups)} follow-up items")
         print(f"  Total Score: {ad_data['total_score']}/40.0")
         
         # Generate HTML
-        html = generate_scorecard_html(ad_data, [], follow_ups)
+        with profiler.stage("render"):
+            html = generate_scorecard_html(ad_data, [], follow_ups)
         
         # Save to file with sanitized filename
         safe_name = ad_name.strip().lower().replace(' ', '-').replace('/', '-').replace('\\', '-')
         filename = f"reports-v2/{safe_name}-scorecard.html"
-        with open(filename, "w", encoding="utf-8") as f:
-            f.write(html)
+        with profiler.stage("write"):
+            with open(filename, "w", encoding="utf-8") as f:
+                f.write(html)
         
         print(f"  [OK] Saved to {filename}")
     
     print("\n[SUCCESS] All scorecards generated!")
 
 if __name__ == "__main__":
-    generate_all_scorecards()
+    parser = argparse.ArgumentParser(description="Generate individual HTML scorecards.")
+    add_profile_arguments(parser)
+    profiler = Profiler.from_args(parser.parse_args(), "generate_scorecards")
+    generate_all_scorecards(profiler)
+    profiler.finish()
 
@@ -0,0 +1,384 @@
+"""
+Generate a synthetic data/ directory at a configurable scale for benchmarking.
+
+Produces the same file layouts the pipeline reads from data/:
+  - performance_reviews.csv      Year-End Review export (metadata + 8 feedback/score pairs),
+                                 including joint reviews ("A / B") and AD name variants
+  - verticals.csv                Account Director, Vertical, Tier, Scorecard, Role
+  - <VERTICAL>.csv               "KPIs - BY ACCOUNT" block format (Account - AD header + KPI rows)
+  - ad_csvs/<ad-name>.csv        per-AD long KPI format (Account, Vertical, KPI, months...)
+  - ATB Q4.2025-Jan. 2026.csv    Above Base Services by account portfolio
+  - Month End Ranking - January 2026.csv   IFM pivot with "IFM-Account - Owner" rows
+  - best-practices.json / follow-up-questions.json
+
+Scale 1 is roughly today's data (~45 ADs, ~110 reviews, ~300 accounts).
+
+Usage:
+    python generate_synthetic_data.py --out /tmp/synthetic --scale 10
+"""
+
+import argparse
+import csv
+import json
+import random
+from pathlib import Path
+
+SCORING_SECTIONS = [
+    "Key Projects & Initiatives",
+    "Value Adds & Cost Avoidance",
+    "Cost Savings Delivered",
+    "Innovation & Continuous Improvement",
+    "Issues, Challenges & Accountability",
+    "2026 Forward Strategy & Vision",
+    "Personal Goals & Role Maturity",
+    "Executive Presence & Presentation Skills"
+]
+
+VERTICALS = ["MANUFACTURING", "LIFE SCIENCE", "TECHNOLOGY", "DISTRIBUTION", "FINANCE"]
+VERTICAL_LABELS = {
+    "MANUFACTURING": "Manufacturing",
+    "LIFE SCIENCE": "Life Science",
+    "TECHNOLOGY": "Technology",
+    "DISTRIBUTION": "Distribution",
+    "FINANCE": "Finance",
+}
+TIERS = ["Tier 4", "Tier 5", "Tier 6"]
+ROLES = ["Account Director"] * 6 + ["Sr. Account Director"] * 2 + ["Account Manager", "VP"]
+IFMS = ["CBRE", "JLL", "C&W", "Compass", "Emcor", "Aramark", "Sodexo", "Direct"]
+
+MONTHS = ["Dec-24", "Jan-25", "Feb-25", "Mar-25", "Apr-25", "May-25", "Jun-25",
+          "Jul-25", "Aug-25", "Sep-25", "Oct-25", "Nov-25", "Dec-25"]
+KPI_ROWS = ["Revenue ($) ", "Growth (%) ", "Gap ($) ", "Red Sites ($) ", "Red Sites (#) ", "Headcount",
+            "Separations ", "Turnover (%) ", "CSAT ", "YTD Claims ", "YTD Recordables ", "TRIR "]
+
+FIRST_NAMES = ["Aaron", "Ana", "Benjamin", "Brian", "Chad", "Colleen", "Corey", "David", "Dustin", "Gregory",
+               "Grant", "Isaac", "Jack", "Jacob", "Jennifer", "Jeremy", "Joshua", "Julie", "Justin", "Keith",
+               "Kimberly", "Logan", "Luis", "Mark", "Michael", "Nicholas", "Patrick", "Paul", "Peggy", "Scott",
+               "Stuart", "Taylor", "Thomas", "Tiffany", "Valarie", "Zachary"]
+LAST_NAMES = ["Simpson", "Sabater", "Ehrenberg", "Davis", "Boulton", "Doles", "Wallace", "Pergola", "Smith",
+              "DeMedio", "Frazier", "Calderon", "Thornton", "Reed", "Segovia", "Johnson", "Grady", "Bianchi",
+              "Homa", "Deuber", "Wittekind", "Newman", "Cabrera", "Schlerf", "Barry", "Trenkamp", "Murtha",
+              "Rhodes", "Shum", "Kimball", "Kelloff", "Wattenberg", "Mahoney", "Purifoy", "Barnett", "Shock"]
+NICKNAMES = {"Benjamin": "Ben", "Gregory": "Greg", "Jennifer": "Jen", "Joshua": "Josh", "Michael": "Mike",
+             "Nicholas": "Nick", "David": "Dave", "Thomas": "Tom", "Zachary": "Zach"}
+COMPANY_WORDS = ["Global", "United", "Pacific", "Summit", "Apex", "Pioneer", "Atlas", "Vertex", "Harbor",
+                 "Quantum", "Sterling", "Northern", "Liberty", "Crescent", "Evergreen", "Keystone"]
+COMPANY_SUFFIXES = ["Corp", "Labs", "Inc", "Systems", "Pharma", "Motors", "Logistics", "Bank", "Foods",
+                    "Aerospace", "Health", "Energy"]
+FEEDBACK_WORDS = ("the account director clearly articulated key initiatives and measurable client impact "
+                  "including cost savings value adds renewal strategy staffing stability safety programs "
+                  "quality audits innovation pilots data driven scorecards executive presence strong "
+                  "communication accountability corrective actions timelines 2026 roadmap retention growth "
+                  "opportunity to strengthen financial framing partnership vendor transition").split()
+PRACTICE_CATEGORIES = ["Financial Strategy", "Operational Excellence", "Innovation & Technology",
+                       "Client Relations", "People & Culture", "Safety & Quality", "Account Transition"]
+PRACTICE_STATUSES = ["Proven & Active", "Proven & Scalable", "2026 Development Goal", "Pilot", "Active (2026 growth)"]
+
+# Per-unit-of-scale sizes (scale 1 ~ current data)
+BASE_ADS = 45
+BASE_ACCOUNTS = 300
+BASE_ATB_ACCOUNTS = 200
+BASE_MONTH_END_ACCOUNTS = 450
+REVIEWS_PER_AD = (1, 4)
+JOINT_REVIEW_RATE = 0.03
+NAME_VARIANT_RATE = 0.08
+
+
+def make_unique_names(rng, count, make):
+    names = []
+    seen = set()
+    attempt = 0
+    while len(names) < count:
+        attempt += 1
+        name = make(attempt)
+        if name not in seen:
+            seen.add(name)
+            names.append(name)
+    return names
+
+
+def person_name(rng, attempt):
+    name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+    # Past the combinatorial limit, add a middle initial to stay unique
+    if attempt > len(FIRST_NAMES) * len(LAST_NAMES) // 2:
+        first, last = name.split(" ")
+        name = f"{first} {chr(65 + attempt % 26)}. {last}{attempt // 26 if attempt > 26 * 26 else ''}"
+    return name
+
+
+def company_name(rng, attempt):
+    name = f"{rng.choice(COMPANY_WORDS)} {rng.choice(COMPANY_SUFFIXES)}"
+    if attempt > len(COMPANY_WORDS) * len(COMPANY_SUFFIXES) // 2:
+        name = f"{name} {attempt}"
+    return name
+
+
+def name_variant(rng, name):
+    """Realistic spelling variants seen in the review export."""
+    first, _, last = name.partition(" ")
+    options = [name + " ", name + "'s", f"{NICKNAMES.get(first, first)} {last}", name.lower().title()]
+    return rng.choice(options)
+
+
+def feedback_text(rng, min_words=15, max_words=70):
+    words = [rng.choice(FEEDBACK_WORDS) for _ in range(rng.randint(min_words, max_words))]
+    return " ".join(words).capitalize() + "."
+
+
+def money(rng, value):
+    """Format like the finance exports: ' 1,234 ', ' (1,234)', ' -   '."""
+    if value is None or value == 0:
+        return " -   "
+    if value < 0:
+        return f" ({abs(value):,.0f})"
+    return f" {value:,.0f} "
+
+
+def build_roster(rng, scale):
+    ads = make_unique_names(rng, BASE_ADS * scale, lambda a: person_name(rng, a))
+    accounts = make_unique_names(rng, BASE_ACCOUNTS * scale, lambda a: company_name(rng, a))
+    reviewers = make_unique_names(rng, max(5, 3 * scale), lambda a: person_name(rng, a + 10 ** 6))
+    # Every AD owns at least one account; the rest are spread at random
+    owner = {}
+    for i, account in enumerate(accounts):
+        owner[account] = ads[i % len(ads)] if i < len(ads) else rng.choice(ads)
+    vertical_of = {account: rng.choice(VERTICALS) for account in accounts}
+    return ads, accounts, reviewers, owner, vertical_of
+
+
+def write_reviews(rng, out, ads, accounts_by_ad, reviewers):
+    header = ["Id", "Start time", "Completion time", "Email", "Name", "Account Name",
+              "Account Director Name", "Enter Your Name"]
+    for section in SCORING_SECTIONS:
+        header.append(f"Comment on how effectively the Account Director\xa0addressed {section.lower()}, "
+                      f"using the rubric and examples provided below as evaluation reference points.")
+        header.append(section)
+
+    rows = []
+    review_id = 1
+    for i, ad in enumerate(ads):
+        for _ in range(rng.randint(*REVIEWS_PER_AD)):
+            ad_label = ad
+            roll = rng.random()
+            if roll < JOINT_REVIEW_RATE and i + 1 < len(ads):
+                ad_label = f"{ad} / {ads[i + 1]}"
+            elif roll < JOINT_REVIEW_RATE + NAME_VARIANT_RATE:
+                ad_label = name_variant(rng, ad)
+            reviewer = rng.choice(reviewers)
+            day = rng.randint(5, 28)
+            row = [
+                review_id,
+                f"1/{day}/2026 9:{rng.randint(10, 59)}",
+                f"1/{day}/2026 10:{rng.randint(10, 59)}",
+                f"{reviewer.split(' ')[0][0].lower()}{reviewer.split(' ')[-1].lower()}@example.com",
+                reviewer,
+                rng.choice(accounts_by_ad[ad]),
+                ad_label,
+                reviewer if rng.random() < 0.7 else "",
+            ]
+            for _ in SCORING_SECTIONS:
+                row.append(feedback_text(rng) if rng.random() < 0.95 else "")
+                row.append(rng.choice([2, 3, 3, 4, 4, 4, 5, 5]))
+            rows.append(row)
+            review_id += 1
+
+    with open(out / "performance_reviews.csv", "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        writer.writerows(rows)
+    return len(rows)
+
+
+def write_verticals(rng, out, ads, accounts_by_ad, vertical_of):
+    with open(out / "verticals.csv", "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["Account Director", "Vertical", "Tier", "Scorecard", "Role"])
+        for ad in ads:
+            vertical = VERTICAL_LABELS[vertical_of[accounts_by_ad[ad][0]]]
+            scorecard = f"{rng.uniform(4.2, 5.0):.2f}" if rng.random() < 0.85 else ""
+            writer.writerow([ad, vertical, rng.choice(TIERS), scorecard, rng.choice(ROLES)])
+
+
+def kpi_series(rng):
+    """Monthly values for one account: {kpi: [13 formatted cells]} plus raw numbers for ad_csvs."""
+    revenue = rng.randint(0, 4000)
+    headcount = max(0, int(revenue / rng.uniform(4, 12)))
+    series = {}
+    raw = {}
+    for kpi in KPI_ROWS:
+        cells = []
+        values = []
+        for month_idx in range(len(MONTHS)):
+            if kpi.startswith("Revenue"):
+                v = max(0, int(revenue * rng.uniform(0.9, 1.1)))
+                cells.append(money(rng, v))
+            elif kpi.startswith("Growth") or kpi.startswith("Turnover"):
+                v = round(rng.uniform(-10, 15), 1)
+                cells.append(f"{v}%")
+            elif kpi.startswith("Gap") or kpi.startswith("Red Sites ($)"):
+                v = -rng.randint(0, 10) if rng.random() < 0.4 else 0
+                cells.append(money(rng, v))
+            elif kpi.startswith("Headcount"):
+                v = max(0, headcount + rng.randint(-2, 2))
+                cells.append(money(rng, v))
+            elif kpi.startswith("CSAT"):
+                v = round(rng.uniform(3.5, 5.0), 2) if rng.random() < 0.9 else None
+                cells.append(f" {v:.2f} " if v is not None else "")
+            else:
+                v = rng.randint(0, 3) if rng.random() < 0.3 else 0
+                cells.append(money(rng, v))
+            values.append(v)
+        series[kpi] = cells
+        raw[kpi.strip()] = values
+    return series, raw
+
+
+def write_kpi_files(rng, out, accounts, owner, vertical_of):
+    by_vertical = {v: [] for v in VERTICALS}
+    for account in accounts:
+        by_vertical[vertical_of[account]].append(account)
+
+    raw_by_account = {}
+    width = len(MONTHS) + 2
+    for vertical, vertical_accounts in by_vertical.items():
+        lines = [[""] * width, [""] * width, ["KPIs - BY ACCOUNT"] + [""] * (width - 1),
+                 [""] * width, [""] * width, [""] + MONTHS + [""]]
+        for account in vertical_accounts:
+            series, raw = kpi_series(rng)
+            raw_by_account[account] = raw
+            lines.append([f"{account} - {owner[account]}"] + [""] * (width - 1))
+            for kpi in KPI_ROWS:
+                lines.append([kpi] + series[kpi] + [""])
+        with open(out / f"{vertical}.csv", "w", encoding="utf-8", newline="") as f:
+            csv.writer(f).writerows(lines)
+    return raw_by_account
+
+
+def write_ad_csvs(out, ads, accounts_by_ad, vertical_of, raw_by_account):
+    ad_dir = out / "ad_csvs"
+    ad_dir.mkdir(exist_ok=True)
+    for ad in ads:
+        with open(ad_dir / (ad.lower().replace(" ", "-").replace(".", "") + ".csv"), "w",
+                  encoding="utf-8", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["Account", "Vertical", "KPI"] + MONTHS)
+            for account in accounts_by_ad[ad]:
+                for kpi, values in raw_by_account[account].items():
+                    writer.writerow([account, vertical_of[account], kpi]
+                                    + ["" if v is None else v for v in values])
+
+
+def write_atb(rng, out, accounts, scale):
+    with open(out / "ATB Q4.2025-Jan. 2026.csv", "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["", "", "BaseData", "Actual", "Final", "USD Consolidated", "Total Program", "Total Cost Center"])
+        writer.writerow(["", "", "2025", "2025", "2025", "2026", "", ""])
+        writer.writerow(["", "", "October", "November", "December", "January", "", ""])
+        for account in accounts[:BASE_ATB_ACCOUNTS * scale]:
+            values = [rng.choice([0, rng.randint(-2000, 400000)]) for _ in range(4)]
+            writer.writerow(["Above Base Services", f"{account} Portfolio"] + [money(rng, v) for v in values] + ["", ""])
+
+
+def write_month_end(rng, out, accounts, owner, scale):
+    metric_count = 17
+    rows = [["Ranking by IFM "] + [""] * 24, [""] * 25,
+            ["", " Financials "] + [""] * 9 + ["EHS"] + [""] * 6 + ["HR", "Quality"] + [""] * 5,
+            [""] + [money(rng, rng.randint(1000, 90000)) for _ in range(metric_count)] + [""] * 7,
+            ["IFM", "RV", "Margin", "Margin %", "Perf $", "22 Day Gap", "Growth %", "YTD RV", "YTD Margin",
+             "YTD Margin %", "YTD Perf $", "Workers Comp", "YTD Workers Comp", "TIR", "Incidents", "TRIR",
+             "Recordables", "Turnover Rate", "CSAT"] + [""] * 6,
+            ["Row Labels", "Sum of RV", "Sum of Margin", "Sum of Margin % Calc", "Sum of Perf $",
+             "Sum of 22 Day Gap", "Sum of Growth % Calc", "Sum of YTD RV", "Sum of YTD Margin",
+             "Sum of YTD Margin % Calc", "Sum of YTD Perf $", "Sum of Workers Comp", "Sum of YTD Workers Comp",
+             "Sum of TIR Calc", "Sum of Incidents", "Sum of TRIR Calc", "Sum of Recordables",
+             "Sum of Turnover Rate Calc", "Average of CSAT"] + [""] * 6]
+
+    month_end_accounts = accounts[:BASE_MONTH_END_ACCOUNTS * scale]
+    by_ifm = {ifm: [] for ifm in IFMS}
+    for account in month_end_accounts:
+        by_ifm[rng.choice(IFMS)].append(account)
+
+    def metric_row(rv):
+        margin = rv * rng.uniform(-0.05, 0.2)
+        return [money(rng, rv), money(rng, margin), f"{margin / rv * 100 if rv else 0:.1f}%",
+                money(rng, rng.uniform(-100, 150)), money(rng, rng.uniform(-100, 200)),
+                f"{rng.uniform(-15, 30):.1f}%", money(rng, rv), money(rng, margin),
+                f"{margin / rv * 100 if rv else 0:.1f}%", money(rng, rng.uniform(-100, 150))] \
+            + [money(rng, rng.choice([0, rng.randint(1, 30)])) for _ in range(6)] \
+            + [f"{rng.uniform(0, 6):.1f}%", ""] + [""] * 6
+
+    for ifm, ifm_accounts in by_ifm.items():
+        rvs = [rng.uniform(50, 6000) for _ in ifm_accounts]
+        rows.append([ifm] + metric_row(sum(rvs)))
+        for account, rv in sorted(zip(ifm_accounts, rvs), key=lambda x: -x[1]):
+            rows.append([f"{ifm}-{account} - {owner[account]}"] + metric_row(rv))
+
+    with open(out / "Month End Ranking - January 2026.csv", "w", encoding="utf-8", newline="") as f:
+        csv.writer(f).writerows(rows)
+
+
+def write_practices_and_follow_ups(rng, out, ads, reviewers):
+    best_practices = {}
+    follow_ups = {}
+    for ad in ads:
+        best_practices[ad] = [{
+            "title": " ".join(rng.choice(FEEDBACK_WORDS) for _ in range(4)).title(),
+            "category": rng.choice(PRACTICE_CATEGORIES),
+            "description": feedback_text(rng, 10, 25),
+            "context": feedback_text(rng, 40, 120),
+            "impact": feedback_text(rng, 8, 20),
+            "replicability": rng.choice(["High", "Medium", "Low"]),
+            "status": rng.choice(PRACTICE_STATUSES),
+            "leadership_endorsement": f"{rng.choice(reviewers)} endorsed this approach",
+        } for _ in range(rng.randint(2, 5))]
+        follow_ups[ad] = [{
+            "category": rng.choice(PRACTICE_CATEGORIES),
+            "reviewer": rng.choice(reviewers),
+            "title": " ".join(rng.choice(FEEDBACK_WORDS) for _ in range(5)).title(),
+            "quote": feedback_text(rng, 20, 60),
+            "action": feedback_text(rng, 15, 40),
+            "source": "Transcript",
+        } for _ in range(rng.randint(2, 6))]
+
+    with open(out / "best-practices.json", "w", encoding="utf-8") as f:
+        json.dump(best_practices, f, indent=2)
+    with open(out / "follow-up-questions.json", "w", encoding="utf-8") as f:
+        json.dump(follow_ups, f, indent=2)
+
+
+def generate(out_dir, scale=1, seed=0):
+    """Write a synthetic data/ directory into out_dir. Returns a summary of row counts."""
+    rng = random.Random(seed)
+    out = Path(out_dir)
+    out.mkdir(parents=True, exist_ok=True)
+
+    ads, accounts, reviewers, owner, vertical_of = build_roster(rng, scale)
+    accounts_by_ad = {ad: [] for ad in ads}
+    for account in accounts:
+        accounts_by_ad[owner[account]].append(account)
+
+    review_count = write_reviews(rng, out, ads, accounts_by_ad, reviewers)
+    write_verticals(rng, out, ads, accounts_by_ad, vertical_of)
+    raw_by_account = write_kpi_files(rng, out, accounts, owner, vertical_of)
+    write_ad_csvs(out, ads, accounts_by_ad, vertical_of, raw_by_account)
+    write_atb(rng, out, accounts, scale)
+    write_month_end(rng, out, accounts, owner, scale)
+    write_practices_and_follow_ups(rng, out, ads, reviewers)
+
+    return {"scale": scale, "seed": seed, "ads": len(ads), "accounts": len(accounts), "reviews": review_count}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate synthetic dashboard data at a given scale.")
+    parser.add_argument("--out", required=True, help="Output directory (becomes the data/ folder)")
+    parser.add_argument("--scale", type=int, default=1, help="Multiplier relative to current data size")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed (same seed -> same files)")
+    args = parser.parse_args()
+
+    summary = generate(args.out, args.scale, args.seed)
+    print(f"Generated synthetic data in {args.out}: {summary['ads']} ADs, "
+          f"{summary['accounts']} accounts, {summary['reviews']} reviews")
+
+
+if __name__ == "__main__":
+    main()
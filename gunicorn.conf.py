@@ -0,0 +1,43 @@
+"""
+Gunicorn settings for the dashboard server (Procfile: gunicorn -c gunicorn.conf.py server:app).
+
+Every route returns promptly (dashboards poll /api/version rather than holding a stream
+open), so a thread is only busy for the length of one request. Workers and threads are
+tunable through the environment:
+    WEB_CONCURRENCY  worker processes (Heroku sets this per dyno size)
+    WEB_THREADS      threads per worker
+    METRICS_DIR      where workers share /metrics counters (see server_metrics.py)
+"""
+import multiprocessing
+import os
+import tempfile
+from pathlib import Path
+
+# Serve vanilla-js-app/ from memory (see server.py)
+os.environ.setdefault('PRELOAD_ASSETS', '1')
+os.environ.setdefault('METRICS_DIR', os.path.join(tempfile.gettempdir(), 'dashboard-metrics'))
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '5847')}"
+workers = int(os.environ.get('WEB_CONCURRENCY', min(multiprocessing.cpu_count() * 2 + 1, 8)))
+threads = int(os.environ.get('WEB_THREADS', 8))
+worker_class = 'gthread'
+
+# Import server.py (and read the assets) once in the master; workers share the pages copy-on-write
+preload_app = True
+
+timeout = 30
+graceful_timeout = 30
+keepalive = 5
+accesslog = '-'
+
+
+def on_starting(server):
+    # Counters from a previous run would otherwise be summed into this one
+    for path in Path(os.environ['METRICS_DIR']).glob('*.json'):
+        path.unlink()
+
+
+def post_worker_init(worker):
+    # Each worker polls data.json for new builds (server.Dataset); threads don't survive the fork
+    import server
+    server.dataset.start_watcher()
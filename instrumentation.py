@@ -0,0 +1,156 @@
+"""
+Per-stage timing and profiling shared by the generators.
+
+Scripts add the --profile flags to their parser and wrap each step in a named stage:
+
+    profiler = Profiler.from_args(args, "build_data")
+    with profiler.stage("load_csv"):
+        df = load_csv_data()
+    ...
+    profiler.finish()
+
+With --profile, each stage records wall time, CPU time and peak traced memory
+(tracemalloc), a summary table is printed and profiles/<script>-timings.json is
+written. --cprofile additionally dumps cProfile stats to profiles/<script>.prof
+(open with `python -m pstats` or snakeviz). Without either flag stages cost nothing.
+
+Stages with the same name (e.g. "render" inside a per-AD loop) are accumulated
+into one entry with a call count.
+"""
+
+import cProfile
+import json
+import pstats
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+from pathlib import Path
+
+DEFAULT_PROFILE_DIR = Path(__file__).resolve().parent / "profiles"
+
+# Rows shown from cProfile's cumulative-time listing
+CPROFILE_TOP_N = 25
+
+
+def add_profile_arguments(parser):
+    """Add --profile/--cprofile/--profile-dir to an argparse parser."""
+    group = parser.add_argument_group("profiling")
+    group.add_argument("--profile", action="store_true",
+                       help="Record wall/CPU time and peak memory per stage (tracemalloc slows the run)")
+    group.add_argument("--cprofile", action="store_true", help="Also dump cProfile stats for the whole run")
+    group.add_argument("--profile-dir", default=str(DEFAULT_PROFILE_DIR),
+                       help="Where timings JSON and .prof files are written")
+    return parser
+
+
+class Profiler:
+    """Collects named stage timings for one script run."""
+
+    def __init__(self, script_name, enabled=False, use_cprofile=False, output_dir=DEFAULT_PROFILE_DIR):
+        self.script_name = script_name
+        self.enabled = enabled or use_cprofile
+        self.use_cprofile = use_cprofile
+        self.output_dir = Path(output_dir)
+        self.stages = {}  # name -> {"calls", "wall_s", "cpu_s", "peak_bytes"}
+        self._stack = []  # peak bytes seen so far by each open stage
+        self._run_peak = 0
+        self._cprofile = None
+
+        if not self.enabled:
+            return
+        tracemalloc.start()
+        if use_cprofile:
+            self._cprofile = cProfile.Profile()
+            self._cprofile.enable()
+        self._wall_start = time.perf_counter()
+        self._cpu_start = time.process_time()
+
+    @classmethod
+    def from_args(cls, args, script_name):
+        return cls(script_name, enabled=args.profile, use_cprofile=args.cprofile, output_dir=args.profile_dir)
+
+    def stage(self, name):
+        """Context manager timing one named stage (no-op when profiling is off)."""
+        if not self.enabled:
+            return nullcontext()
+        return self._timed_stage(name)
+
+    @contextmanager
+    def _timed_stage(self, name):
+        # tracemalloc keeps a single peak; fold it into the enclosing stage before resetting
+        if self._stack:
+            self._stack[-1] = max(self._stack[-1], tracemalloc.get_traced_memory()[1])
+        tracemalloc.reset_peak()
+        self._stack.append(0)
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            yield
+        finally:
+            wall = time.perf_counter() - wall_start
+            cpu = time.process_time() - cpu_start
+            peak = max(self._stack.pop(), tracemalloc.get_traced_memory()[1])
+            if self._stack:
+                self._stack[-1] = max(self._stack[-1], peak)
+            self._run_peak = max(self._run_peak, peak)
+
+            entry = self.stages.setdefault(name, {"calls": 0, "wall_s": 0.0, "cpu_s": 0.0, "peak_bytes": 0})
+            entry["calls"] += 1
+            entry["wall_s"] += wall
+            entry["cpu_s"] += cpu
+            entry["peak_bytes"] = max(entry["peak_bytes"], peak)
+
+    def finish(self):
+        """Stop profiling, print the summary and write the output files. Returns the timings dict."""
+        if not self.enabled:
+            return None
+        if self._cprofile:
+            self._cprofile.disable()
+        total_wall = time.perf_counter() - self._wall_start
+        total_cpu = time.process_time() - self._cpu_start
+        total_peak = max(self._run_peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+
+        timings = {
+            "script": self.script_name,
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "argv": sys.argv[1:],
+            "total": {"wall_s": round(total_wall, 4), "cpu_s": round(total_cpu, 4),
+                      "peak_mb": round(total_peak / 2 ** 20, 2)},
+            "stages": [
+                {"name": name, "calls": entry["calls"], "wall_s": round(entry["wall_s"], 4),
+                 "cpu_s": round(entry["cpu_s"], 4), "peak_mb": round(entry["peak_bytes"] / 2 ** 20, 2)}
+                for name, entry in self.stages.items()
+            ],
+        }
+
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        timings_path = self.output_dir / f"{self.script_name}-timings.json"
+        with open(timings_path, "w", encoding="utf-8") as f:
+            json.dump(timings, f, indent=2)
+
+        self._print_summary(timings)
+        print(f"Timings written to {timings_path}")
+
+        if self._cprofile:
+            prof_path = self.output_dir / f"{self.script_name}.prof"
+            self._cprofile.dump_stats(prof_path)
+            pstats.Stats(self._cprofile).sort_stats("cumulative").print_stats(CPROFILE_TOP_N)
+            print(f"cProfile stats written to {prof_path}")
+
+        return timings
+
+    @staticmethod
+    def _print_summary(timings):
+        total_wall = timings["total"]["wall_s"] or 1
+        print(f"\nProfile: {timings['script']}")
+        print(f"{'Stage':<28}{'Calls':>7}{'Wall (s)':>11}{'CPU (s)':>10}{'Peak MB':>10}{'% wall':>8}")
+        print("-" * 74)
+        for stage in timings["stages"]:
+            print(f"{stage['name']:<28}{stage['calls']:>7}{stage['wall_s']:>11.3f}{stage['cpu_s']:>10.3f}"
+                  f"{stage['peak_mb']:>10.1f}{stage['wall_s'] / total_wall * 100:>7.1f}%")
+        print("-" * 74)
+        total = timings["total"]
+        print(f"{'Total':<28}{'':>7}{total['wall_s']:>11.3f}{total['cpu_s']:>10.3f}{total['peak_mb']:>10.1f}")
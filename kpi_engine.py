@@ -0,0 +1,211 @@
+"""
+Dense (account x KPI x month) KPI tensor with vectorized trend metrics.
+
+The vertical KPI files (or data/ad_csvs, or the analytics store) are parsed once into
+a float64 array with NaN for missing cells; every metric below is whole-array NumPy,
+so trends for every account cost about as much as reading one month used to.
+
+    from kpi_engine import KPITensor
+    kpis = KPITensor.from_kpi_files()
+    kpis.trailing_mean("Revenue ($)", 3)       # (accounts x months)
+    kpis.yoy_delta("Revenue ($)")              # NaN where the prior-year month is missing
+    kpis.rollup("Revenue ($)")                 # (ADs x months) via the membership matrix
+    kpis.frame(kpis.mom_growth("Revenue ($)")) # labelled DataFrame
+
+The month axis is the contiguous range between the first and last month seen, so
+shifting by 1 or 12 positions is exactly one month or one year.
+"""
+
+import argparse
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from analytics_store import DATA_DIR, VERTICAL_KPI_FILES, iter_kpi_rows
+from staff_dimensions import canonical_ad_name
+
+# KPIs that add up across accounts; everything else (%, CSAT, TRIR) rolls up as a mean
+ADDITIVE_KPIS = {
+    "Revenue ($)", "Gap ($)", "Red Sites ($)", "Red Sites (#)", "Headcount",
+    "Separations", "YTD Claims", "YTD Recordables",
+}
+
+MONTHS_PER_YEAR = 12
+
+
+def _month_range(first, last):
+    return [str(p) for p in pd.period_range(first, last, freq="M")]
+
+
+class KPITensor:
+    """values[a, k, m] for account a, KPI k, month m ("YYYY-MM"); NaN = missing."""
+
+    def __init__(self, values, accounts, kpis, months, account_ads):
+        self.values = values
+        self.accounts = list(accounts)
+        self.kpis = list(kpis)
+        self.months = list(months)
+        self.account_ads = np.asarray(account_ads, dtype=object)
+        self.account_index = {name: i for i, name in enumerate(self.accounts)}
+        self.kpi_index = {name: i for i, name in enumerate(self.kpis)}
+        self.month_index = {name: i for i, name in enumerate(self.months)}
+
+        self.ads, ad_codes = np.unique(self.account_ads.astype(str), return_inverse=True)
+        self.ads = list(self.ads)
+        self.ad_index = {name: i for i, name in enumerate(self.ads)}
+        # membership[d, a] = 1 when account a belongs to AD d
+        self.membership = np.zeros((len(self.ads), len(self.accounts)), dtype=np.float64)
+        self.membership[ad_codes, np.arange(len(self.accounts))] = 1.0
+
+    @classmethod
+    def from_records(cls, records):
+        """Build from (account, AD, kpi, month "YYYY-MM", value) tuples; later duplicates win."""
+        df = pd.DataFrame.from_records(records, columns=["account", "ad", "kpi", "month", "value"])
+        if df.empty:
+            return cls(np.empty((0, 0, 0)), [], [], [], [])
+        account_codes, accounts = pd.factorize(df["account"])
+        kpi_codes, kpis = pd.factorize(df["kpi"])
+        months = _month_range(df["month"].min(), df["month"].max())
+        month_codes = pd.Index(months).get_indexer(df["month"])
+
+        values = np.full((len(accounts), len(kpis), len(months)), np.nan)
+        values[account_codes, kpi_codes, month_codes] = df["value"].to_numpy(dtype=np.float64)
+        # An account's AD is the last one it was listed under
+        account_ads = df.groupby(account_codes)["ad"].last().to_numpy()
+        return cls(values, accounts, kpis, months, account_ads)
+
+    @classmethod
+    def from_kpi_files(cls, data_dir=DATA_DIR, files=VERTICAL_KPI_FILES):
+        """Parse the "KPIs - BY ACCOUNT" vertical files (ADs from the account header rows)."""
+        records = []
+        for name in files:
+            path = Path(data_dir) / name
+            if path.exists():
+                records.extend((account, ad, kpi, month, value)
+                               for account, ad, _, kpi, month, value in iter_kpi_rows(path))
+        return cls.from_records(records)
+
+    @classmethod
+    def from_ad_csvs(cls, ad_csvs_dir=DATA_DIR / "ad_csvs", ad_names=None):
+        """Load the per-AD wide CSVs; the AD is the file stem, mapped through ad_names if given."""
+        ad_names = ad_names or {}
+        frames = []
+        for csv_file in sorted(Path(ad_csvs_dir).glob("*.csv")):
+            df = pd.read_csv(csv_file)
+            month_cols = [col for col in df.columns if col not in ("Account", "Vertical", "KPI")]
+            long = df.melt(id_vars=["Account", "KPI"], value_vars=month_cols, var_name="label", value_name="value")
+            long["ad"] = ad_names.get(csv_file.stem, csv_file.stem)
+            frames.append(long)
+        if not frames:
+            return cls.from_records([])
+        df = pd.concat(frames, ignore_index=True)
+        df["value"] = pd.to_numeric(df["value"], errors="coerce")
+        df = df.dropna(subset=["value"])
+        df["month"] = pd.to_datetime(df["label"], format="%b-%y").dt.strftime("%Y-%m")
+        df["KPI"] = df["KPI"].str.strip()
+        return cls.from_records(df[["Account", "ad", "KPI", "month", "value"]].itertuples(index=False, name=None))
+
+    @classmethod
+    def from_store(cls, conn):
+        """Load from the analytics store (see analytics_store.py)."""
+        return cls.from_records(conn.execute(
+            "SELECT account, account_director, kpi, month, value FROM account_kpis").fetchall())
+
+    def series(self, kpi):
+        """(accounts x months) view of one KPI."""
+        return self.values[:, self.kpi_index[kpi], :]
+
+    def _matrix(self, kpi, by):
+        """The KPI per account, or per AD (rolled up) when by="ad"."""
+        return self.rollup(kpi) if by == "ad" else self.series(kpi)
+
+    def latest_month(self, kpi):
+        """Last month in which any account has a value for the KPI."""
+        has_value = ~np.isnan(self.series(kpi)).all(axis=0)
+        return self.months[int(np.flatnonzero(has_value)[-1])] if has_value.any() else None
+
+    @staticmethod
+    def _shift(x, periods):
+        """Shift along the month axis by `periods`, filling the gap with NaN."""
+        shifted = np.full_like(x, np.nan)
+        if periods < x.shape[-1]:
+            shifted[..., periods:] = x[..., :-periods]
+        return shifted
+
+    def trailing_mean(self, kpi, window=3, min_periods=1, by="account"):
+        """Mean of the last `window` months (ignoring missing) once `min_periods` are present."""
+        x = self._matrix(kpi, by)
+        present = ~np.isnan(x)
+        sums = np.cumsum(np.where(present, x, 0.0), axis=1)
+        counts = np.cumsum(present, axis=1)
+        sums[:, window:] -= sums[:, :-window].copy()
+        counts[:, window:] -= counts[:, :-window].copy()
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(counts >= min_periods, sums / counts, np.nan)
+
+    def mom_growth(self, kpi, by="account"):
+        """Month-over-month growth as a fraction; NaN when the prior month is missing or zero."""
+        x = self._matrix(kpi, by)
+        prior = self._shift(x, 1)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(prior != 0, (x - prior) / np.abs(prior), np.nan)
+
+    def yoy_delta(self, kpi, relative=False, by="account"):
+        """Change versus the same month a year earlier (absolute, or a fraction if relative)."""
+        x = self._matrix(kpi, by)
+        prior = self._shift(x, MONTHS_PER_YEAR)
+        delta = x - prior
+        if not relative:
+            return delta
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(prior != 0, delta / np.abs(prior), np.nan)
+
+    def rollup(self, kpi, how=None):
+        """(ADs x months) per-AD totals (additive KPIs) or means of the accounts reporting."""
+        how = how or ("sum" if kpi in ADDITIVE_KPIS else "mean")
+        x = self.series(kpi)
+        present = ~np.isnan(x)
+        sums = self.membership @ np.where(present, x, 0.0)
+        counts = self.membership @ present
+        if how == "sum":
+            return np.where(counts > 0, sums, np.nan)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(counts > 0, sums / counts, np.nan)
+
+    def frame(self, matrix, by="account"):
+        """Label an (accounts|ADs x months) result as a DataFrame."""
+        index = self.accounts if by == "account" else self.ads
+        return pd.DataFrame(matrix, index=pd.Index(index, name=by), columns=self.months)
+
+    def accounts_for_ad(self, ad_name):
+        row = self.membership[self.ad_index[canonical_ad_name(ad_name)]]
+        return [self.accounts[i] for i in np.flatnonzero(row)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-AD KPI trend summary from the vertical KPI files.")
+    parser.add_argument("--kpi", default="Revenue ($)")
+    parser.add_argument("--window", type=int, default=3, help="Trailing-average window in months")
+    parser.add_argument("--top", type=int, default=20)
+    args = parser.parse_args()
+
+    kpis = KPITensor.from_kpi_files()
+    if args.kpi not in kpis.kpi_index:
+        parser.error(f"unknown KPI {args.kpi!r}; available: {', '.join(kpis.kpis)}")
+    month = kpis.latest_month(args.kpi)
+    col = kpis.month_index[month]
+
+    by_ad = pd.DataFrame({
+        month: kpis.rollup(args.kpi)[:, col],
+        f"trailing {args.window}m": kpis.trailing_mean(args.kpi, window=args.window, by="ad")[:, col],
+        "MoM %": kpis.mom_growth(args.kpi, by="ad")[:, col] * 100,
+        "YoY Δ": kpis.yoy_delta(args.kpi, by="ad")[:, col],
+    }, index=pd.Index(kpis.ads, name="Account Director"))
+    print(f"{args.kpi} by AD - {len(kpis.accounts)} accounts, {len(kpis.months)} months "
+          f"({kpis.months[0]}..{kpis.months[-1]})\n")
+    print(by_ad.sort_values(month, ascending=False).head(args.top).round(1).to_string())
+
+
+if __name__ == "__main__":
+    main()
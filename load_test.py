@@ -0,0 +1,373 @@
+"""
+Load-test the dashboard server with simulated users (asyncio, standard library only).
+
+Each virtual user loops over a dashboard session until the time is up:
+
+    GET /                 index.html
+    GET /app.js
+    GET /data.json        (--data shards: /api/version, then /api/data/<shard> for each shard)
+    N x /api/search       random queries, some filtered by kind or Account Director
+
+Repeat sessions revalidate index.html, app.js and data.json with If-None-Match like a browser does
+(--no-revalidate to always download). Connections are kept alive per user. The report
+gives throughput and p50/p95/p99 latency per request type and per session.
+
+Point it at a running server, or let it start one so modes can be compared:
+
+    python load_test.py --url http://127.0.0.1:5847 --users 50 --duration 30
+    python load_test.py --server dev --users 50
+    python load_test.py --server production --users 50 --json docs/load_test_production.json
+"""
+
+import argparse
+import asyncio
+import gzip
+import json
+import os
+import random
+import shutil
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+from datetime import datetime
+from pathlib import Path
+from urllib.parse import quote, urlsplit
+
+REPO_DIR = Path(__file__).resolve().parent
+
+# --server modes: argv started from the repo root with PORT set
+SERVER_COMMANDS = {
+    "dev": [sys.executable, "server.py"],
+    "production": ["gunicorn", "-c", "gunicorn.conf.py", "server:app"],
+}
+SERVER_START_TIMEOUT = 30.0
+
+SEARCH_QUERIES = [
+    "safety", "cost savings", "renew*", "client", "innovation", "vendor", "budget",
+    "\"cost avoidance\"", "training", "turnover", "quality", "communication", "strategy",
+]
+SEARCH_KINDS = ["review", "bestPractice", "followUp"]
+
+PERCENTILES = (50, 95, 99)
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return None
+    rank = max(1, -(-pct * len(sorted_values) // 100))
+    return sorted_values[int(rank) - 1]
+
+
+class HTTPConnection:
+    """Minimal keep-alive HTTP/1.1 client on asyncio streams (Content-Length, chunked, or close)."""
+
+    def __init__(self, host, port):
+        self.host = host
+        self.port = port
+        self.reader = None
+        self.writer = None
+
+    async def close(self):
+        if self.writer is not None:
+            self.writer.close()
+            try:
+                await self.writer.wait_closed()
+            except (ConnectionError, OSError):
+                pass
+        self.reader = self.writer = None
+
+    async def request(self, path, headers=None):
+        """GET path; returns (status, response headers, body bytes)."""
+        reused = self.writer is not None
+        try:
+            return await self._request(path, headers or {})
+        except (ConnectionError, asyncio.IncompleteReadError):
+            await self.close()
+            if not reused:
+                raise
+            # The server closed an idle keep-alive connection; retry once on a fresh one
+            return await self._request(path, headers or {})
+
+    async def _request(self, path, headers):
+        if self.writer is None:
+            self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+        lines = [f"GET {path} HTTP/1.1", f"Host: {self.host}:{self.port}", "Connection: keep-alive"]
+        lines += [f"{name}: {value}" for name, value in headers.items()]
+        self.writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1"))
+        await self.writer.drain()
+
+        status_line = await self.reader.readline()
+        if not status_line:
+            raise ConnectionError("connection closed before response")
+        version, status = status_line.decode("latin-1").split(" ", 2)[:2]
+        response_headers = {}
+        while True:
+            line = await self.reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            response_headers[name.strip().lower()] = value.strip()
+
+        status = int(status)
+        if response_headers.get("transfer-encoding", "").lower() == "chunked":
+            chunks = []
+            while True:
+                size = int((await self.reader.readline()).split(b";")[0], 16)
+                if size == 0:
+                    while (await self.reader.readline()) not in (b"\r\n", b"\n", b""):
+                        pass
+                    break
+                chunks.append(await self.reader.readexactly(size))
+                await self.reader.readexactly(2)
+            body = b"".join(chunks)
+        elif "content-length" in response_headers:
+            body = await self.reader.readexactly(int(response_headers["content-length"]))
+        elif status in (204, 304) or 100 <= status < 200:
+            body = b""
+        else:
+            body = await self.reader.read()
+            await self.close()
+            return status, response_headers, body
+
+        connection = response_headers.get("connection", "").lower()
+        if connection == "close" or (version == "HTTP/1.0" and connection != "keep-alive"):
+            await self.close()
+        return status, response_headers, body
+
+
+class LoadTest:
+    def __init__(self, url, users, duration, data_mode, api_calls, use_gzip, revalidate, think, seed):
+        parts = urlsplit(url)
+        self.host = parts.hostname or "127.0.0.1"
+        self.port = parts.port or 80
+        self.users = users
+        self.duration = duration
+        self.data_mode = data_mode
+        self.api_calls = api_calls
+        self.use_gzip = use_gzip
+        self.revalidate = revalidate
+        self.think = think
+        self.seed = seed
+        self.samples = {}  # label -> list of (seconds, status, bytes)
+        self.session_times = []
+        self.errors = {}  # label -> count of failed requests (connection errors or 5xx)
+        self.ad_names = []
+
+    def record(self, label, seconds, status, size):
+        self.samples.setdefault(label, []).append((seconds, status, size))
+        if status >= 500:
+            self.errors[label] = self.errors.get(label, 0) + 1
+
+    async def fetch(self, conn, label, path, headers=None):
+        headers = dict(headers or {})
+        if self.use_gzip:
+            headers["Accept-Encoding"] = "gzip"
+        started = time.perf_counter()
+        try:
+            status, response_headers, body = await conn.request(path, headers)
+        except (ConnectionError, OSError, asyncio.IncompleteReadError, ValueError):
+            self.errors[label] = self.errors.get(label, 0) + 1
+            await conn.close()
+            return None, {}, b""
+        self.record(label, time.perf_counter() - started, status, len(body))
+        return status, response_headers, body
+
+    async def fetch_cached(self, conn, label, path, etags):
+        """GET with If-None-Match from an earlier session, like a browser revalidating."""
+        headers = {"If-None-Match": etags[path]} if self.revalidate and path in etags else {}
+        status, response_headers, body = await self.fetch(conn, label, path, headers)
+        if status == 200 and "etag" in response_headers:
+            etags[path] = response_headers["etag"]
+        return status, response_headers, body
+
+    def learn_ad_names(self, headers, body, key=None):
+        """Pick up Account Director names (for filtered searches) from the first data response."""
+        if self.ad_names:
+            return
+        if headers.get("content-encoding") == "gzip":
+            body = gzip.decompress(body)
+        value = json.loads(body)
+        account_directors = value.get(key, []) if key else value
+        self.ad_names = [ad.get("accountDirector") for ad in account_directors if ad.get("accountDirector")]
+
+    async def load_data(self, conn, etags):
+        if self.data_mode == "full":
+            status, headers, body = await self.fetch_cached(conn, "data.json", "/data.json", etags)
+            if status == 200:
+                self.learn_ad_names(headers, body, key="accountDirectors")
+            return
+        status, _, body = await self.fetch(conn, "api/version", "/api/version")
+        shards = list(json.loads(body).get("shards", {})) if status == 200 else []
+        for shard in shards:
+            status, headers, body = await self.fetch(conn, "api/data/<shard>", f"/api/data/{shard}")
+            if shard == "accountDirectors" and status == 200:
+                self.learn_ad_names(headers, body)
+
+    def search_path(self, rng):
+        params = [f"q={quote(rng.choice(SEARCH_QUERIES))}", f"limit={rng.choice([10, 20, 50])}"]
+        roll = rng.random()
+        if roll < 0.3:
+            params.append(f"kind={rng.choice(SEARCH_KINDS)}")
+        elif roll < 0.5 and self.ad_names:
+            params.append(f"ad={quote(rng.choice(self.ad_names))}")
+        return "/api/search?" + "&".join(params)
+
+    async def user(self, user_id, deadline):
+        rng = random.Random(self.seed * 100003 + user_id)
+        conn = HTTPConnection(self.host, self.port)
+        etags = {}
+        try:
+            while time.monotonic() < deadline:
+                session_started = time.perf_counter()
+                await self.fetch_cached(conn, "index.html", "/", etags)
+                await self.fetch_cached(conn, "app.js", "/app.js", etags)
+                await self.load_data(conn, etags)
+                for _ in range(self.api_calls):
+                    if self.think:
+                        await asyncio.sleep(rng.uniform(0, 2 * self.think))
+                    await self.fetch(conn, "api/search", self.search_path(rng))
+                self.session_times.append(time.perf_counter() - session_started)
+        finally:
+            await conn.close()
+
+    async def run(self):
+        started = time.monotonic()
+        deadline = started + self.duration
+        await asyncio.gather(*(self.user(i, deadline) for i in range(self.users)))
+        return time.monotonic() - started
+
+    def report(self, elapsed):
+        rows = []
+        for label, samples in self.samples.items():
+            latencies = sorted(seconds for seconds, _, _ in samples)
+            statuses = {}
+            for _, status, _ in samples:
+                statuses[str(status)] = statuses.get(str(status), 0) + 1
+            rows.append({
+                "label": label,
+                "requests": len(samples),
+                "errors": self.errors.get(label, 0),
+                "statuses": statuses,
+                "rps": round(len(samples) / elapsed, 2),
+                "mb": round(sum(size for _, _, size in samples) / 2 ** 20, 2),
+                **{f"p{pct}_ms": round(percentile(latencies, pct) * 1000, 2) for pct in PERCENTILES},
+                "max_ms": round(latencies[-1] * 1000, 2),
+            })
+        for label, count in self.errors.items():
+            if label not in self.samples:
+                rows.append({"label": label, "requests": 0, "errors": count, "statuses": {}, "rps": 0.0, "mb": 0.0,
+                             **{f"p{pct}_ms": None for pct in PERCENTILES}, "max_ms": None})
+
+        sessions = sorted(self.session_times)
+        total_requests = sum(row["requests"] for row in rows)
+        return {
+            "elapsed_s": round(elapsed, 2),
+            "users": self.users,
+            "sessions": len(sessions),
+            "requests": total_requests,
+            "errors": sum(self.errors.values()),
+            "rps": round(total_requests / elapsed, 2),
+            "session_ms": {f"p{pct}": round(percentile(sessions, pct) * 1000, 1) if sessions else None
+                           for pct in PERCENTILES},
+            "requests_by_type": rows,
+        }
+
+
+def print_report(result):
+    print(f"\n{'Request':<18}{'Count':>8}{'Errors':>8}{'Req/s':>9}{'MB':>9}"
+          f"{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'Max ms':>9}  Statuses")
+    print("-" * 110)
+    fmt = lambda value: f"{value:>9.1f}" if value is not None else f"{'-':>9}"
+    for row in result["requests_by_type"]:
+        statuses = " ".join(f"{status}:{count}" for status, count in sorted(row["statuses"].items()))
+        print(f"{row['label']:<18}{row['requests']:>8}{row['errors']:>8}{row['rps']:>9.1f}{row['mb']:>9.1f}"
+              f"{fmt(row['p50_ms'])}{fmt(row['p95_ms'])}{fmt(row['p99_ms'])}{fmt(row['max_ms'])}  {statuses}")
+    print("-" * 110)
+    session = result["session_ms"]
+    print(f"{result['users']} users, {result['elapsed_s']}s: {result['requests']} requests "
+          f"({result['rps']} req/s), {result['errors']} errors, {result['sessions']} sessions "
+          f"(p50 {session['p50']} ms, p95 {session['p95']} ms, p99 {session['p99']} ms)")
+
+
+def wait_until_ready(url, process, timeout=SERVER_START_TIMEOUT):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"server exited with code {process.returncode}")
+        try:
+            with urllib.request.urlopen(f"{url}/api/version", timeout=2):
+                return
+        except (urllib.error.URLError, OSError):
+            time.sleep(0.25)
+    raise RuntimeError(f"server did not answer {url}/api/version within {timeout:.0f}s")
+
+
+def start_server(mode, port):
+    argv = SERVER_COMMANDS[mode]
+    if shutil.which(argv[0]) is None and not os.path.isabs(argv[0]):
+        raise SystemExit(f"{argv[0]} is not installed (pip install -r requirements.txt)")
+    env = dict(os.environ, PORT=str(port))
+    return subprocess.Popen(argv, cwd=REPO_DIR, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulate concurrent dashboard users against server.py.")
+    parser.add_argument("--url", default="http://127.0.0.1:5847", help="Server to test (not used with --server)")
+    parser.add_argument("--server", choices=list(SERVER_COMMANDS),
+                        help="Start server.py in this mode on --port for the run, then stop it")
+    parser.add_argument("--port", type=int, default=5850, help="Port for --server")
+    parser.add_argument("--users", type=int, default=20, help="Concurrent virtual users")
+    parser.add_argument("--duration", type=float, default=20.0, help="Seconds to run")
+    parser.add_argument("--data", choices=["full", "shards"], default="full",
+                        help="Fetch data.json, or /api/version + /api/data/<shard>")
+    parser.add_argument("--api-calls", type=int, default=5, help="Search/filter calls per session")
+    parser.add_argument("--think", type=float, default=0.0, help="Mean pause (s) before each API call")
+    parser.add_argument("--no-gzip", dest="gzip", action="store_false", help="Don't send Accept-Encoding: gzip")
+    parser.add_argument("--no-revalidate", dest="revalidate", action="store_false",
+                        help="Always download index.html/app.js/data.json instead of sending If-None-Match")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", help="Also write the results to this JSON file")
+    args = parser.parse_args()
+
+    url = f"http://127.0.0.1:{args.port}" if args.server else args.url.rstrip("/")
+    process = None
+    if args.server:
+        process = start_server(args.server, args.port)
+    try:
+        if process:
+            wait_until_ready(url, process)
+        test = LoadTest(url, args.users, args.duration, args.data, args.api_calls,
+                        args.gzip, args.revalidate, args.think, args.seed)
+        print(f"Load testing {url} ({args.server or 'external'} server): {args.users} users for {args.duration:.0f}s, "
+              f"data={args.data}, {args.api_calls} API calls per session")
+        elapsed = asyncio.run(test.run())
+    finally:
+        if process:
+            process.terminate()
+            try:
+                process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                process.kill()
+
+    result = test.report(elapsed)
+    print_report(result)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({
+                "timestamp": datetime.now().isoformat(timespec="seconds"),
+                "url": url,
+                "server": args.server,
+                "data": args.data,
+                "gzip": args.gzip,
+                **result,
+            }, f, indent=2)
+        print(f"Results written to {args.json}")
+    return 1 if result["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,118 @@
+"""
+Shared loader for the review form export (data/performance_reviews.csv).
+Used by the Streamlit dashboard, the vanilla JS data build and the scorecard generator
+so the CSV is read with explicit dtypes instead of every column as object:
+
+    Id                                  str (as exported, no float round-trip)
+    Email / Name / Account Name /
+    Account Director Name / Enter Your Name     category (few distinct values, many rows)
+    <section> score columns             float32 (1-5, NaN when blank or unparseable)
+    <section> feedback columns          str
+
+Only those columns are read (the form's start/completion timestamps are skipped), so
+callers must find section columns by name with section_columns(), not by position.
+
+    python review_data.py [--csv path]  # per-column memory, default read vs typed
+"""
+
+import argparse
+from typing import List, Sequence, Tuple
+
+import pandas as pd
+
+DEFAULT_REVIEWS_PATH = "data/performance_reviews.csv"
+
+SCORING_SECTIONS = [
+    "Key Projects & Initiatives",
+    "Value Adds & Cost Avoidance",
+    "Cost Savings Delivered",
+    "Innovation & Continuous Improvement",
+    "Issues, Challenges & Accountability",
+    "2026 Forward Strategy & Vision",
+    "Personal Goals & Role Maturity",
+    "Executive Presence & Presentation Skills"
+]
+
+ID_COLUMN = "Id"
+CATEGORICAL_COLUMNS = ["Email", "Name", "Account Name", "Account Director Name", "Enter Your Name"]
+
+SCORE_DTYPE = "float32"
+
+
+def section_columns(columns: Sequence[str]) -> List[Tuple[str, str, str]]:
+    """
+    Find the (section, feedback column, score column) triples in a review frame.
+
+    Each section's score column is headed with the section name (or a truncation of it)
+    and follows the free-text feedback column for that section.
+    """
+    columns = list(columns)
+    found = []
+    for i, col in enumerate(columns[1:], start=1):
+        header = str(col).strip()
+        if not header or col in CATEGORICAL_COLUMNS or col == ID_COLUMN:
+            continue
+        for section in SCORING_SECTIONS:
+            if section == header or header in section:
+                found.append((section, columns[i - 1], col))
+                break
+    return found
+
+
+def load_reviews_frame(csv_path=DEFAULT_REVIEWS_PATH) -> pd.DataFrame:
+    """
+    Load the review CSV with compact dtypes, keeping only the columns the loaders use.
+
+    Columns keep their exported headers and file order. Repeated header rows or stray
+    text in a score column become NaN rather than failing the load.
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+    """
+    header = list(pd.read_csv(csv_path, nrows=0).columns)
+    sections = section_columns(header)
+    feedback_cols = {feedback for _, feedback, _ in sections}
+    score_cols = [score for _, _, score in sections]
+
+    dtypes = {col: "category" for col in CATEGORICAL_COLUMNS}
+    dtypes[ID_COLUMN] = str
+    dtypes.update({col: str for col in feedback_cols})
+    dtypes.update({col: str for col in score_cols})  # coerced below; tolerates junk rows
+    keep = set(dtypes)
+    usecols = [col for col in header if col in keep]
+
+    df = pd.read_csv(csv_path, usecols=usecols, dtype={col: dtypes[col] for col in usecols})
+    for col in score_cols:
+        df[col] = pd.to_numeric(df[col].str.strip(), errors="coerce").astype(SCORE_DTYPE)
+    return df
+
+
+def memory_report(df: pd.DataFrame) -> pd.DataFrame:
+    """Per-column dtype and deep memory use (bytes), largest first, with a total row."""
+    usage = df.memory_usage(deep=True, index=False)
+    report = pd.DataFrame({"dtype": df.dtypes.astype(str), "bytes": usage})
+    report = report.sort_values("bytes", ascending=False)
+    report.loc["TOTAL"] = ["", int(usage.sum())]
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare review CSV memory: default read vs typed loader.")
+    parser.add_argument("--csv", default=DEFAULT_REVIEWS_PATH)
+    args = parser.parse_args()
+
+    default = pd.read_csv(args.csv, low_memory=False)
+    typed = load_reviews_frame(args.csv)
+    before = int(default.memory_usage(deep=True).sum())
+    after = int(typed.memory_usage(deep=True).sum())
+
+    report = memory_report(typed)
+    report.index = [str(col)[:50] for col in report.index]
+    print(f"{args.csv}: {len(typed)} rows\n")
+    print(report.to_string())
+    print(f"\nDefault read_csv: {before:,} bytes ({len(default.columns)} columns)")
+    print(f"Typed loader:     {after:,} bytes ({len(typed.columns)} columns), {before / max(after, 1):.1f}x smaller")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,324 @@
+"""
+Run the monthly data refresh as one command.
+
+Each stage declares the files it reads and writes; the run order is derived from
+those declarations (a stage waits for every stage that writes one of its inputs).
+Independent stages run concurrently, and a stage is skipped when the contents of
+its inputs (including its own script) are unchanged since its last successful run
+and its outputs still exist.
+
+Usage:
+    python run_pipeline.py                          # refresh everything that is stale
+    python run_pipeline.py build_data scorecards    # just these (plus stale upstream stages)
+    python run_pipeline.py --force --jobs 2
+    python run_pipeline.py --dry-run
+"""
+
+import argparse
+import fnmatch
+import glob
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+
+REPO_DIR = Path(__file__).resolve().parent
+STATE_PATH = REPO_DIR / "data" / ".pipeline_state.json"
+
+PYTHON = sys.executable
+
+# Paths and glob patterns are relative to the repo root.
+# "after" forces an order between stages that write the same files.
+STAGES = {
+    "extract_ad_mapping": {
+        "cmd": [PYTHON, "script1_extract_ad_mapping.py"],
+        "inputs": ["script1_extract_ad_mapping.py", "data/performance_reviews.csv"],
+        "outputs": ["data/ad_account_mapping.csv"],
+    },
+    "parse_vertical_csvs": {
+        "cmd": [PYTHON, "script2_parse_vertical_csvs.py"],
+        "inputs": ["script2_parse_vertical_csvs.py", "data/DISTRIBUTION.csv", "data/FINANCE.csv",
+                   "data/TECHNOLOGY.csv", "data/MANUFACTURING.csv", "data/LIFE SCIENCE.csv"],
+        "outputs": ["data/all_accounts_kpis.json"],
+    },
+    "map_ads_to_accounts": {
+        "cmd": [PYTHON, "script3_map_ads_to_accounts.py"],
+        "inputs": ["script3_map_ads_to_accounts.py", "data/ad_account_mapping.csv", "data/all_accounts_kpis.json"],
+        "outputs": ["data/accounts_with_actual_ads.json"],
+    },
+    "generate_ad_csvs": {
+        "cmd": [PYTHON, "script4_generate_ad_csvs.py"],
+        "inputs": ["script4_generate_ad_csvs.py", "data/accounts_with_actual_ads.json"],
+        "outputs": ["data/ad_csvs/*.csv"],
+    },
+    "summary_report": {
+        "cmd": [PYTHON, "script5_generate_summary_report.py"],
+        "inputs": ["script5_generate_summary_report.py", "data/accounts_with_actual_ads.json"],
+        "outputs": ["data/ad_summary_report.csv"],
+    },
+    "convert_automotive": {
+        "cmd": [PYTHON, "convert_automotive.py"],
+        "inputs": ["convert_automotive.py", "data/AUTOMOTIVE.csv"],
+        "outputs": ["data/ad_csvs/jacob-reed.csv"],
+        # script4 also writes into ad_csvs; the automotive file must land last
+        "after": ["generate_ad_csvs"],
+    },
+    "analytics_store": {
+        "cmd": [PYTHON, "analytics_store.py", "ingest"],
+        "inputs": ["analytics_store.py", "review_data.py", "staff_dimensions.py", "data/performance_reviews.csv",
+                   "data/verticals.csv", "data/DISTRIBUTION.csv", "data/FINANCE.csv", "data/TECHNOLOGY.csv",
+                   "data/MANUFACTURING.csv", "data/LIFE SCIENCE.csv", "data/ATB *.csv", "data/Month End Ranking - *.csv"],
+        "outputs": ["data/analytics.db"],
+    },
+    "build_data": {
+        "cmd": [PYTHON, "build_data.py"],
+        "cwd": "vanilla-js-app",
+        "inputs": ["vanilla-js-app/build_data.py", "staff_dimensions.py", "review_data.py", "search_index.py",
+                   "string_table.py", "instrumentation.py", "data/performance_reviews.csv", "data/verticals.csv",
+                   "data/ATB Q4.2025-Jan. 2026.csv", "data/best-practices.json", "data/follow-up-questions.json",
+                   "data/ad_csvs/*.csv"],
+        "outputs": ["vanilla-js-app/data.json", "vanilla-js-app/search_index.json"],
+    },
+    "analytics_snapshot": {
+        "cmd": [PYTHON, "analytics_snapshot.py"],
+        "inputs": ["analytics_snapshot.py", "review_data.py", "staff_dimensions.py",
+                   "data/performance_reviews.csv", "data/verticals.csv", "data/best-practices.json",
+                   "data/follow-up-questions.json", "data/ad_csvs/*.csv"],
+        "outputs": ["data/analytics_snapshot.pkl"],
+    },
+    "report": {
+        "cmd": [PYTHON, "generate_report.py"],
+        "inputs": ["generate_report.py", "data/analytics_snapshot.pkl"],
+        "outputs": ["EOY_Report_2025.html"],
+    },
+    "enhanced_report": {
+        "cmd": [PYTHON, "generate_enhanced_report.py"],
+        "inputs": ["generate_enhanced_report.py", "instrumentation.py", "data/analytics_snapshot.pkl"],
+        "outputs": ["EOY_Report_2025_Enhanced.html"],
+    },
+    "scorecards": {
+        "cmd": [PYTHON, "generate_scorecards.py"],
+        "inputs": ["generate_scorecards.py", "instrumentation.py", "data/analytics_snapshot.pkl"],
+        "outputs": ["reports-v2/*-scorecard.html"],
+    },
+    "highlights_report": {
+        "cmd": [PYTHON, "generate_highlights_report.py"],
+        "inputs": ["generate_highlights_report.py", "data/analytics_snapshot.pkl"],
+        "outputs": ["AD_Highlights_Report_2025.html"],
+    },
+    "eoy_tracking_report": {
+        "cmd": [PYTHON, "generate_eoy_tracking_report.py"],
+        "inputs": ["generate_eoy_tracking_report.py", "staff_dimensions.py", "data/analytics_snapshot.pkl"],
+        "outputs": ["EOY_Review_Tracking_Report_2025.html"],
+    },
+    "pdfs": {
+        "cmd": [PYTHON, "generate_pdfs.py"],
+        "inputs": ["generate_pdfs.py", "instrumentation.py", "reports-v2/*-scorecard.html", "EOY_Report_2025.html",
+                   "AD_Highlights_Report_2025.html"],
+        "outputs": ["reports-v2/pdf/*.pdf"],
+    },
+}
+
+
+def patterns_overlap(a, b):
+    """True if two path patterns can name the same file."""
+    return a == b or fnmatch.fnmatch(a, b) or fnmatch.fnmatch(b, a)
+
+
+def build_dependencies(stages):
+    """{stage: set(upstream stages)} from input/output overlap plus explicit "after"."""
+    deps = {}
+    for name, stage in stages.items():
+        upstream = set(stage.get("after", []))
+        for other, other_stage in stages.items():
+            if other == name or name in other_stage.get("after", []):
+                continue
+            if any(patterns_overlap(inp, out) for inp in stage["inputs"] for out in other_stage["outputs"]):
+                upstream.add(other)
+        deps[name] = upstream
+    return deps
+
+
+def select_stages(targets, deps):
+    """Targets plus everything upstream of them."""
+    selected = set()
+    pending = list(targets)
+    while pending:
+        name = pending.pop()
+        if name not in selected:
+            selected.add(name)
+            pending.extend(deps[name])
+    return selected
+
+
+def expand(pattern):
+    if glob.has_magic(pattern):
+        return sorted(glob.glob(str(REPO_DIR / pattern)))
+    path = REPO_DIR / pattern
+    return [str(path)] if path.exists() else []
+
+
+def fingerprint(stage):
+    """Content hash over every input file (names and bytes), or None if an input is missing."""
+    digest = hashlib.sha256()
+    for pattern in stage["inputs"]:
+        paths = expand(pattern)
+        if not paths and not glob.has_magic(pattern):
+            return None
+        for path in paths:
+            digest.update(os.path.relpath(path, REPO_DIR).encode("utf-8"))
+            with open(path, "rb") as f:
+                for chunk in iter(lambda: f.read(1 << 20), b""):
+                    digest.update(chunk)
+    return digest.hexdigest()
+
+
+def outputs_exist(stage):
+    return all(expand(pattern) for pattern in stage["outputs"])
+
+
+def load_state():
+    if STATE_PATH.exists():
+        with open(STATE_PATH, "r", encoding="utf-8") as f:
+            return json.load(f)
+    return {}
+
+
+def save_state(state):
+    STATE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with open(STATE_PATH, "w", encoding="utf-8") as f:
+        json.dump(state, f, indent=2, sort_keys=True)
+
+
+def run_stage(name, stage, log_dir):
+    log_path = log_dir / f"{name}.log"
+    started = time.perf_counter()
+    with open(log_path, "w", encoding="utf-8") as log:
+        proc = subprocess.run(stage["cmd"], cwd=REPO_DIR / stage.get("cwd", "."), stdout=log, stderr=subprocess.STDOUT)
+    return proc.returncode, time.perf_counter() - started, log_path
+
+
+def critical_path(deps, durations):
+    """Longest chain of dependent stage durations (the lower bound on wall time)."""
+    finish = {}
+
+    def finish_time(name):
+        if name not in finish:
+            finish[name] = durations.get(name, 0.0) + max(
+                (finish_time(up) for up in deps[name] if up in durations), default=0.0)
+        return finish[name]
+
+    end = max(durations, key=finish_time, default=None)
+    if end is None:
+        return [], 0.0
+    path = [end]
+    while True:
+        upstream = [up for up in deps[path[-1]] if up in durations]
+        if not upstream:
+            break
+        path.append(max(upstream, key=finish_time))
+    return list(reversed(path)), finish[end]
+
+
+def run_pipeline(targets=None, force=False, jobs=None, dry_run=False, log_dir=None):
+    """Run the selected stages; returns {stage: {"status", "seconds"}}."""
+    deps = build_dependencies(STAGES)
+    selected = select_stages(targets or list(STAGES), deps)
+    deps = {name: deps[name] & selected for name in selected}
+    log_dir = Path(log_dir or REPO_DIR / "data" / "pipeline_logs")
+    if not dry_run:
+        log_dir.mkdir(parents=True, exist_ok=True)
+
+    state = load_state()
+    results = {}
+    running = {}
+    remaining = set(selected)
+
+    def ready():
+        return sorted(name for name in remaining if all(up in results for up in deps[name]))
+
+    with ThreadPoolExecutor(max_workers=jobs or os.cpu_count()) as pool:
+        while remaining or running:
+            for name in ready():
+                remaining.discard(name)
+                stage = STAGES[name]
+                if any(results[up]["status"] in ("failed", "blocked") for up in deps[name]):
+                    results[name] = {"status": "blocked", "seconds": 0.0}
+                    continue
+                if dry_run and any(results[up]["status"] == "would run" for up in deps[name]):
+                    results[name] = {"status": "would run", "seconds": 0.0}
+                    continue
+                digest = fingerprint(stage)
+                if not force and digest and state.get(name) == digest and outputs_exist(stage):
+                    results[name] = {"status": "skipped", "seconds": 0.0}
+                    continue
+                if dry_run:
+                    results[name] = {"status": "would run", "seconds": 0.0}
+                    continue
+                print(f"▶ {name}")
+                running[pool.submit(run_stage, name, stage, log_dir)] = name
+
+            if not running:
+                continue
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                returncode, seconds, log_path = future.result()
+                if returncode == 0:
+                    results[name] = {"status": "ran", "seconds": seconds}
+                    # Fingerprint after the run so inputs written upstream are captured as consumed
+                    state[name] = fingerprint(STAGES[name])
+                    save_state(state)
+                    print(f"✓ {name} ({seconds:.2f}s)")
+                else:
+                    results[name] = {"status": "failed", "seconds": seconds}
+                    state.pop(name, None)
+                    save_state(state)
+                    print(f"✗ {name} failed (exit {returncode}), see {log_path}")
+
+    return results, deps
+
+
+def print_report(results, deps, wall_seconds):
+    print("\nStage                     Status        Time")
+    print("-" * 46)
+    for name in STAGES:
+        if name in results:
+            result = results[name]
+            seconds = f"{result['seconds']:.2f}s" if result["status"] in ("ran", "failed") else "-"
+            print(f"{name:<25} {result['status']:<12} {seconds:>7}")
+
+    durations = {name: r["seconds"] for name, r in results.items() if r["status"] in ("ran", "failed")}
+    path, path_seconds = critical_path(deps, durations)
+    print("-" * 46)
+    print(f"Wall time: {wall_seconds:.2f}s  (sum of stages {sum(durations.values()):.2f}s, "
+          f"critical path {path_seconds:.2f}s)")
+    if path:
+        print(f"Critical path: {' → '.join(path)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the data refresh pipeline.")
+    parser.add_argument("stages", nargs="*",
+                        help=f"Stages to bring up to date (default: all). One of: {', '.join(STAGES)}")
+    parser.add_argument("--force", action="store_true", help="Run stages even if their inputs are unchanged")
+    parser.add_argument("--jobs", type=int, default=None, help="Maximum stages running at once")
+    parser.add_argument("--dry-run", action="store_true", help="Show what would run without running it")
+    args = parser.parse_args()
+    unknown = [name for name in args.stages if name not in STAGES]
+    if unknown:
+        parser.error(f"unknown stage(s): {', '.join(unknown)}")
+
+    started = time.perf_counter()
+    results, deps = run_pipeline(args.stages, force=args.force, jobs=args.jobs, dry_run=args.dry_run)
+    print_report(results, deps, time.perf_counter() - started)
+    if any(r["status"] in ("failed", "blocked") for r in results.values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
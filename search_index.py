@@ -0,0 +1,319 @@
+"""
+Inverted full-text index over review feedback, best practices and follow-up questions.
+
+build_data.py builds the index and writes a compact JSON form next to data.json;
+server.py loads it once and answers /api/search queries from memory.
+
+Query syntax:
+    cost savings        both terms must appear (any order)
+    "cost savings"      exact phrase
+    renew*              prefix match (renewal, renewals, ...)
+"""
+
+import heapq
+import json
+import math
+import os
+import re
+from bisect import bisect_left
+from collections import defaultdict
+
+from string_table import expand_reviews
+
+INDEX_FORMAT_VERSION = 1
+
+# Document kinds
+KIND_REVIEW = "review"
+KIND_BEST_PRACTICE = "bestPractice"
+KIND_FOLLOW_UP = "followUp"
+KINDS = [KIND_REVIEW, KIND_BEST_PRACTICE, KIND_FOLLOW_UP]
+
+BEST_PRACTICE_FIELDS = ["title", "description", "context", "impact", "leadership_endorsement"]
+FOLLOW_UP_FIELDS = ["title", "quote", "action"]
+
+PLACEHOLDER_FEEDBACK = "No feedback provided"
+
+# BM25 parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Upper bound on terms a single prefix expands to
+MAX_PREFIX_EXPANSIONS = 64
+
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+QUERY_RE = re.compile(r'"([^"]*)"|(\S+)')
+
+
+def tokenize(text):
+    """Lowercase word tokens (letters/digits); punctuation splits tokens."""
+    return TOKEN_RE.findall(text.lower()) if text else []
+
+
+class SearchIndexBuilder:
+    """Accumulates documents and produces the serialized index."""
+
+    def __init__(self):
+        self.ads = []
+        self._ad_ids = {}
+        self.sections = []
+        self._section_ids = {}
+        self.docs = []  # [ad_id, kind_id, ref, section_id, length]
+        self.postings = defaultdict(list)  # term -> [(doc_id, [positions])]
+
+    def _intern(self, value, values, ids):
+        if value not in ids:
+            ids[value] = len(values)
+            values.append(value)
+        return ids[value]
+
+    def add(self, ad_name, kind, ref, section, text):
+        tokens = tokenize(text)
+        if not tokens:
+            return
+        doc_id = len(self.docs)
+        self.docs.append([
+            self._intern(ad_name, self.ads, self._ad_ids),
+            KINDS.index(kind),
+            ref,
+            self._intern(section, self.sections, self._section_ids),
+            len(tokens),
+        ])
+        positions = defaultdict(list)
+        for pos, token in enumerate(tokens):
+            positions[token].append(pos)
+        for term, term_positions in positions.items():
+            self.postings[term].append((doc_id, term_positions))
+
+    def to_dict(self):
+        """Compact form: each term maps to a flat int list of
+        [doc_gap, tf, pos_gap * tf, doc_gap, tf, ...] (doc ids and positions delta-encoded)."""
+        terms = {}
+        for term in sorted(self.postings):
+            encoded = []
+            prev_doc = 0
+            for doc_id, positions in self.postings[term]:
+                encoded.append(doc_id - prev_doc)
+                encoded.append(len(positions))
+                prev_pos = 0
+                for pos in positions:
+                    encoded.append(pos - prev_pos)
+                    prev_pos = pos
+                prev_doc = doc_id
+            terms[term] = encoded
+        return {
+            "version": INDEX_FORMAT_VERSION,
+            "kinds": KINDS,
+            "ads": self.ads,
+            "sections": self.sections,
+            "docs": self.docs,
+            "terms": terms,
+        }
+
+
+def build_search_index(account_directors, best_practices, follow_up_questions):
+    """Build the index from the data.json structures.
+
+    Args:
+        account_directors: aggregated AD entries (each with "reviews")
+        best_practices: flattened practice list (bestPractices["practices"])
+        follow_up_questions: {AD: [question, ...]}
+
+    Refs point back into data.json: review index within the AD's reviews,
+    practice index within bestPractices.practices, question index within the AD's list.
+    """
+    builder = SearchIndexBuilder()
+    for ad in account_directors:
+        for review_idx, review in enumerate(ad.get("reviews", [])):
+            for section, feedback in review.get("feedback", {}).items():
+                if feedback and feedback != PLACEHOLDER_FEEDBACK:
+                    builder.add(ad["accountDirector"], KIND_REVIEW, review_idx, section, feedback)
+    for practice_idx, practice in enumerate(best_practices):
+        for field in BEST_PRACTICE_FIELDS:
+            builder.add(practice.get("adName", ""), KIND_BEST_PRACTICE, practice_idx, field, practice.get(field))
+    for ad_name, questions in follow_up_questions.items():
+        for question_idx, question in enumerate(questions if isinstance(questions, list) else []):
+            for field in FOLLOW_UP_FIELDS:
+                builder.add(ad_name, KIND_FOLLOW_UP, question_idx, field, question.get(field))
+    return builder.to_dict()
+
+
+def build_search_index_from_data(data):
+    """Build the index straight from a loaded data.json (either best-practices layout, interned or not)."""
+    data = expand_reviews(data)
+    best_practices = data.get("bestPractices") or {}
+    if isinstance(best_practices.get("practices"), list):
+        practices = best_practices["practices"]
+    else:
+        # data.json built before practices were flattened: same order as the client's flattening
+        practices = [
+            dict(practice, adName=ad_name)
+            for ad_name, ad_practices in best_practices.items() if isinstance(ad_practices, list)
+            for practice in ad_practices
+        ]
+    return build_search_index(data.get("accountDirectors", []), practices, data.get("followUpQuestions") or {})
+
+
+def write_search_index(index_dict, path):
+    """Write the compact index, swapping it in atomically (the server may be reading it)."""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(index_dict, f, ensure_ascii=False, separators=(",", ":"))
+    os.replace(tmp_path, path)
+
+
+class SearchIndex:
+    """In-memory, decoded index answering ranked term/phrase/prefix queries."""
+
+    def __init__(self, index_dict):
+        if index_dict.get("version") != INDEX_FORMAT_VERSION:
+            raise ValueError(f"Unsupported search index version: {index_dict.get('version')}")
+        self.kinds = index_dict["kinds"]
+        self.ads = index_dict["ads"]
+        self.sections = index_dict["sections"]
+        self.docs = index_dict["docs"]
+        self.postings = {term: self._decode(encoded) for term, encoded in index_dict["terms"].items()}
+        self.sorted_terms = sorted(self.postings)
+
+        lengths = [doc[4] for doc in self.docs]
+        self.avg_doc_length = (sum(lengths) / len(lengths)) if lengths else 0.0
+        # Per-document BM25 length normalisation, precomputed so scoring is a lookup
+        self.length_norm = [
+            BM25_K1 * (1 - BM25_B + BM25_B * length / (self.avg_doc_length or 1)) for length in lengths
+        ]
+        self.idf = {
+            term: math.log(1 + (len(self.docs) - len(plist) + 0.5) / (len(plist) + 0.5))
+            for term, plist in self.postings.items()
+        }
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "r", encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    @staticmethod
+    def _decode(encoded):
+        """Decode a flat delta-encoded posting list into {doc_id: (positions...)}."""
+        postings = {}
+        i = 0
+        doc_id = 0
+        while i < len(encoded):
+            doc_id += encoded[i]
+            tf = encoded[i + 1]
+            i += 2
+            positions = []
+            pos = 0
+            for gap in encoded[i:i + tf]:
+                pos += gap
+                positions.append(pos)
+            i += tf
+            postings[doc_id] = tuple(positions)
+        return postings
+
+    def _bm25(self, term, doc_id):
+        tf = len(self.postings[term][doc_id])
+        return self.idf[term] * tf * (BM25_K1 + 1) / (tf + self.length_norm[doc_id])
+
+    def expand_prefix(self, prefix):
+        start = bisect_left(self.sorted_terms, prefix)
+        expanded = []
+        for term in self.sorted_terms[start:start + MAX_PREFIX_EXPANSIONS]:
+            if not term.startswith(prefix):
+                break
+            expanded.append(term)
+        return expanded
+
+    def _match_term(self, term):
+        plist = self.postings.get(term)
+        if not plist:
+            return {}
+        idf = self.idf[term] * (BM25_K1 + 1)
+        length_norm = self.length_norm
+        return {doc_id: idf * len(positions) / (len(positions) + length_norm[doc_id])
+                for doc_id, positions in plist.items()}
+
+    def _match_prefix(self, prefix):
+        scores = defaultdict(float)
+        for term in self.expand_prefix(prefix):
+            for doc_id, score in self._match_term(term).items():
+                scores[doc_id] += score
+        return scores
+
+    def _match_phrase(self, terms):
+        plists = [self.postings.get(term) for term in terms]
+        if not all(plists):
+            return {}
+        # Walk the rarest term's documents, then verify consecutive positions
+        candidates = min(plists, key=len).keys()
+        scores = {}
+        for doc_id in candidates:
+            if not all(doc_id in plist for plist in plists):
+                continue
+            following = [set(plist[doc_id]) for plist in plists[1:]]
+            if any(all(start + offset + 1 in positions for offset, positions in enumerate(following))
+                   for start in plists[0][doc_id]):
+                scores[doc_id] = sum(self._bm25(term, doc_id) for term in terms)
+        return scores
+
+    def parse_query(self, query):
+        """Split a query into clauses: ("phrase", [terms]), ("prefix", p) or ("term", t)."""
+        clauses = []
+        for phrase, word in QUERY_RE.findall(query):
+            if phrase:
+                terms = tokenize(phrase)
+                if len(terms) > 1:
+                    clauses.append(("phrase", terms))
+                elif terms:
+                    clauses.append(("term", terms[0]))
+            elif word.endswith("*"):
+                # "cost-sav*": leading tokens are whole terms, only the last is a prefix
+                terms = tokenize(word[:-1])
+                clauses.extend(("term", t) for t in terms[:-1])
+                clauses.extend(("prefix", t) for t in terms[-1:])
+            else:
+                clauses.extend(("term", t) for t in tokenize(word))
+        return clauses
+
+    def search(self, query, limit=20, kind=None, ad_name=None):
+        """Return (total_matches, ranked hits). All clauses must match (AND)."""
+        clauses = self.parse_query(query)
+        if not clauses:
+            return 0, []
+
+        combined = None
+        for clause_type, value in clauses:
+            if clause_type == "phrase":
+                scores = self._match_phrase(value)
+            elif clause_type == "prefix":
+                scores = self._match_prefix(value)
+            else:
+                scores = self._match_term(value)
+            if combined is None:
+                combined = dict(scores)
+            else:
+                combined = {doc_id: combined[doc_id] + score for doc_id, score in scores.items() if doc_id in combined}
+            if not combined:
+                return 0, []
+
+        if (kind and kind not in self.kinds) or (ad_name and ad_name not in self.ads):
+            return 0, []
+        kind_id = self.kinds.index(kind) if kind else None
+        ad_id = self.ads.index(ad_name) if ad_name else None
+        if kind_id is not None or ad_id is not None:
+            combined = {
+                doc_id: score for doc_id, score in combined.items()
+                if (kind_id is None or self.docs[doc_id][1] == kind_id)
+                and (ad_id is None or self.docs[doc_id][0] == ad_id)
+            }
+
+        ranked = heapq.nsmallest(limit, combined.items(), key=lambda item: (-item[1], item[0]))
+        hits = []
+        for doc_id, score in ranked:
+            ad_idx, kind_idx, ref, section_idx, _ = self.docs[doc_id]
+            hits.append({
+                "accountDirector": self.ads[ad_idx],
+                "kind": self.kinds[kind_idx],
+                "ref": ref,
+                "section": self.sections[section_idx],
+                "score": round(score, 4),
+            })
+        return len(combined), hits
@@ -1,23 +1,477 @@
 """
 Simple Flask server to serve the Vanilla JS dashboard on Heroku.
+
+`python server.py` runs Flask's development server. In production the Procfile runs
+gunicorn with gunicorn.conf.py, which sets PRELOAD_ASSETS=1: every static file under
+vanilla-js-app/ is read into memory once at startup (plus a gzip copy of text assets)
+and served with ETags, so requests never touch the filesystem.
+
+data.json is always served from memory: `dataset` holds the parsed current build and a
+background thread swaps in a new one when build_data.py rewrites the file, with no restart.
 """
-from flask import Flask, send_from_directory
+from flask import Flask, Response, abort, g, jsonify, request, send_from_directory
+import gzip
+import hashlib
+import json
+import mimetypes
 import os
+import threading
+import time
+import weakref
+
+from search_index import SearchIndex, build_search_index_from_data
+from server_metrics import RequestMetrics
 
 app = Flask(__name__, static_folder='vanilla-js-app')
 
+APP_DIR = 'vanilla-js-app'
+DATA_JSON_PATH = os.path.join(APP_DIR, 'data.json')
+SEARCH_INDEX_PATH = os.path.join(APP_DIR, 'search_index.json')
+DELTAS_DIR = os.path.join(APP_DIR, 'deltas')
+MAX_SEARCH_RESULTS = 100
+# Longest delta chain /data/delta will walk (build_data.py keeps DELTA_HISTORY = 20)
+MAX_DELTA_CHAIN = 50
+
+# How often each worker checks data.json for a new build
+DATASET_POLL_SECONDS = 1.0
+
+# build_data.py rewrites these while the server runs, so they are never preloaded
+GENERATED_FILES = {'data.json', 'search_index.json', 'data-version.json'}
+GENERATED_DIRS = {'deltas'}
+PRELOAD_ASSETS = os.environ.get('PRELOAD_ASSETS') == '1'
+GZIP_MIN_BYTES = 1024
+COMPRESSIBLE_TYPES = ('text/', 'application/javascript', 'application/json', 'image/svg+xml')
+
+# Routes serving cacheable bodies; their responses are counted as 304 / compressed / full
+CACHEABLE_ROUTES = {'/', '/<path:path>', '/data.json', '/api/version', '/api/data/<shard>'}
+
+# Some platforms (notably Windows registries) map .js to text/plain
+mimetypes.add_type('application/javascript', '.js')
+mimetypes.add_type('application/json', '.json')
+
+_assets = None
+_started_at = time.time()
+metrics = RequestMetrics(os.environ.get('METRICS_DIR'))
+
+_deltas = {}  # version -> patch; a version's delta never changes once written
+
+_search_index = None
+_search_index_mtime = None
+_search_index_lock = threading.Lock()
+
+def _mtime_ns(path):
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _file_stamp(path):
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def make_asset(body, mimetype):
+    """In-memory response body plus its gzip copy (for text types over GZIP_MIN_BYTES) and ETag."""
+    compressed = None
+    if len(body) >= GZIP_MIN_BYTES and mimetype.startswith(COMPRESSIBLE_TYPES):
+        compressed = gzip.compress(body, compresslevel=9, mtime=0)
+    return {
+        'body': body,
+        'gzip': compressed,
+        'mimetype': mimetype,
+        'etag': hashlib.sha256(body).hexdigest()[:16],
+    }
+
+
+def load_asset_cache(root=APP_DIR):
+    """Read every static file under root into {relative path: asset dict}."""
+    assets = {}
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if not d.startswith('.') and d != '__pycache__'
+                       and not (dirpath == root and d in GENERATED_DIRS)]
+        for name in filenames:
+            path = os.path.join(dirpath, name)
+            rel_path = os.path.relpath(path, root).replace(os.sep, '/')
+            if rel_path in GENERATED_FILES or name.endswith('.tmp'):
+                continue
+            with open(path, 'rb') as f:
+                body = f.read()
+            assets[rel_path] = make_asset(body, mimetypes.guess_type(name)[0] or 'application/octet-stream')
+    return assets
+
+
+def asset_response(asset):
+    """Serve an in-memory asset, gzipped when the client accepts it; 304 on a matching ETag."""
+    use_gzip = asset['gzip'] is not None and 'gzip' in request.accept_encodings
+    response = Response(asset['gzip'] if use_gzip else asset['body'], mimetype=asset['mimetype'])
+    if use_gzip:
+        response.headers['Content-Encoding'] = 'gzip'
+    if asset['gzip'] is not None:
+        response.vary.add('Accept-Encoding')
+    response.set_etag(asset['etag'] + ('-gz' if use_gzip else ''))
+    response.headers['Cache-Control'] = 'no-cache'
+    return response.make_conditional(request)
+
+
+def serve_asset(path):
+    asset = _assets.get(path)
+    if asset is None:
+        abort(404)
+    return asset_response(asset)
+
+
+class DataSnapshot:
+    """One parsed build of data.json. Replaced as a whole by Dataset; the contents are never mutated."""
+
+    def __init__(self, raw, stamp):
+        self.stamp = stamp
+        self.loaded_at = time.time()
+        self.data = json.loads(raw)
+        # Same hash build_data.py puts in data-version.json
+        self.version = hashlib.sha256(raw).hexdigest()[:16]
+        self.asset = make_asset(raw, 'application/json')
+        # Each top-level section serialized and compressed once; its ETag is the manifest's shard hash
+        self.shards = {
+            name: make_asset(json.dumps(value, sort_keys=True, ensure_ascii=False).encode('utf-8'),
+                             'application/json')
+            for name, value in self.data.items()
+        }
+        self.manifest = {
+            'version': self.version,
+            'builtAt': self.data.get('metadata', {}).get('lastUpdated'),
+            'shards': {name: asset['etag'] for name, asset in self.shards.items()},
+        }
+
+
+class Dataset:
+    """Holds the current DataSnapshot and swaps in new builds of data.json without downtime.
+
+    Requests read `dataset.snapshot` once and use only that object, so a swap mid-request
+    never mixes two builds. A background thread (one per worker process, started on first
+    use) polls the file and parses a new build off the request path. It will not parse
+    another build while the previously retired snapshot is still referenced by an
+    in-flight request, so at most two snapshots are alive.
+    """
+
+    def __init__(self, path, poll_seconds):
+        self.path = path
+        self.poll_seconds = poll_seconds
+        self._snapshot = None
+        self._retired = None  # weakref to the snapshot replaced by the last swap
+        self._failed_stamp = None  # file stamp that last failed to parse; not retried until it changes
+        self._lock = threading.Lock()
+        self._watcher_pid = None
+        self.reloads = 0
+        self.reload_failures = 0
+
+    @property
+    def snapshot(self):
+        self._ensure_watcher()
+        if self._snapshot is None:
+            with self._lock:
+                if self._snapshot is None:
+                    self._snapshot = self._load()
+        return self._snapshot
+
+    def preload(self):
+        """Load the current build now (before gunicorn forks) without starting the watcher."""
+        with self._lock:
+            self._snapshot = self._load()
+
+    def _load(self):
+        stamp = _file_stamp(self.path)
+        with open(self.path, 'rb') as f:
+            raw = f.read()
+        return DataSnapshot(raw, stamp)
+
+    def reload_if_changed(self):
+        """Parse and swap in data.json if it changed. Returns True when a new version went live."""
+        with self._lock:
+            current = self._snapshot
+            stamp = _file_stamp(self.path)
+            if (current is not None and stamp == current.stamp) or stamp == self._failed_stamp:
+                return False
+            if self._retired is not None and self._retired() is not None:
+                return False  # the previous snapshot is still in use; try again next poll
+            try:
+                snapshot = self._load()
+            except ValueError:
+                self._failed_stamp = stamp
+                raise
+            if current is not None and snapshot.version == current.version:
+                current.stamp = snapshot.stamp  # touched but not changed
+                return False
+            self._retired = weakref.ref(current) if current is not None else None
+            self._snapshot = snapshot
+            self.reloads += 1
+            return True
+
+    def start_watcher(self):
+        """Start this process's reload thread (gunicorn.conf.py calls this in each worker)."""
+        self._ensure_watcher()
+
+    def _ensure_watcher(self):
+        # Threads don't survive gunicorn's fork, so each worker starts its own
+        if self._watcher_pid == os.getpid():
+            return
+        with self._lock:
+            if self._watcher_pid != os.getpid():
+                self._watcher_pid = os.getpid()
+                threading.Thread(target=self._watch, name='dataset-reload', daemon=True).start()
+
+    def _watch(self):
+        while True:
+            try:
+                if self.reload_if_changed():
+                    app.logger.info('Loaded data.json version %s', self._snapshot.version)
+            except (OSError, ValueError) as e:
+                # Missing or half-written file: keep serving the current snapshot
+                self.reload_failures += 1
+                app.logger.warning('data.json reload failed: %s', e)
+            time.sleep(self.poll_seconds)
+
+
+dataset = Dataset(DATA_JSON_PATH, DATASET_POLL_SECONDS)
+
+
+def load_delta(version):
+    """The patch build_data.py wrote for `version` (deltas/<version>.json), or None."""
+    patch = _deltas.get(version)
+    if patch is None:
+        try:
+            with open(os.path.join(DELTAS_DIR, f'{os.path.basename(version)}.json'), 'r', encoding='utf-8') as f:
+                patch = json.load(f)
+        except (OSError, ValueError):
+            return None
+        _deltas[version] = patch
+    return patch
+
+
+def delta_chain(since, target):
+    """Patches leading from build `since` to build `target`, oldest first; None if the chain is broken."""
+    patches = []
+    version = target
+    while version != since:
+        if len(patches) >= MAX_DELTA_CHAIN:
+            return None
+        patch = load_delta(version)
+        if patch is None:
+            return None
+        patches.append(patch)
+        version = patch['from']
+    patches.reverse()
+    return patches
+
+
+def load_search_index():
+    """Load the prebuilt search index, or build it from data.json if it is missing or older."""
+    if (os.path.exists(SEARCH_INDEX_PATH)
+            and os.path.getmtime(SEARCH_INDEX_PATH) >= os.path.getmtime(DATA_JSON_PATH)):
+        return SearchIndex.load(SEARCH_INDEX_PATH)
+    return SearchIndex(build_search_index_from_data(dataset.snapshot.data))
+
+
+def get_search_index():
+    """Return the in-memory search index, (re)loading it on first use or after a rebuild."""
+    global _search_index, _search_index_mtime
+    mtime = (_mtime_ns(SEARCH_INDEX_PATH), _mtime_ns(DATA_JSON_PATH))
+    if _search_index is None or _search_index_mtime != mtime:
+        with _search_index_lock:
+            if _search_index is None or _search_index_mtime != mtime:
+                _search_index = load_search_index()
+                _search_index_mtime = mtime
+    return _search_index
+
+
+@app.before_request
+def start_timer():
+    g.request_started = time.perf_counter()
+
+
+@app.after_request
+def record_metrics(response):
+    started = g.pop('request_started', None)
+    if started is None:
+        return response
+    route = request.url_rule.rule if request.url_rule else 'unmatched'
+    cache_result = None
+    if route in CACHEABLE_ROUTES and response.status_code in (200, 304):
+        if response.status_code == 304:
+            cache_result = 'not_modified'
+        elif response.headers.get('Content-Encoding') == 'gzip':
+            cache_result = 'compressed'
+        else:
+            cache_result = 'full'
+    size = None if response.is_streamed else response.calculate_content_length()
+    metrics.observe(route, request.method, response.status_code,
+                    time.perf_counter() - started, size, cache_result)
+    return response
+
+
+def dataset_metric_lines():
+    """Gauges for the answering worker's data.json snapshot and asset cache."""
+    lines = [
+        '# HELP dashboard_process_start_time_seconds Start time of the answering worker.',
+        '# TYPE dashboard_process_start_time_seconds gauge',
+        f'dashboard_process_start_time_seconds {_started_at:.3f}',
+        '# HELP dashboard_dataset_reloads_total data.json builds swapped in by the answering worker.',
+        '# TYPE dashboard_dataset_reloads_total counter',
+        f'dashboard_dataset_reloads_total {dataset.reloads}',
+        '# HELP dashboard_dataset_reload_failures_total data.json reloads that failed to parse.',
+        '# TYPE dashboard_dataset_reload_failures_total counter',
+        f'dashboard_dataset_reload_failures_total {dataset.reload_failures}',
+    ]
+    snapshot = dataset._snapshot
+    if snapshot is not None:
+        lines += [
+            '# HELP dashboard_dataset_info Version of the data.json snapshot being served.',
+            '# TYPE dashboard_dataset_info gauge',
+            'dashboard_dataset_info{version="%s",built_at="%s"} 1' % (
+                snapshot.version, snapshot.manifest['builtAt'] or ''),
+            '# HELP dashboard_dataset_loaded_timestamp_seconds When the current snapshot went live.',
+            '# TYPE dashboard_dataset_loaded_timestamp_seconds gauge',
+            f'dashboard_dataset_loaded_timestamp_seconds {snapshot.loaded_at:.3f}',
+            '# HELP dashboard_dataset_size_bytes Size of the current data.json.',
+            '# TYPE dashboard_dataset_size_bytes gauge',
+            f'dashboard_dataset_size_bytes {len(snapshot.asset["body"])}',
+        ]
+    if _assets is not None:
+        lines += [
+            '# HELP dashboard_asset_cache_bytes Preloaded static files (uncompressed).',
+            '# TYPE dashboard_asset_cache_bytes gauge',
+            f'dashboard_asset_cache_bytes {sum(len(asset["body"]) for asset in _assets.values())}',
+            '# HELP dashboard_asset_cache_files Number of preloaded static files.',
+            '# TYPE dashboard_asset_cache_files gauge',
+            f'dashboard_asset_cache_files {len(_assets)}',
+        ]
+    return lines
+
+
+@app.route('/metrics')
+def metrics_endpoint():
+    """Prometheus text-format metrics (request counts, latency/size histograms, cache outcomes, dataset)."""
+    body = '\n'.join(metrics.render() + dataset_metric_lines()) + '\n'
+    return Response(body, mimetype='text/plain; version=0.0.4')
+
 @app.route('/')
 def index():
     """Serve the main index.html"""
+    if _assets is not None:
+        return serve_asset('index.html')
     return send_from_directory('vanilla-js-app', 'index.html')
 
+@app.route('/api/search')
+def search():
+    """Ranked full-text search over review feedback, best practices and follow-ups.
+
+    Query params: q (terms, "phrases", prefix*), limit, kind (review/bestPractice/followUp), ad
+    """
+    query = request.args.get('q', '').strip()
+    try:
+        limit = max(1, min(int(request.args.get('limit', 20)), MAX_SEARCH_RESULTS))
+    except ValueError:
+        return jsonify({'error': 'limit must be an integer'}), 400
+
+    try:
+        search_index = get_search_index()
+    except (OSError, ValueError) as e:
+        return jsonify({'error': f'Search index unavailable: {e}'}), 503
+
+    started = time.perf_counter()
+    total, results = search_index.search(
+        query, limit=limit, kind=request.args.get('kind'), ad_name=request.args.get('ad')
+    )
+    return jsonify({
+        'query': query,
+        'total': total,
+        'results': results,
+        'tookMs': round((time.perf_counter() - started) * 1000, 3)
+    })
+
+@app.route('/api/accounts')
+def accounts():
+    """Latest (or ?month=YYYY-MM) KPIs for each account owned by ?ad=, from the analytics store."""
+    ad_name = request.args.get('ad', '').strip()
+    if not ad_name:
+        return jsonify({'error': 'ad is required'}), 400
+    # Imported here: analytics_store needs pandas, which the web dyno doesn't install
+    try:
+        from analytics_store import accounts_for_ad, connect
+        conn = connect()
+    except (ImportError, FileNotFoundError) as e:
+        return jsonify({'error': f'Analytics store unavailable: {e}'}), 503
+    try:
+        rows = accounts_for_ad(conn, ad_name, month=request.args.get('month'))
+    finally:
+        conn.close()
+    return jsonify({'accountDirector': ad_name, 'accounts': rows})
+
+@app.route('/api/version')
+def version():
+    """Current data version, build time and per-shard content hashes.
+
+    Dashboards poll this; the ETag is the data version, so an unchanged build costs a 304.
+    """
+    try:
+        manifest = dataset.snapshot.manifest
+    except (OSError, ValueError) as e:
+        return jsonify({'error': f'Data unavailable: {e}'}), 503
+    response = jsonify(manifest)
+    response.headers['Cache-Control'] = 'no-cache'
+    response.set_etag(str(manifest['version']))
+    return response.make_conditional(request)
+
+@app.route('/api/data/<shard>')
+def data_shard(shard):
+    """One top-level section of data.json, so clients refetch only what changed."""
+    try:
+        shards = dataset.snapshot.shards
+    except (OSError, ValueError) as e:
+        return jsonify({'error': f'Data unavailable: {e}'}), 503
+    if shard not in shards:
+        return jsonify({'error': f'Unknown shard: {shard}'}), 404
+    return asset_response(shards[shard])
+
+@app.route('/data/delta')
+def data_delta():
+    """Patches from ?since=<version> to the data.json being served; 410 if the client must refetch."""
+    since = request.args.get('since', '').strip()
+    if not since:
+        return jsonify({'error': 'since is required'}), 400
+    try:
+        target = dataset.snapshot.version
+    except (OSError, ValueError) as e:
+        return jsonify({'error': f'Data unavailable: {e}'}), 503
+    patches = delta_chain(since, target)
+    if patches is None:
+        return jsonify({'error': f'No delta from {since}; fetch data.json', 'to': target}), 410
+    response = jsonify({'from': since, 'to': target, 'patches': patches})
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
+
+@app.route('/data.json')
+def data_json():
+    """The current data.json snapshot from memory (swapped in by the reload thread)."""
+    try:
+        snapshot = dataset.snapshot
+    except (OSError, ValueError) as e:
+        return jsonify({'error': f'Data unavailable: {e}'}), 503
+    return asset_response(snapshot.asset)
+
 @app.route('/<path:path>')
 def serve_file(path):
     """Serve all other static files (JS, CSS, JSON, etc.)"""
+    if _assets is not None and path not in GENERATED_FILES:
+        return serve_asset(path)
     return send_from_directory('vanilla-js-app', path)
 
+if PRELOAD_ASSETS:
+    _assets = load_asset_cache()
+    if os.path.exists(DATA_JSON_PATH):
+        dataset.preload()
+
 if __name__ == '__main__':
     # Get port from environment variable (Heroku sets this)
     port = int(os.environ.get('PORT', 5847))
     app.run(host='0.0.0.0', port=port, debug=False)
-
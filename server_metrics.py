@@ -0,0 +1,178 @@
+"""
+In-process request metrics for server.py, exposed at /metrics in the Prometheus text format.
+
+Each request costs a lock, a few dict updates and two bisects. Recorded per route rule
+(e.g. "/api/search", "/<path:path>") so label cardinality stays fixed:
+
+    dashboard_http_requests_total{route,method,status}
+    dashboard_http_request_duration_seconds{route}   histogram
+    dashboard_http_response_size_bytes{route}        histogram (streamed responses excluded)
+    dashboard_http_cache_responses_total{route,result}   result = not_modified | compressed | full
+
+Under gunicorn every worker has its own counters. When METRICS_DIR is set (gunicorn.conf.py
+does this) each worker writes its totals to METRICS_DIR/<pid>.json every few seconds, and
+/metrics sums all files, so a scrape covers every worker no matter which one answers it.
+Files of exited workers are kept, so counters never go backwards.
+"""
+
+import bisect
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+LATENCY_BUCKETS = [0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0]
+SIZE_BUCKETS = [256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304]
+
+FLUSH_SECONDS = 5.0
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _labels(**labels):
+    return '{' + ','.join(f'{key}="{_escape(value)}"' for key, value in labels.items()) + '}'
+
+
+class RequestMetrics:
+    """Counters and histograms for one process, mergeable across gunicorn workers."""
+
+    def __init__(self, directory=None, flush_seconds=FLUSH_SECONDS):
+        self.directory = Path(directory) if directory else None
+        self.flush_seconds = flush_seconds
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()  # one writer per process: scrapes race the flusher thread
+        self._flusher_pid = None
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.requests = {}  # "route\tmethod\tstatus" -> count
+            self.cache = {}     # "route\tresult" -> count
+            self.latency = {}   # route -> {"buckets": [...], "sum": s, "count": n}
+            self.sizes = {}
+
+    @staticmethod
+    def _observe(histograms, route, bounds, value):
+        hist = histograms.get(route)
+        if hist is None:
+            hist = histograms[route] = {'buckets': [0] * (len(bounds) + 1), 'sum': 0.0, 'count': 0}
+        hist['buckets'][bisect.bisect_left(bounds, value)] += 1
+        hist['sum'] += value
+        hist['count'] += 1
+
+    def observe(self, route, method, status, seconds, size=None, cache_result=None):
+        """Record one finished request. size=None for streamed responses."""
+        self._ensure_flusher()
+        with self._lock:
+            key = f'{route}\t{method}\t{status}'
+            self.requests[key] = self.requests.get(key, 0) + 1
+            if cache_result:
+                key = f'{route}\t{cache_result}'
+                self.cache[key] = self.cache.get(key, 0) + 1
+            self._observe(self.latency, route, LATENCY_BUCKETS, seconds)
+            if size is not None:
+                self._observe(self.sizes, route, SIZE_BUCKETS, size)
+
+    def state(self):
+        with self._lock:
+            return json.loads(json.dumps({
+                'requests': self.requests, 'cache': self.cache,
+                'latency': self.latency, 'sizes': self.sizes,
+            }))
+
+    def flush(self):
+        """Write this process's totals to METRICS_DIR/<pid>.json (no-op without a directory)."""
+        if self.directory is None:
+            return
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.directory / f'{os.getpid()}.json'
+        tmp_path = self.directory / f'{os.getpid()}.{threading.get_ident()}.tmp'
+        with self._flush_lock:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.state(), f)
+            os.replace(tmp_path, path)
+
+    def _ensure_flusher(self):
+        if self.directory is None or self._flusher_pid == os.getpid():
+            return
+        with self._lock:
+            if self._flusher_pid != os.getpid():
+                self._flusher_pid = os.getpid()
+                threading.Thread(target=self._flush_loop, name='metrics-flush', daemon=True).start()
+
+    def _flush_loop(self):
+        while True:
+            time.sleep(self.flush_seconds)
+            try:
+                self.flush()
+            except OSError:
+                pass  # metrics must never take the server down
+
+    def collect(self):
+        """Totals across all workers: this process live, the others as of their last flush."""
+        if self.directory is None:
+            return self.state()
+        try:
+            self.flush()
+        except OSError:
+            pass  # serve the other workers' totals and this one's last flush
+        merged = {'requests': {}, 'cache': {}, 'latency': {}, 'sizes': {}}
+        for path in sorted(self.directory.glob('*.json')):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    state = json.load(f)
+            except (OSError, ValueError):
+                continue
+            for name in ('requests', 'cache'):
+                for key, count in state[name].items():
+                    merged[name][key] = merged[name].get(key, 0) + count
+            for name in ('latency', 'sizes'):
+                for route, hist in state[name].items():
+                    total = merged[name].setdefault(
+                        route, {'buckets': [0] * len(hist['buckets']), 'sum': 0.0, 'count': 0})
+                    total['buckets'] = [a + b for a, b in zip(total['buckets'], hist['buckets'])]
+                    total['sum'] += hist['sum']
+                    total['count'] += hist['count']
+        return merged
+
+    def render(self):
+        """Prometheus text exposition of the merged totals."""
+        state = self.collect()
+        lines = [
+            '# HELP dashboard_http_requests_total Requests by route, method and status.',
+            '# TYPE dashboard_http_requests_total counter',
+        ]
+        for key, count in sorted(state['requests'].items()):
+            route, method, status = key.split('\t')
+            lines.append(f'dashboard_http_requests_total{_labels(route=route, method=method, status=status)} {count}')
+
+        lines += [
+            '# HELP dashboard_http_cache_responses_total Static/data responses by cache outcome.',
+            '# TYPE dashboard_http_cache_responses_total counter',
+        ]
+        for key, count in sorted(state['cache'].items()):
+            route, result = key.split('\t')
+            lines.append(f'dashboard_http_cache_responses_total{_labels(route=route, result=result)} {count}')
+
+        lines += self._render_histogram(
+            'dashboard_http_request_duration_seconds', 'Time to produce the response.',
+            state['latency'], LATENCY_BUCKETS)
+        lines += self._render_histogram(
+            'dashboard_http_response_size_bytes', 'Response body size as sent (after compression).',
+            state['sizes'], SIZE_BUCKETS)
+        return lines
+
+    @staticmethod
+    def _render_histogram(name, help_text, histograms, bounds):
+        lines = [f'# HELP {name} {help_text}', f'# TYPE {name} histogram']
+        for route, hist in sorted(histograms.items()):
+            cumulative = 0
+            for bound, count in zip(bounds + ['+Inf'], hist['buckets']):
+                cumulative += count
+                lines.append(f'{name}_bucket{_labels(route=route, le=bound)} {cumulative}')
+            lines.append(f'{name}_sum{_labels(route=route)} {hist["sum"]:.6f}')
+            lines.append(f'{name}_count{_labels(route=route)} {hist["count"]}')
+        return lines
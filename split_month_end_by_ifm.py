@@ -12,7 +12,6 @@ from collections import defaultdict
 
 INPUT_CSV = Path("data/Month End Ranking - January 2026.csv")
 OUTPUT_DIR = Path("data/month_end_by_ifm")
-OUTPUT_DIR.mkdir(exist_ok=True)
 
 
 def parse_row_label(label: str) -> tuple[str | None, str | None, str | None]:
@@ -50,8 +49,12 @@ def has_rv_value(val: str) -> bool:
     return bool(re.search(r'[\d\(\)]', v))
 
 
-def main():
-    with open(INPUT_CSV, encoding="utf-8", newline="") as f:
+def read_month_end_by_ifm(csv_path=INPUT_CSV):
+    """
+    Read a Month End Ranking CSV in one pass.
+    Returns (header_row, {ifm: [record, ...]}) with records in file order.
+    """
+    with open(csv_path, encoding="utf-8", newline="") as f:
         reader = csv.reader(f)
         rows = list(reader)
 
@@ -88,6 +91,13 @@ def main():
             "data_cols": row[1:],  # all columns after row label
         })
 
+    return header_row, by_ifm
+
+
+def main():
+    header_row, by_ifm = read_month_end_by_ifm(INPUT_CSV)
+    OUTPUT_DIR.mkdir(exist_ok=True)
+
     # Write separate CSVs per IFM
     header_cols = ["IFM", "Account", "Account Owner"] + header_row[1:]
     written = []
@@ -0,0 +1,109 @@
+"""
+Shared staff dimension table (Vertical, Tier, Role, Scorecard) from data/verticals.csv.
+Used by both the Streamlit dashboard and the vanilla JS data build so the file is
+parsed once, typed, and joined to per-AD aggregates by index alignment.
+
+canonical_ad_name() maps the AD spellings found in review exports, finance files and
+Month End Ranking owners to the verticals.csv name; it is the one alias table every
+loader should use.
+"""
+
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Optional
+
+import pandas as pd
+
+DEFAULT_VERTICALS_PATH = Path(__file__).resolve().parent / "data" / "verticals.csv"
+
+CATEGORICAL_COLUMNS = ["Vertical", "Tier", "Role"]
+
+# Defaults used when a staff row leaves a field blank (matches the JSON build)
+DIMENSION_DEFAULTS = {"Vertical": "N/A", "Tier": "", "Role": "Account Director"}
+
+# Spelling variants -> names as they appear in verticals.csv
+AD_NAME_ALIASES = {
+    "Logan Newman's": "Logan Newman",
+    "Dave Pergola": "David Pergola",
+    "Pergola, David": "David Pergola",
+    "Greg DeMedio": "Gregory DeMedio",
+    "Greg Demedio": "Gregory DeMedio",
+    "Gregory Demedio": "Gregory DeMedio",
+    "Nick Trenkamp": "Nicholas Trenkamp",
+    "Nike Trenkamp": "Nicholas Trenkamp",
+    "Ayesha Nasi": "Ayesha Nasir",
+    "Gisell Langelier": "Giselle Langelier",
+    "Collen Doles": "Colleen Doles",
+    "Michael Barry": "Mike Barry",
+    "Josh Grady": "Joshua Grady",
+    "Jen Segovia": "Jennifer Segovia",
+    "Sid Shah": "Siddarth Shah",
+    "Peggy McElwee": "Peggy Shum",
+}
+
+
+def canonical_ad_name(name: Optional[str]) -> Optional[str]:
+    """Strip whitespace/ellipses and map known spelling variants to the verticals.csv name."""
+    if name is None:
+        return None
+    cleaned = str(name).strip().rstrip(".").strip()
+    return AD_NAME_ALIASES.get(cleaned, cleaned)
+
+
+@lru_cache(maxsize=4)
+def _load_dimension_table(path: str, mtime_ns: int) -> pd.DataFrame:
+    df = pd.read_csv(path, dtype=str, keep_default_na=False)
+    df.columns = [col.strip() for col in df.columns]
+
+    for col in ["Account Director"] + CATEGORICAL_COLUMNS:
+        if col not in df.columns:
+            df[col] = ""
+        df[col] = df[col].str.strip()
+
+    df = df[df["Account Director"] != ""]
+    # Later rows win, as with the old dict-based loaders
+    df = df.drop_duplicates(subset="Account Director", keep="last").set_index("Account Director")
+
+    if "Scorecard" in df.columns:
+        df["Scorecard"] = pd.to_numeric(df["Scorecard"], errors="coerce").astype("float32")
+    else:
+        df["Scorecard"] = pd.Series(float("nan"), index=df.index, dtype="float32")
+
+    for col in CATEGORICAL_COLUMNS:
+        df[col] = df[col].replace("", pd.NA).astype("category")
+
+    return df[CATEGORICAL_COLUMNS + ["Scorecard"]]
+
+
+def load_dimension_table(path=DEFAULT_VERTICALS_PATH, name_map: Optional[Dict[str, str]] = None) -> pd.DataFrame:
+    """
+    Load the staff dimension table, indexed by Account Director.
+
+    The parsed table is cached per (path, mtime), so repeated calls are free until the
+    file changes. Vertical/Tier/Role are categoricals (blank -> missing) and Scorecard is
+    float32. Callers must treat the returned frame as read-only.
+
+    Args:
+        path: Location of verticals.csv
+        name_map: Optional alias -> canonical AD name mapping applied to the index
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+    """
+    path = str(path)
+    table = _load_dimension_table(path, os.stat(path).st_mtime_ns)
+    if name_map:
+        table = table.rename(index=lambda name: name_map.get(name, name))
+        table = table[~table.index.duplicated(keep="last")]
+    return table
+
+
+def dimension_records(table: pd.DataFrame) -> Dict[str, Dict[str, str]]:
+    """
+    Convert the dimension table into {AD: {"vertical", "tier", "role"}} with blanks
+    filled from DIMENSION_DEFAULTS (the shape data.json expects).
+    """
+    filled = table[CATEGORICAL_COLUMNS].astype(object).fillna(DIMENSION_DEFAULTS)
+    filled.columns = [col.lower() for col in CATEGORICAL_COLUMNS]
+    return filled.to_dict("index")
@@ -3,10 +3,14 @@ Executive Performance Dashboard for Account Directors
 A modern, executive-facing dashboard for year-end performance reviews.
 """
 
+import os
 import streamlit as st
 import pandas as pd
 from data_processor import (
     prepare_dashboard_data,
+    build_leaderboard_index,
+    build_review_index,
+    get_file_signature,
     get_filter_options,
     get_individual_reviews,
     SCORING_SECTIONS,
@@ -253,12 +257,25 @@ def init_session_state():
         st.session_state.navigate_to_reviews = False
     if 'active_tab' not in st.session_state:
         st.session_state.active_tab = 0
+    if 'leaderboard_page' not in st.session_state:
+        st.session_state.leaderboard_page = 0
 
 
-# Load data with caching
-@st.cache_data
-def load_data():
-    return prepare_dashboard_data()
+# Data source and cache lifetime (seconds); override via environment for deployments
+DATA_CSV_PATH = os.environ.get("DASHBOARD_DATA_CSV", "data/performance_reviews.csv")
+DATA_CACHE_TTL = int(os.environ.get("DASHBOARD_CACHE_TTL", 3600))
+
+
+# Load data with caching. cache_resource keeps a single parsed copy shared by every
+# session (no per-rerun pickling); mtime and content hash are part of the key, so a
+# changed CSV is picked up on the next rerun without a manual cache clear.
+# Callers must treat the returned frames as read-only.
+@st.cache_resource(ttl=DATA_CACHE_TTL, max_entries=2, show_spinner="Loading review data...")
+def load_data(csv_path: str, mtime_ns: int, content_hash: str):
+    aggregated_df, structured_df, rubric_data = prepare_dashboard_data(csv_path)
+    review_index = build_review_index(structured_df)
+    leaderboard_index = build_leaderboard_index(aggregated_df)
+    return aggregated_df, structured_df, rubric_data, review_index, leaderboard_index
 
 
 def main():
@@ -269,7 +286,8 @@ def main():
     init_session_state()
     
     # Load data
-    aggregated_df, structured_df, rubric_data = load_data()
+    mtime_ns, content_hash = get_file_signature(DATA_CSV_PATH)
+    aggregated_df, structured_df, rubric_data, review_index, leaderboard_index = load_data(DATA_CSV_PATH, mtime_ns, content_hash)
     filter_options = get_filter_options(aggregated_df)
     
     # ===== SIDEBAR VIEW SELECTOR =====
@@ -309,12 +327,12 @@ def main():
     # Render the selected view
     if selected_view == "🏆 Rankings & Performance":
         from components.rankings_table import render_rankings_view
-        render_rankings_view(aggregated_df, structured_df, filter_options)
+        render_rankings_view(aggregated_df, structured_df, filter_options, leaderboard_index)
     
     elif selected_view == "📝 Individual Reviews":
         from components.individual_reviews import render_individual_reviews_page
         preselected_ad = st.session_state.get('selected_ad_for_detail', None)
-        render_individual_reviews_page(aggregated_df, structured_df, preselected_ad)
+        render_individual_reviews_page(aggregated_df, structured_df, preselected_ad, review_index)
         if preselected_ad:
             st.session_state.selected_ad_for_detail = None
     
@@ -34,7 +34,7 @@ def render_score_bar(score, max_score=5):
     """
 
 
-def render_individual_reviews_page(aggregated_df, structured_df, preselected_ad=None):
+def render_individual_reviews_page(aggregated_df, structured_df, preselected_ad=None, review_index=None):
     """Render the individual reviews page with all Account Directors."""
     
     st.markdown("### 📝 Individual Performance Reviews")
@@ -71,7 +71,7 @@ def render_individual_reviews_page(aggregated_df, structured_df, preselected_ad=
         return
     
     # Get reviews for selected AD
-    reviews = get_individual_reviews(structured_df, selected_ad)
+    reviews = get_individual_reviews(structured_df, selected_ad, review_index)
     
     if not reviews:
         st.warning(f"No reviews found for {selected_ad}")
@@ -7,9 +7,16 @@ import pandas as pd
 from data_processor import (
     SCORING_SECTIONS,
     SECTION_SHORT_NAMES,
-    TOTAL_MAX_SCORE
+    SORT_COLUMNS,
+    TOTAL_MAX_SCORE,
+    build_leaderboard_index,
+    select_leaderboard_rows
 )
 
+# Leaderboard paging: each rerun renders at most one page of rows
+LEADERBOARD_PAGE_SIZES = [10, 25, 50, 100]
+DEFAULT_PAGE_SIZE = 25
+
 
 def render_filters(filter_options):
     """Render the left sidebar filter panel."""
@@ -57,27 +64,6 @@ def render_filters(filter_options):
     return selected_accounts, selected_verticals
 
 
-def apply_filters(df, selected_accounts, selected_verticals):
-    """Apply filters to the dataframe."""
-    filtered_df = df.copy()
-    
-    if selected_accounts:
-        filtered_df = filtered_df[filtered_df["Account"].isin(selected_accounts)]
-    
-    # Vertical filtering
-    if selected_verticals and "Vertical" in filtered_df.columns:
-        filtered_df = filtered_df[filtered_df["Vertical"].isin(selected_verticals)]
-    
-    return filtered_df
-
-
-def calculate_ranks(df, sort_column, ascending):
-    """Calculate dynamic ranks based on current sort."""
-    sorted_df = df.sort_values(by=sort_column, ascending=ascending).reset_index(drop=True)
-    sorted_df.insert(0, "Rank", range(1, len(sorted_df) + 1))
-    return sorted_df
-
-
 def get_score_color(score, max_score=5):
     """Return a color based on score (gradient from blue to gold)."""
     ratio = score / max_score
@@ -96,7 +82,7 @@ def get_top_sections(row, n=3):
     section_scores = []
     for i, section in enumerate(SCORING_SECTIONS):
         score_col = f"{section}_Score"
-        if score_col in row.index:
+        if score_col in row:
             section_scores.append((SECTION_SHORT_NAMES[i], row[score_col]))
     
     # Sort by score descending and take top N
@@ -206,7 +192,7 @@ def render_leaderboard_row(row, rank, total_count, key_suffix=""):
             with col_left:
                 for i, section in enumerate(sections_left):
                     score_col = f"{section}_Score"
-                    if score_col in row.index:
+                    if score_col in row:
                         score = row[score_col]
                         short_name = SECTION_SHORT_NAMES[i]
                         bar_color = get_score_color(score, 5)
@@ -228,7 +214,7 @@ def render_leaderboard_row(row, rank, total_count, key_suffix=""):
             with col_right:
                 for i, section in enumerate(sections_right, start=4):
                     score_col = f"{section}_Score"
-                    if score_col in row.index:
+                    if score_col in row:
                         score = row[score_col]
                         short_name = SECTION_SHORT_NAMES[i]
                         bar_color = get_score_color(score, 5)
@@ -259,18 +245,22 @@ def render_leaderboard_row(row, rank, total_count, key_suffix=""):
         st.markdown("<div style='border-bottom: 1px solid #e2e8f0; margin: 8px 0;'></div>", unsafe_allow_html=True)
 
 
-def render_rankings_table(df):
-    """Render compact, executive leaderboard."""
+def render_rankings_table(df, leaderboard_index, selected_accounts=None, selected_verticals=None):
+    """Render compact, executive leaderboard from the precomputed sort orders."""
     st.markdown("### 🏆 Account Director Leaderboard")
-    st.markdown("<p style='color: #64748b; font-size: 0.9em; margin-bottom: 1rem;'>Click ▶ to expand • Sorted by total score</p>", unsafe_allow_html=True)
+    st.markdown("<p style='color: #64748b; font-size: 0.9em; margin-bottom: 1rem;'>Click ▶ to expand • Sorted by total score • Use the page controls below the list to see more</p>", unsafe_allow_html=True)
     
-    # Compact sorting controls
-    col1, col2, spacer = st.columns([2, 2, 6])
+    # Compact sorting and paging controls
+    col1, col2, col3, spacer = st.columns([2, 2, 1.5, 4.5])
     
     with col1:
-        sort_columns = ["Total Score"] + [f"{section}_Score" for section in SCORING_SECTIONS]
-        sort_labels = ["Total Score"] + SECTION_SHORT_NAMES
-        sort_column_map = dict(zip(sort_labels, sort_columns))
+        # Only offer sort keys that have a precomputed order
+        sort_column_map = {
+            label: column
+            for label, column in zip(["Total Score"] + SECTION_SHORT_NAMES, SORT_COLUMNS)
+            if (column, False) in leaderboard_index["orders"]
+        }
+        sort_labels = list(sort_column_map)
         
         sort_by = st.selectbox(
             "Sort by",
@@ -291,42 +281,104 @@ def render_rankings_table(df):
         )
         ascending = sort_order == "Lowest First"
     
-    # Calculate ranks
-    ranked_df = calculate_ranks(df, sort_column, ascending)
-    total_count = len(ranked_df)
+    with col3:
+        page_size = st.selectbox(
+            "Per page",
+            options=LEADERBOARD_PAGE_SIZES,
+            index=LEADERBOARD_PAGE_SIZES.index(DEFAULT_PAGE_SIZE),
+            key="leaderboard_page_size",
+            label_visibility="visible"
+        )
+    
+    # Ranks are positions within the filtered, precomputed order
+    positions = select_leaderboard_rows(
+        leaderboard_index, sort_column, ascending, selected_accounts, selected_verticals
+    )
+    total_scores = df["Total Score"].to_numpy()[positions]
+    total_count = len(positions)
     
     # Compact summary metrics
     col1, col2, col3, col4 = st.columns(4)
     with col1:
         st.metric("Total", total_count)
     with col2:
-        avg_score = ranked_df['Total Score'].mean()
+        avg_score = total_scores.mean()
         st.metric("Avg", f"{avg_score:.1f}")
     with col3:
-        st.metric("Top", f"{ranked_df['Total Score'].max():.1f}")
+        st.metric("Top", f"{total_scores.max():.1f}")
     with col4:
-        st.metric("Low", f"{ranked_df['Total Score'].min():.1f}")
+        st.metric("Low", f"{total_scores.min():.1f}")
     
     st.markdown("<div style='margin: 16px 0;'></div>", unsafe_allow_html=True)
     
-    # Render leaderboard rows
-    for idx, row in ranked_df.iterrows():
-        rank = row['Rank']
-        render_leaderboard_row(row, rank, total_count, key_suffix=f"{idx}")
+    # Only the current page is materialized and rendered
+    view_signature = (sort_column, ascending, page_size, tuple(selected_accounts or []), tuple(selected_verticals or []))
+    page = get_current_page(total_count, page_size, view_signature)
+    start = page * page_size
+    page_positions = positions[start:start + page_size]
+    
+    # Render leaderboard rows (keyed by dataset position so expanded state survives re-sorting)
+    page_rows = df.iloc[page_positions].to_dict("records")
+    for rank, (position, row) in enumerate(zip(page_positions, page_rows), start=start + 1):
+        render_leaderboard_row(row, rank, total_count, key_suffix=f"{position}")
+    
+    render_pagination_controls(total_count, page_size)
     
     return None
 
 
+def get_current_page(total_count, page_size, view_signature):
+    """Return the current leaderboard page, resetting to the first page when sort/filters change."""
+    if st.session_state.get('leaderboard_view_signature') != view_signature:
+        st.session_state.leaderboard_view_signature = view_signature
+        st.session_state.leaderboard_page = 0
+    
+    page_count = max(1, -(-total_count // page_size))
+    page = min(max(st.session_state.get('leaderboard_page', 0), 0), page_count - 1)
+    st.session_state.leaderboard_page = page
+    return page
+
+
+def render_pagination_controls(total_count, page_size):
+    """Render previous/next navigation for the paged leaderboard."""
+    page_count = max(1, -(-total_count // page_size))
+    if page_count == 1:
+        return
+    
+    page = st.session_state.leaderboard_page
+    start = page * page_size
+    
+    col_prev, col_status, col_next = st.columns([1, 3, 1])
+    with col_prev:
+        if st.button("◀ Previous", key="leaderboard_prev", disabled=page == 0, use_container_width=True):
+            st.session_state.leaderboard_page = page - 1
+            st.rerun()
+    with col_status:
+        st.markdown(
+            f"<div style='text-align: center; color: #64748b; font-size: 0.85em; padding-top: 8px;'>"
+            f"Page {page + 1} of {page_count} • Showing {start + 1}–{min(start + page_size, total_count)} of {total_count}</div>",
+            unsafe_allow_html=True
+        )
+    with col_next:
+        if st.button("Next ▶", key="leaderboard_next", disabled=page >= page_count - 1, use_container_width=True):
+            st.session_state.leaderboard_page = page + 1
+            st.rerun()
+
+
 
 
-def render_rankings_view(aggregated_df, structured_df, filter_options):
+def render_rankings_view(aggregated_df, structured_df, filter_options, leaderboard_index=None):
     """Main function to render the complete rankings view."""
+    if leaderboard_index is None:
+        leaderboard_index = build_leaderboard_index(aggregated_df)
     
     # Render filters in sidebar
     selected_accounts, selected_verticals = render_filters(filter_options)
     
     # Apply filters
-    filtered_df = apply_filters(aggregated_df, selected_accounts, selected_verticals)
+    filtered_positions = select_leaderboard_rows(
+        leaderboard_index, "Total Score", False, selected_accounts, selected_verticals
+    )
     
     # Show filter status
     if selected_accounts or selected_verticals:
@@ -338,12 +390,12 @@ def render_rankings_view(aggregated_df, structured_df, filter_options):
         
         st.info(f"🔍 Active Filters: {' | '.join(filter_tags)}")
     
-    if filtered_df.empty:
+    if len(filtered_positions) == 0:
         st.warning("No Account Directors match the selected filters.")
         return
     
     # Render rankings table with visual cards
-    render_rankings_table(filtered_df)
+    render_rankings_table(aggregated_df, leaderboard_index, selected_accounts, selected_verticals)
     
     # Add helpful tip
     st.markdown("---")
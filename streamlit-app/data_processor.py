@@ -5,8 +5,15 @@ Handles CSV parsing, score aggregation, and data preparation for the dashboard.
 
 import pandas as pd
 import numpy as np
+from functools import lru_cache
 from typing import Dict, List, Tuple
+import hashlib
 import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from staff_dimensions import load_dimension_table
+from review_data import load_reviews_frame, section_columns
 
 # Define scoring sections based on CSV structure
 SCORING_SECTIONS = [
@@ -34,6 +41,30 @@ SECTION_SHORT_NAMES = [
 MAX_SCORE_PER_SECTION = 5
 TOTAL_MAX_SCORE = len(SCORING_SECTIONS) * MAX_SCORE_PER_SECTION
 
+# Leaderboard sort keys: total plus each section score
+SORT_COLUMNS = ["Total Score"] + [f"{section}_Score" for section in SCORING_SECTIONS]
+
+
+@lru_cache(maxsize=8)
+def _hash_file_contents(csv_path: str, mtime_ns: int, size: int) -> str:
+    """Hash file contents; memoized on (path, mtime, size) so unchanged files are never re-read."""
+    digest = hashlib.sha256()
+    with open(csv_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def get_file_signature(csv_path: str = "data/performance_reviews.csv") -> Tuple[int, str]:
+    """
+    Return a cheap-to-compute signature for a data file, used as a cache key.
+    
+    Returns:
+        Tuple of (mtime in nanoseconds, SHA-256 of the contents)
+    """
+    stat = os.stat(csv_path)
+    return stat.st_mtime_ns, _hash_file_contents(csv_path, stat.st_mtime_ns, stat.st_size)
+
 
 def load_performance_data(csv_path: str = "data/performance_reviews.csv") -> pd.DataFrame:
     """
@@ -43,8 +74,8 @@ def load_performance_data(csv_path: str = "data/performance_reviews.csv") -> pd.
     Returns:
         DataFrame with cleaned and structured review data
     """
-    # Read CSV
-    df = pd.read_csv(csv_path, low_memory=False)
+    # Read CSV (typed: categorical names, float32 scores; see review_data.py)
+    df = load_reviews_frame(csv_path)
     
     # Basic column mapping
     column_mapping = {}
@@ -60,94 +91,64 @@ def load_performance_data(csv_path: str = "data/performance_reviews.csv") -> pd.
     
     df = df.rename(columns=column_mapping)
     
-    # Extract score and feedback columns
-    # Pattern: Columns after "Account Director" alternate between feedback and score
-    # Feedback col (with long description), then Score col (with section name)
-    
+    # Extract score and feedback columns: each score column is headed with its section
+    # name and follows that section's feedback column
     score_columns = []
     feedback_columns = []
-    
-    # Find where the scoring section starts (after Account Director column)
-    cols_list = list(df.columns)
-    start_idx = None
-    for i, col in enumerate(cols_list):
-        if col == "Account Director":
-            start_idx = i + 1
-            break
-    
-    if start_idx is None:
-        # Fallback: assume scoring starts at column 7
-        start_idx = 7
-    
-    # From start_idx onwards, pair up columns: feedback (odd positions), score (even positions)
-    scoring_cols = cols_list[start_idx:]
-    
-    for i in range(0, len(scoring_cols) - 1, 2):
-        feedback_col = scoring_cols[i]
-        score_col = scoring_cols[i + 1]
-        
-        # The section name is in the score column header
-        section_name = score_col.strip()
-        
-        # Match it to our expected section names
-        matched_section = None
-        for expected_section in SCORING_SECTIONS:
-            if expected_section == section_name or section_name in expected_section:
-                matched_section = expected_section
-                break
-        
-        if matched_section:
-            score_columns.append((matched_section, score_col))
-            feedback_columns.append((matched_section, feedback_col))
+    for section, feedback_col, score_col in section_columns(df.columns):
+        score_columns.append((section, score_col))
+        feedback_columns.append((section, feedback_col))
     
     return df, score_columns, feedback_columns
 
 
+def _clean_text_column(df: pd.DataFrame, col: str) -> pd.Series:
+    """
+    Stringify and strip a text column in bulk.
+    Missing columns become empty strings; duplicated headers use the first match.
+    """
+    if col not in df.columns:
+        return pd.Series("", index=df.index, dtype=object)
+    values = df[col]
+    if isinstance(values, pd.DataFrame):
+        values = values.iloc[:, 0]
+    return values.astype(object).map(str).str.strip()
+
+
 def extract_scores_and_feedback(df: pd.DataFrame, score_columns: List, feedback_columns: List) -> pd.DataFrame:
     """
     Extract and structure score and feedback data from the raw DataFrame.
+    Works column-wise (selection, rename, bulk numeric coercion) rather than row by row.
     
     Returns:
         Structured DataFrame with AD, Account, Reviewer, Scores, and Feedback
     """
-    structured_data = []
-    
-    for idx, row in df.iterrows():
-        if pd.isna(row.get("Account Director")) or row.get("Account Director") == "Account Director Name":
-            continue  # Skip header rows or empty rows
-            
-        review_data = {
-            "Account Director": str(row.get("Account Director", "")).strip(),
-            "Account": str(row.get("Account", "")).strip(),
-            "Reviewer Name": str(row.get("Reviewer Name", "")).strip(),
-            "Reviewer Email": str(row.get("Reviewer Email", "")).strip(),
-        }
-        
-        # Extract scores for each section
-        total_score = 0
-        for section, score_col in score_columns:
-            try:
-                score = float(row.get(score_col, 0))
-                if pd.isna(score):
-                    score = 0
-            except (ValueError, TypeError):
-                score = 0
-            
-            review_data[f"{section}_Score"] = score
-            total_score += score
-        
-        review_data["Total Score"] = total_score
-        
-        # Extract feedback for each section
-        for section, feedback_col in feedback_columns:
-            feedback = str(row.get(feedback_col, "")).strip()
-            if feedback == "nan":
-                feedback = ""
-            review_data[f"{section}_Feedback"] = feedback
-        
-        structured_data.append(review_data)
+    if "Account Director" not in df.columns:
+        return pd.DataFrame()
+    
+    # Skip header rows or empty rows
+    ad_col = df["Account Director"]
+    rows = df.loc[ad_col.notna() & (ad_col != "Account Director Name")]
+    
+    structured = {
+        "Account Director": _clean_text_column(rows, "Account Director"),
+        "Account": _clean_text_column(rows, "Account"),
+        "Reviewer Name": _clean_text_column(rows, "Reviewer Name"),
+        "Reviewer Email": _clean_text_column(rows, "Reviewer Email"),
+    }
+    
+    # Scores: non-numeric or missing values count as 0
+    total_score = pd.Series(0.0, index=rows.index)
+    for section, score_col in score_columns:
+        score = pd.to_numeric(rows[score_col].astype(object).map(str).str.strip(), errors="coerce").fillna(0.0)
+        structured[f"{section}_Score"] = score
+        total_score = total_score + score
+    structured["Total Score"] = total_score
     
-    return pd.DataFrame(structured_data)
+    for section, feedback_col in feedback_columns:
+        structured[f"{section}_Feedback"] = _clean_text_column(rows, feedback_col).replace("nan", "")
+    
+    return pd.DataFrame(structured).reset_index(drop=True)
 
 
 def aggregate_scores_by_ad(structured_df: pd.DataFrame) -> pd.DataFrame:
@@ -185,31 +186,53 @@ def aggregate_scores_by_ad(structured_df: pd.DataFrame) -> pd.DataFrame:
     
     aggregated["Total Score"] = aggregated["Total Score"].round(2)
     
-    # Add vertical data if available
+    # Add vertical/tier/role data if available (shared table, joined on the AD index)
     try:
-        verticals_df = pd.read_csv("data/verticals.csv")
-        aggregated = aggregated.merge(verticals_df, on="Account Director", how="left")
+        dimensions = load_dimension_table("data/verticals.csv")
+        aggregated = aggregated.join(dimensions, on="Account Director")
     except FileNotFoundError:
         aggregated["Vertical"] = None
     
     return aggregated
 
 
-def get_individual_reviews(structured_df: pd.DataFrame, ad_name: str) -> List[Dict]:
+def build_review_index(structured_df: pd.DataFrame) -> Dict[str, np.ndarray]:
+    """
+    Build an Account Director -> row positions index over the structured reviews.
+    Computed once per dataset load so per-AD lookups don't rescan the frame.
+    
+    Returns:
+        Dictionary mapping AD name to an array of positional row indices
+    """
+    if structured_df.empty:
+        return {}
+    return structured_df.groupby("Account Director", sort=False).indices
+
+
+def get_individual_reviews(structured_df: pd.DataFrame, ad_name: str,
+                           review_index: Dict[str, np.ndarray] = None) -> List[Dict]:
     """
     Get all individual reviews for a specific Account Director.
     
     Args:
         structured_df: The structured review DataFrame
         ad_name: Account Director name
+        review_index: Optional index from build_review_index; when given the
+            lookup only touches that AD's rows
         
     Returns:
         List of review dictionaries with scores and feedback
     """
-    ad_reviews = structured_df[structured_df["Account Director"] == ad_name]
+    if review_index is not None:
+        positions = review_index.get(ad_name)
+        if positions is None:
+            return []
+        ad_reviews = structured_df.iloc[positions]
+    else:
+        ad_reviews = structured_df[structured_df["Account Director"] == ad_name]
     
     reviews = []
-    for idx, row in ad_reviews.iterrows():
+    for row in ad_reviews.to_dict("records"):
         review = {
             "reviewer_name": row["Reviewer Name"],
             "reviewer_email": row["Reviewer Email"],
@@ -220,8 +243,8 @@ def get_individual_reviews(structured_df: pd.DataFrame, ad_name: str) -> List[Di
         for section in SCORING_SECTIONS:
             section_data = {
                 "name": section,
-                "score": row[f"{section}_Score"],
-                "feedback": row[f"{section}_Feedback"]
+                "score": row.get(f"{section}_Score", 0),
+                "feedback": row.get(f"{section}_Feedback", "")
             }
             review["sections"].append(section_data)
         
@@ -284,6 +307,57 @@ def prepare_dashboard_data(csv_path: str = "data/performance_reviews.csv") -> Tu
     return aggregated_df, structured_df, rubric_data
 
 
+def build_leaderboard_index(aggregated_df: pd.DataFrame) -> Dict:
+    """
+    Precompute leaderboard orderings and filter postings once per dataset load.
+    
+    Returns:
+        Dictionary with:
+            "orders": {(sort_column, ascending): positional row order}
+            "facets": {"Account"/"Vertical": {value: positional rows}}
+            "size": number of rows in aggregated_df
+    """
+    orders = {}
+    for sort_column in SORT_COLUMNS:
+        if sort_column not in aggregated_df.columns:
+            continue
+        values = aggregated_df[sort_column].to_numpy(dtype=float)
+        # NaN sorts last in both directions, matching sort_values
+        orders[(sort_column, True)] = np.argsort(values, kind="stable")
+        orders[(sort_column, False)] = np.argsort(-values, kind="stable")
+    
+    facets = {}
+    for facet_column in ("Account", "Vertical"):
+        if facet_column in aggregated_df.columns:
+            facets[facet_column] = aggregated_df.groupby(facet_column, sort=False).indices
+    
+    return {"orders": orders, "facets": facets, "size": len(aggregated_df)}
+
+
+def select_leaderboard_rows(leaderboard_index: Dict, sort_column: str, ascending: bool,
+                            selected_accounts: List = None, selected_verticals: List = None) -> np.ndarray:
+    """
+    Return positional rows of aggregated_df in display order, with filters applied
+    as a boolean mask over the precomputed sort order.
+    """
+    order = leaderboard_index["orders"][(sort_column, ascending)]
+    
+    mask = None
+    for facet_column, selected in (("Account", selected_accounts), ("Vertical", selected_verticals)):
+        postings = leaderboard_index["facets"].get(facet_column)
+        if not selected or postings is None:
+            continue
+        facet_mask = np.zeros(leaderboard_index["size"], dtype=bool)
+        for value in selected:
+            if value in postings:
+                facet_mask[postings[value]] = True
+        mask = facet_mask if mask is None else mask & facet_mask
+    
+    if mask is None:
+        return order
+    return order[mask[order]]
+
+
 def get_filter_options(aggregated_df: pd.DataFrame) -> Dict[str, List]:
     """
     Extract unique values for filter dropdowns.
@@ -0,0 +1,71 @@
+"""
+String table for review records in data.json (build_data.py --intern-strings).
+
+Joint reviews are copied to every AD they name, and reviewer names/emails, account names
+and the "No feedback provided" placeholder repeat across reviews. In interned form every
+distinct string is stored once in data["strings"] (most frequent first, so common
+strings get short indices) and review records hold indices instead:
+
+    {"id": "17", "accountDirector": 3, "account": 41, "reviewerName": 12, "reviewerEmail": 13,
+     "feedback": [0, 57, 0, ...],          # one index per metadata.scoringSections entry
+     "scores": {...}, "totalScore": 33.0}
+
+app.js resolves the indices lazily; Python readers call expand_reviews() first.
+"""
+
+from collections import Counter
+
+REVIEW_STRING_FIELDS = ("accountDirector", "account", "reviewerName", "reviewerEmail")
+
+
+def _review_strings(review, sections):
+    for field in REVIEW_STRING_FIELDS:
+        if field in review:
+            yield review[field]
+    feedback = review.get("feedback", {})
+    for section in sections:
+        yield feedback.get(section, "")
+
+
+def intern_reviews(data):
+    """Return a copy of data.json with review strings moved into data["strings"]."""
+    sections = data["metadata"]["scoringSections"]
+    counts = Counter(
+        text for ad in data["accountDirectors"] for review in ad.get("reviews", [])
+        for text in _review_strings(review, sections)
+    )
+    strings = [text for text, _ in counts.most_common()]
+    index = {text: i for i, text in enumerate(strings)}
+
+    account_directors = []
+    for ad in data["accountDirectors"]:
+        reviews = []
+        for review in ad.get("reviews", []):
+            record = {key: index[value] if key in REVIEW_STRING_FIELDS else value
+                      for key, value in review.items() if key != "feedback"}
+            feedback = review.get("feedback", {})
+            record["feedback"] = [index[feedback.get(section, "")] for section in sections]
+            reviews.append(record)
+        account_directors.append({**ad, "reviews": reviews})
+    return {**data, "accountDirectors": account_directors, "strings": strings}
+
+
+def expand_reviews(data):
+    """Inverse of intern_reviews; data without a string table is returned unchanged."""
+    strings = data.get("strings")
+    if strings is None:
+        return data
+    sections = data["metadata"]["scoringSections"]
+
+    account_directors = []
+    for ad in data["accountDirectors"]:
+        reviews = []
+        for record in ad.get("reviews", []):
+            review = {key: strings[value] if key in REVIEW_STRING_FIELDS else value
+                      for key, value in record.items() if key != "feedback"}
+            review["feedback"] = {section: strings[i] for section, i in zip(sections, record.get("feedback", []))}
+            reviews.append(review)
+        account_directors.append({**ad, "reviews": reviews})
+    expanded = {key: value for key, value in data.items() if key != "strings"}
+    expanded["accountDirectors"] = account_directors
+    return expanded
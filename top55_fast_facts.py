@@ -1,7 +1,8 @@
 """
 Fast facts: Top 55 accounts - response count and IFM distribution comparison.
 - Top 55: from month_end_by_ifm (CBRE, Direct, JLL, C&W, Amentum, EMCOR) by revenue
-- Responses: accounts with SCR notes from scorecard visibility report (RAW_ENTRIES)
+- Responses: January SCR notes from data/scorecard_visibility_notes.csv (one per site),
+  with the IFMs curated for each site (the month-end IFMs above if the IFM column is blank)
 """
 import pandas as pd
 from pathlib import Path
@@ -52,15 +53,18 @@ def main():
         for ifm in account_ifms.get(acc, set()):
             top55_ifm[ifm] += 1
 
-    # Use RAW_ENTRIES from scorecard for response count and IFM dist
+    # January SCR notes from the scorecard visibility report (keyed by month-end account)
     import sys
     sys.path.insert(0, str(Path(__file__).parent))
-    from generate_scorecard_visibility_report import RAW_ENTRIES
+    from generate_scorecard_visibility_report import load_notes
 
-    num_responses = len(RAW_ENTRIES)  # 30 accounts with SCR notes
+    notes = load_notes()
+    responses = [(account, site_ifms) for (account, month), entries in notes.items() if month == "2026-01"
+                 for _, _, site_ifms, _ in entries]
+    num_responses = len(responses)
     response_ifm = defaultdict(int)
-    for _, _, ifms, _, _ in RAW_ENTRIES:
-        for ifm in ifms:
+    for account, site_ifms in responses:
+        for ifm in site_ifms or account_ifms.get(account, set()):
             response_ifm[ifm] += 1
 
     # Output
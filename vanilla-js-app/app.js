@@ -6,6 +6,7 @@
 // ==================== STATE MANAGEMENT ====================
 const AppState = {
     data: null,
+    dataVersion: null,  // last manifest seen via /api/version
     bestPractices: null,
     currentView: 'rankings',
     filters: {
@@ -77,7 +78,7 @@ async function loadData() {
     try {
         const response = await fetch('data.json');
         if (!response.ok) throw new Error('Failed to load data');
-        AppState.data = await response.json();
+        AppState.data = resolveInternedStrings(await response.json());
         console.log('Data loaded successfully:', AppState.data);
         return true;
     } catch (error) {
@@ -87,6 +88,48 @@ async function loadData() {
     }
 }
 
+// build_data.py --intern-strings stores review strings once in data.strings and has the
+// reviews hold indices (see string_table.py). Reviews are wrapped rather than expanded:
+// getters on a shared prototype look the strings up on access, so the text is never copied.
+const INTERNED_REVIEW_FIELDS = ['accountDirector', 'account', 'reviewerName', 'reviewerEmail'];
+
+function resolveInternedStrings(data) {
+    const strings = data.strings;
+    if (!Array.isArray(strings)) return data;
+    const sections = data.metadata.scoringSections;
+    
+    const proto = {
+        get feedback() {
+            const feedback = {};
+            sections.forEach((section, i) => { feedback[section] = strings[this._raw.feedback[i]]; });
+            Object.defineProperty(this, 'feedback', { value: feedback });  // built once, on first view
+            return feedback;
+        },
+        toJSON() {
+            return { ...this._raw, ...Object.fromEntries(INTERNED_REVIEW_FIELDS
+                .filter(field => field in this._raw).map(field => [field, this[field]])),
+                feedback: this.feedback };
+        }
+    };
+    INTERNED_REVIEW_FIELDS.forEach(field => {
+        Object.defineProperty(proto, field, { get() { return strings[this._raw[field]]; } });
+    });
+    
+    const wrap = raw => {
+        const review = Object.create(proto);
+        Object.keys(raw).forEach(key => {
+            if (key !== 'feedback' && !INTERNED_REVIEW_FIELDS.includes(key)) review[key] = raw[key];
+        });
+        Object.defineProperty(review, '_raw', { value: raw });
+        return review;
+    };
+    data.accountDirectors.forEach(ad => {
+        // Reviews patched in from a delta are already plain strings
+        if (ad.reviews) ad.reviews = ad.reviews.map(r => typeof r.accountDirector === 'number' ? wrap(r) : r);
+    });
+    return data;
+}
+
 async function loadBestPractices() {
     try {
         // Best practices are now in data.json under bestPractices key
@@ -95,78 +138,12 @@ async function loadBestPractices() {
             return false;
         }
         
-        // Transform from {AD_NAME: [...]} to {practices: [...], metadata: {...}}
+        // build_data.py emits practices already flattened with umbrella fields and facet postings;
+        // older data.json files still carry the raw {AD_NAME: [...]} map
         const bestPracticesData = AppState.data.bestPractices;
-        const practices = [];
-        const categories = new Set();
-        const replicabilities = new Set();
-        const statuses = new Set();
-        const verticals = new Set();
-        const accounts = new Set();
-        
-        // Create AD to account and vertical mapping
-        const adAccountMap = {};
-        const adVerticalMap = {};
-        if (AppState.data.accountDirectors) {
-            AppState.data.accountDirectors.forEach(ad => {
-                adAccountMap[ad.accountDirector] = ad.account || '';
-                adVerticalMap[ad.accountDirector] = ad.vertical || 'N/A';
-                if (ad.vertical && ad.vertical !== 'N/A') {
-                    ad.vertical.split(',').map(v => v.trim()).filter(v => v).forEach(v => verticals.add(v));
-                }
-                // Extract unique accounts from comma-separated account string
-                if (ad.account) {
-                    ad.account.split(',').map(a => a.trim()).filter(a => a && a !== 'undefined').forEach(acc => accounts.add(acc));
-                }
-            });
-        }
-        
-        // Flatten the structure and map fields
-        Object.keys(bestPracticesData).forEach(adName => {
-            const adPractices = bestPracticesData[adName];
-            if (Array.isArray(adPractices)) {
-                adPractices.forEach(practice => {
-                    const replicable = practice.replicability || 'Medium';
-                    const status = practice.status || '';
-                    replicabilities.add(replicable);
-                    if (status) statuses.add(status);
-                    
-                    const umbrellaCat = getUmbrellaCategory(practice.category);
-                    const umbrellaStat = getUmbrellaStatus(practice.status || '');
-                    practices.push({
-                        ...practice,
-                        adName: adName,
-                        account: adAccountMap[adName] || '',
-                        vertical: adVerticalMap[adName] || 'N/A',
-                        replicable: replicable,
-                        replicableDetails: '',
-                        quote: practice.leadership_endorsement || '',
-                        featured: practice.status === 'Proven & Active' || practice.status === 'Proven & Scalable',
-                        metrics: [],
-                        umbrellaCategory: umbrellaCat,
-                        umbrellaStatus: umbrellaStat
-                    });
-                    if (practice.category) {
-                        categories.add(practice.category);
-                    }
-                });
-            }
-        });
-        
-        // Build the expected structure
-        AppState.bestPractices = {
-            metadata: {
-                totalPractices: practices.length,
-                categories: Array.from(categories).sort(),
-                umbrellaCategories: UMBRELLA_CATEGORIES.map(u => u.id),
-                replicabilities: Array.from(replicabilities).sort(),
-                statuses: Array.from(statuses).sort(),
-                verticals: Array.from(verticals).sort(),
-                accounts: Array.from(accounts).sort(),
-                lastUpdated: AppState.data.metadata?.lastUpdated || new Date().toISOString()
-            },
-            practices: practices
-        };
+        AppState.bestPractices = Array.isArray(bestPracticesData.practices)
+            ? bestPracticesData
+            : flattenLegacyBestPractices(bestPracticesData);
         
         console.log('Best practices loaded:', AppState.bestPractices);
         return true;
@@ -176,6 +153,224 @@ async function loadBestPractices() {
     }
 }
 
+function splitListField(value) {
+    return (value || '').split(',').map(v => v.trim()).filter(v => v && v !== 'undefined');
+}
+
+// Fallback for data.json built before best practices were flattened at build time
+function flattenLegacyBestPractices(bestPracticesData) {
+    const practices = [];
+    const categories = new Set();
+    const replicabilities = new Set();
+    const statuses = new Set();
+    const verticals = new Set();
+    const accounts = new Set();
+    
+    // Create AD to account and vertical mapping
+    const adAccountMap = {};
+    const adVerticalMap = {};
+    (AppState.data.accountDirectors || []).forEach(ad => {
+        adAccountMap[ad.accountDirector] = ad.account || '';
+        adVerticalMap[ad.accountDirector] = ad.vertical || 'N/A';
+        if (ad.vertical && ad.vertical !== 'N/A') {
+            splitListField(ad.vertical).forEach(v => verticals.add(v));
+        }
+        splitListField(ad.account).forEach(acc => accounts.add(acc));
+    });
+    
+    // Flatten the structure and map fields
+    Object.keys(bestPracticesData).forEach(adName => {
+        const adPractices = bestPracticesData[adName];
+        if (!Array.isArray(adPractices)) return;
+        adPractices.forEach(practice => {
+            const replicable = practice.replicability || 'Medium';
+            const status = practice.status || '';
+            replicabilities.add(replicable);
+            if (status) statuses.add(status);
+            if (practice.category) categories.add(practice.category);
+            
+            practices.push({
+                ...practice,
+                adName: adName,
+                account: adAccountMap[adName] || '',
+                vertical: adVerticalMap[adName] || 'N/A',
+                replicable: replicable,
+                replicableDetails: '',
+                quote: practice.leadership_endorsement || '',
+                featured: practice.status === 'Proven & Active' || practice.status === 'Proven & Scalable',
+                metrics: [],
+                umbrellaCategory: getUmbrellaCategory(practice.category),
+                umbrellaStatus: getUmbrellaStatus(status)
+            });
+        });
+    });
+    
+    // Facet postings (facet value -> ascending practice indices), same shape as build_data.py
+    const postings = { category: {}, replicability: {}, status: {}, vertical: {}, account: {}, featured: [] };
+    const post = (facet, value, index) => (postings[facet][value] = postings[facet][value] || []).push(index);
+    practices.forEach((practice, index) => {
+        post('category', practice.umbrellaCategory, index);
+        post('replicability', practice.replicable, index);
+        post('status', practice.umbrellaStatus, index);
+        splitListField(practice.vertical).forEach(v => post('vertical', v, index));
+        splitListField(practice.account).forEach(a => post('account', a, index));
+        if (practice.featured) postings.featured.push(index);
+    });
+    
+    return {
+        metadata: {
+            totalPractices: practices.length,
+            categories: Array.from(categories).sort(),
+            umbrellaCategories: UMBRELLA_CATEGORIES.map(u => u.id),
+            replicabilities: Array.from(replicabilities).sort(),
+            statuses: Array.from(statuses).sort(),
+            verticals: Array.from(verticals).sort(),
+            accounts: Array.from(accounts).sort(),
+            lastUpdated: AppState.data.metadata?.lastUpdated || new Date().toISOString()
+        },
+        practices: practices,
+        postings: postings
+    };
+}
+
+// ==================== LIVE UPDATES ====================
+// The page polls server.py's /api/version (a 304 while the build is unchanged) and, when
+// the version moves, applies the build's delta patches (/data/delta), falling back to
+// refetching only the data.json sections whose hash changed, then to the whole file.
+// Polling pauses while the tab is hidden and stops for good on static hosting, where
+// /api/version 404s.
+const VERSION_POLL_MS = 10000;
+
+function subscribeToDataUpdates() {
+    let timer = null;
+    let polling = false;
+    
+    async function poll() {
+        timer = null;
+        if (document.hidden) return;  // resumed by visibilitychange
+        polling = true;
+        try {
+            const response = await fetch('/api/version', { cache: 'no-cache' });
+            if (response.status === 404) {
+                document.removeEventListener('visibilitychange', resume);
+                return;
+            }
+            if (response.ok) await applyDataVersion(await response.json());
+        } catch (error) {
+            // Server restarting or offline; try again next tick
+        } finally {
+            polling = false;
+        }
+        timer = setTimeout(poll, VERSION_POLL_MS);
+    }
+    
+    function resume() {
+        if (!document.hidden && timer === null && !polling) poll();
+    }
+    
+    document.addEventListener('visibilitychange', resume);
+    poll();
+}
+
+function applyReviewPatch(reviews, patch) {
+    const byId = new Map(reviews.map(review => [review.id, review]));
+    (patch.removed || []).forEach(id => byId.delete(id));
+    (patch.changed || []).forEach(review => byId.set(review.id, review));
+    (patch.added || []).forEach(review => byId.set(review.id, review));
+    const order = patch.order || Array.from(byId.keys());
+    return order.map(id => byId.get(id)).filter(Boolean);
+}
+
+// Apply one build_data.py delta (see diff_builds) to a data.json object. Touched sections
+// and ADs are copied before they are changed, so the caller's object is never modified.
+function applyDataPatch(data, patch) {
+    Object.entries(patch.shards || {}).forEach(([shard, change]) => {
+        const section = data[shard] = { ...(data[shard] || {}) };
+        Object.assign(section, change.set || {});
+        (change.unset || []).forEach(key => delete section[key]);
+        Object.entries(change.items || {}).forEach(([key, items]) => {
+            section[key] = section[key].slice();
+            Object.entries(items).forEach(([index, item]) => { section[key][Number(index)] = item; });
+        });
+    });
+    
+    const ads = patch.accountDirectors;
+    if (!ads) return;
+    const byName = new Map(data.accountDirectors.map(ad => [ad.accountDirector, ad]));
+    (ads.removed || []).forEach(name => byName.delete(name));
+    Object.entries(ads.changed || {}).forEach(([name, change]) => {
+        if (!byName.has(name)) return;
+        const ad = { ...byName.get(name), ...(change.set || {}) };
+        byName.set(name, ad);
+        (change.unset || []).forEach(field => delete ad[field]);
+        if (change.reviews) ad.reviews = applyReviewPatch(ad.reviews || [], change.reviews);
+    });
+    (ads.added || []).forEach(ad => byName.set(ad.accountDirector, ad));
+    const order = ads.order || Array.from(byName.keys());
+    data.accountDirectors = order.map(name => byName.get(name)).filter(Boolean);
+}
+
+async function applyDataDelta(since, target) {
+    const response = await fetch(`/data/delta?since=${encodeURIComponent(since)}`, { cache: 'no-store' });
+    if (!response.ok) return false;  // 410: too far behind, or the server has no delta for us
+    const delta = await response.json();
+    if (delta.to !== target) return false;
+    
+    // Patch a shallow copy so a failure never leaves AppState half-updated
+    const data = { ...AppState.data };
+    delta.patches.forEach(patch => applyDataPatch(data, patch));
+    AppState.data = data;
+    return true;
+}
+
+async function applyDataVersion(manifest) {
+    const previous = AppState.dataVersion;
+    AppState.dataVersion = manifest;
+    
+    if (!previous) {
+        // First event: the page already has this build unless it was rebuilt since loading
+        if (manifest.builtAt === AppState.data.metadata.lastUpdated) return;
+    } else if (previous.version === manifest.version) {
+        return;
+    }
+    
+    const previousShards = (previous && previous.shards) || {};
+    const changed = Object.keys(manifest.shards || {})
+        .filter(shard => previousShards[shard] !== manifest.shards[shard]);
+    // Interned review indices are only meaningful with the string table they were built against
+    if (changed.includes('accountDirectors') && 'strings' in manifest.shards && !changed.includes('strings')) {
+        changed.push('strings');
+    }
+    
+    try {
+        if (previous && await applyDataDelta(previous.version, manifest.version)) {
+            // Patched in place from the delta chain
+        } else if (previous && changed.length > 0) {
+            const shards = await Promise.all(changed.map(async shard => {
+                const response = await fetch(`/api/data/${shard}`, { cache: 'no-store' });
+                if (!response.ok) throw new Error(`Failed to load ${shard}`);
+                return [shard, await response.json()];
+            }));
+            const data = { ...AppState.data };
+            shards.forEach(([shard, value]) => { data[shard] = value; });
+            AppState.data = resolveInternedStrings(data);
+        } else {
+            const response = await fetch('data.json', { cache: 'no-store' });
+            if (!response.ok) throw new Error('Failed to load data');
+            AppState.data = resolveInternedStrings(await response.json());
+        }
+    } catch (error) {
+        console.error('Error applying data update:', error);
+        AppState.dataVersion = previous;
+        return;
+    }
+    
+    console.log('Data updated to version', manifest.version, changed);
+    await loadBestPractices();
+    updateLastUpdated();
+    showView(AppState.currentView);
+}
+
 // ==================== INITIALIZATION ====================
 async function init() {
     const success = await loadData();
@@ -193,6 +388,8 @@ async function init() {
     // Show initial view
     hideLoading();
     showView('rankings');
+    
+    subscribeToDataUpdates();
 }
 
 function hideLoading() {
@@ -952,18 +1149,25 @@ function getFilteredPractices() {
     if (!AppState.bestPractices) return [];
     
     const f = AppState.bestPracticesFilters;
-    
-    return AppState.bestPractices.practices.filter(practice => {
-        if (f.category !== 'all' && practice.umbrellaCategory !== f.category) return false;
-        if (f.replicability !== 'all' && (practice.replicable || practice.replicability) !== f.replicability) return false;
-        if (f.status !== 'all' && practice.umbrellaStatus !== f.status) return false;
-        if (f.vertical !== 'all') {
-            const practiceVerticals = (practice.vertical || '').split(',').map(v => v.trim()).filter(v => v);
-            if (!practiceVerticals.includes(f.vertical)) return false;
-        }
-        if (f.featuredOnly && !practice.featured) return false;
-        return true;
-    });
+    const { practices, postings } = AppState.bestPractices;
+    
+    // Each active filter contributes a sorted posting list; the result is their intersection
+    const lists = [];
+    if (f.category !== 'all') lists.push(postings.category[f.category] || []);
+    if (f.replicability !== 'all') lists.push(postings.replicability[f.replicability] || []);
+    if (f.status !== 'all') lists.push(postings.status[f.status] || []);
+    if (f.vertical !== 'all') lists.push(postings.vertical[f.vertical] || []);
+    if (f.featuredOnly) lists.push(postings.featured);
+    
+    if (lists.length === 0) return practices;
+    
+    lists.sort((a, b) => a.length - b.length);
+    let indices = lists[0];
+    for (let i = 1; i < lists.length && indices.length; i++) {
+        const allowed = new Set(lists[i]);
+        indices = indices.filter(idx => allowed.has(idx));
+    }
+    return indices.map(idx => practices[idx]);
 }
 
 function renderBestPractices() {
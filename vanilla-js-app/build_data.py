@@ -4,9 +4,77 @@ Run this script whenever the CSV is updated.
 """
 
 import pandas as pd
+import argparse
+import copy
+import hashlib
 import json
+import os
+import sys
+import time
+from array import array
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from staff_dimensions import canonical_ad_name, load_dimension_table, dimension_records
+from search_index import build_search_index, write_search_index
+from string_table import expand_reviews, intern_reviews
+from review_data import load_reviews_frame, section_columns
+from instrumentation import Profiler, add_profile_arguments
+
+DATA_DIR = Path("../data")
+AD_CSVS_DIR = DATA_DIR / "ad_csvs"
+REVIEWS_PATH = DATA_DIR / "performance_reviews.csv"
+VERTICALS_PATH = DATA_DIR / "verticals.csv"
+ATB_PATH = DATA_DIR / "ATB Q4.2025-Jan. 2026.csv"
+BEST_PRACTICES_PATH = DATA_DIR / "best-practices.json"
+FOLLOW_UPS_PATH = DATA_DIR / "follow-up-questions.json"
+
+OUTPUT_PATH = Path("data.json")
+SEARCH_INDEX_PATH = Path("search_index.json")
+# Written last: version, per-shard and per-AD hashes of the current data.json
+VERSION_PATH = Path("data-version.json")
+# deltas/<version>.json: patch from the previous build to <version> (see diff_builds)
+DELTAS_DIR = Path("deltas")
+# Deltas kept; clients further behind than this refetch data.json
+DELTA_HISTORY = 20
+
+# Top-level data.json sections; clients refetch only the ones whose hash changed
+SHARDS = ["metadata", "accountDirectors", "rubrics", "bestPractices", "followUpQuestions"]
+
+# --watch defaults (seconds)
+WATCH_INTERVAL = 1.0
+WATCH_DEBOUNCE = 1.5
+
+
+def file_signature(path):
+    """(mtime_ns, size) of a file, or None if it does not exist."""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class SourceCache:
+    """Loader results keyed by the signatures of the files they read.
+
+    A fresh cache loads everything; watch mode keeps one across rebuilds so only
+    sources whose files changed are parsed again. Only parsing is cached: build()
+    still re-aggregates every AD from the loaded sources. Results are deep-copied
+    out because later build steps mutate them.
+    """
+
+    def __init__(self):
+        self._entries = {}
+
+    def load(self, key, paths, loader):
+        signature = tuple(file_signature(path) for path in paths)
+        entry = self._entries.get(key)
+        if entry is None or entry[0] != signature:
+            entry = (signature, loader())
+            self._entries[key] = entry
+        return copy.deepcopy(entry[1])
+
 def clean_numeric_value(val):
     """Clean and convert numeric values from CSV"""
     if pd.isna(val) or val == '':
@@ -89,6 +157,147 @@ def load_best_practices(bp_path="../data/best-practices.json"):
         print(f"⚠️  Invalid JSON in best practices file: {bp_path}")
         return {}
 
+# Umbrella categories/statuses: must stay in sync with UMBRELLA_CATEGORIES / UMBRELLA_STATUSES in app.js
+UMBRELLA_CATEGORY_IDS = [
+    "Transitions",
+    "Financial Strategy",
+    "Operational Excellence",
+    "Innovation & Technology",
+    "Client Relations & Partnership",
+    "Governance & Process",
+    "People & Culture",
+    "Safety & Quality"
+]
+
+UMBRELLA_CATEGORY_KEYWORDS = [
+    ("Transitions", ["transition", "turnaround", "account recovery"]),
+    ("Financial Strategy", ["financial", "cost savings", "cost avoidance", "revenue growth", "financial excellence",
+                            "financial optimization", "financial recovery", "contract management", "procurement"]),
+    ("Operational Excellence", ["operational", "process excellence", "service excellence", "emergency response",
+                                "labor optimization", "standardization", "scalability", "crisis response",
+                                "service innovation"]),
+    ("Innovation & Technology", ["innovation", "technology", "data-driven", "product innovation",
+                                 "equipment investment", "sustainability"]),
+    ("Client Relations & Partnership", ["client", "partnership", "relationship management", "strategic partnership",
+                                        "strategic negotiation", "service expansion", "business development",
+                                        "strategic thinking"]),
+    ("Governance & Process", ["governance", "process improvement", "communication", "strategic communication",
+                              "data alignment", "real-time communication", "strategic planning",
+                              "executive presentation"]),
+    ("People & Culture", ["people", "team building", "staffing", "workforce", "talent", "retention",
+                          "leadership philosophy"]),
+    ("Safety & Quality", ["safety", "quality", "risk management", "compliance", "regulatory", "accountability"]),
+]
+
+FEATURED_STATUSES = {"Proven & Active", "Proven & Scalable"}
+
+
+def get_umbrella_category(granular_category):
+    """Map a granular best-practice category to its umbrella category (mirrors app.js)."""
+    if not granular_category:
+        return "Operational Excellence"
+    c = granular_category.lower()
+    for umbrella, keywords in UMBRELLA_CATEGORY_KEYWORDS:
+        if any(k in c for k in keywords):
+            return umbrella
+    return "Operational Excellence"
+
+
+def get_umbrella_status(granular_status):
+    """Map a granular best-practice status to its umbrella status (mirrors app.js)."""
+    if not granular_status:
+        return "Proven"
+    s = granular_status.lower()
+    if "development" in s or "pilot" in s or "in progress" in s:
+        return "In Development"
+    if ("expanding" in s or "converting" in s or "phase 2" in s
+            or (s.startswith("active (") and ("2026" in s or "growth" in s))):
+        return "Active / Expanding"
+    return "Proven"
+
+
+def split_list_field(value):
+    """Split a comma-separated display field into trimmed, non-empty parts."""
+    return [part.strip() for part in (value or "").split(",") if part.strip() and part.strip() != "undefined"]
+
+
+def build_best_practices(best_practices_raw, aggregated, last_updated):
+    """Flatten {AD: [practices]} into the client structure with a facet index.
+
+    Returns {"metadata": {...}, "practices": [...], "postings": {facet: {value: [practice indices]}}}.
+    Posting lists are ascending, so the client filters by intersecting them.
+    """
+    ad_lookup = {ad["accountDirector"]: ad for ad in aggregated}
+
+    verticals = set()
+    accounts = set()
+    for ad in aggregated:
+        if ad.get("vertical") and ad["vertical"] != "N/A":
+            verticals.update(split_list_field(ad["vertical"]))
+        accounts.update(split_list_field(ad.get("account")))
+
+    practices = []
+    categories = set()
+    replicabilities = set()
+    statuses = set()
+    postings = {"category": {}, "replicability": {}, "status": {}, "vertical": {}, "account": {}, "featured": []}
+
+    for ad_name, ad_practices in best_practices_raw.items():
+        if not isinstance(ad_practices, list):
+            continue
+        ad = ad_lookup.get(ad_name, {})
+        account = ad.get("account") or ""
+        vertical = ad.get("vertical") or "N/A"
+        for practice in ad_practices:
+            index = len(practices)
+            replicable = practice.get("replicability") or "Medium"
+            status = practice.get("status") or ""
+            entry = dict(practice)
+            entry.update({
+                "adName": ad_name,
+                "account": account,
+                "vertical": vertical,
+                "replicable": replicable,
+                "replicableDetails": "",
+                "quote": practice.get("leadership_endorsement") or "",
+                "featured": status in FEATURED_STATUSES,
+                "metrics": [],
+                "umbrellaCategory": get_umbrella_category(practice.get("category")),
+                "umbrellaStatus": get_umbrella_status(status),
+            })
+            practices.append(entry)
+
+            replicabilities.add(replicable)
+            if status:
+                statuses.add(status)
+            if practice.get("category"):
+                categories.add(practice["category"])
+
+            postings["category"].setdefault(entry["umbrellaCategory"], []).append(index)
+            postings["replicability"].setdefault(replicable, []).append(index)
+            postings["status"].setdefault(entry["umbrellaStatus"], []).append(index)
+            for v in split_list_field(vertical):
+                postings["vertical"].setdefault(v, []).append(index)
+            for a in split_list_field(account):
+                postings["account"].setdefault(a, []).append(index)
+            if entry["featured"]:
+                postings["featured"].append(index)
+
+    return {
+        "metadata": {
+            "totalPractices": len(practices),
+            "categories": sorted(categories),
+            "umbrellaCategories": UMBRELLA_CATEGORY_IDS,
+            "replicabilities": sorted(replicabilities),
+            "statuses": sorted(statuses),
+            "verticals": sorted(verticals),
+            "accounts": sorted(accounts),
+            "lastUpdated": last_updated
+        },
+        "practices": practices,
+        "postings": postings
+    }
+
 def load_follow_up_questions(fup_path="../data/follow-up-questions.json"):
     """Load follow-up questions (2026 Development Focus) from JSON."""
     try:
@@ -110,93 +319,101 @@ def normalize_ad_name_for_financial(ad_name):
     }
     return name_map.get(ad_name, ad_name)
 
-def load_financial_data():
-    """Load all AD CSV files and aggregate financial metrics"""
-    ad_csvs_dir = Path("../data/ad_csvs")
-    ad_financial_data = {}
+def load_ad_financials(csv_file):
+    """Aggregate Dec-25 financial metrics from one AD CSV. Returns (ad_name, metrics)."""
+    # Convert filename to AD name (e.g., "aaron-simpson.csv" -> "Aaron Simpson")
+    ad_name = csv_file.stem.replace('-', ' ').title()
+    # Normalize to match review names
+    ad_name = normalize_ad_name_for_financial(ad_name)
+    
+    df = pd.read_csv(csv_file)
+    
+    # Get unique accounts
+    accounts = df['Account'].unique().tolist()
     
-    for csv_file in ad_csvs_dir.glob("*.csv"):
-        # Convert filename to AD name (e.g., "aaron-simpson.csv" -> "Aaron Simpson")
-        ad_name = csv_file.stem.replace('-', ' ').title()
-        # Normalize to match review names
-        ad_name = normalize_ad_name_for_financial(ad_name)
+    # Calculate metrics for Dec-25 (most recent)
+    revenue_total = 0
+    csat_values = []
+    headcount_total = 0
+    red_sites_count = 0
+    growth_values = []
+    account_revenues = {}  # Track revenue per account for sorting
+    
+    for account in accounts:
+        account_df = df[df['Account'] == account]
+        
+        # Revenue
+        account_revenue = 0
+        rev_row = account_df[account_df['KPI'] == 'Revenue ($)']
+        if not rev_row.empty and 'Dec-25' in rev_row.columns:
+            val = rev_row['Dec-25'].values[0]
+            cleaned_val = clean_numeric_value(val)
+            if cleaned_val is not None:
+                account_revenue = cleaned_val
+                revenue_total += cleaned_val
+        account_revenues[account] = account_revenue
+        
+        # CSAT
+        csat_row = account_df[account_df['KPI'] == 'CSAT']
+        if not csat_row.empty and 'Dec-25' in csat_row.columns:
+            val = csat_row['Dec-25'].values[0]
+            cleaned_val = clean_numeric_value(val)
+            if cleaned_val is not None:
+                csat_values.append(cleaned_val)
+        
+        # Headcount
+        hc_row = account_df[account_df['KPI'] == 'Headcount']
+        if not hc_row.empty and 'Dec-25' in hc_row.columns:
+            val = hc_row['Dec-25'].values[0]
+            cleaned_val = clean_numeric_value(val)
+            if cleaned_val is not None:
+                headcount_total += int(cleaned_val)
+        
+        # Red Sites #
+        rs_row = account_df[account_df['KPI'] == 'Red Sites (#)']
+        if not rs_row.empty and 'Dec-25' in rs_row.columns:
+            val = rs_row['Dec-25'].values[0]
+            cleaned_val = clean_numeric_value(val)
+            if cleaned_val is not None:
+                red_sites_count += int(cleaned_val)
         
+        # Growth %
+        growth_row = account_df[account_df['KPI'] == 'Growth (%)']
+        if not growth_row.empty and 'Dec-25' in growth_row.columns:
+            val = growth_row['Dec-25'].values[0]
+            cleaned_val = clean_numeric_value(val)
+            if cleaned_val is not None:
+                growth_values.append(cleaned_val)
+    
+    # Sort accounts by revenue (biggest to smallest)
+    sorted_accounts = sorted(accounts, key=lambda x: account_revenues.get(x, 0), reverse=True)
+    
+    return ad_name, {
+        'accounts': sorted_accounts,
+        'num_accounts': len(sorted_accounts),
+        'revenue_total': revenue_total,
+        'csat_avg': sum(csat_values) / len(csat_values) if csat_values else None,
+        'headcount_total': headcount_total,
+        'red_sites_count': red_sites_count,
+        'growth_avg': sum(growth_values) / len(growth_values) if growth_values else None
+    }
+
+def load_financial_data(ad_csvs_dir=AD_CSVS_DIR, cache=None):
+    """Load all AD CSV files and aggregate financial metrics.
+
+    With a SourceCache, only files changed since the previous call are re-read.
+    """
+    cache = cache or SourceCache()
+    ad_financial_data = {}
+    
+    for csv_file in sorted(Path(ad_csvs_dir).glob("*.csv")):
         try:
-            df = pd.read_csv(csv_file)
-            
-            # Get unique accounts
-            accounts = df['Account'].unique().tolist()
-            
-            # Calculate metrics for Dec-25 (most recent)
-            revenue_total = 0
-            csat_values = []
-            headcount_total = 0
-            red_sites_count = 0
-            growth_values = []
-            account_revenues = {}  # Track revenue per account for sorting
-            
-            for account in accounts:
-                account_df = df[df['Account'] == account]
-                
-                # Revenue
-                account_revenue = 0
-                rev_row = account_df[account_df['KPI'] == 'Revenue ($)']
-                if not rev_row.empty and 'Dec-25' in rev_row.columns:
-                    val = rev_row['Dec-25'].values[0]
-                    cleaned_val = clean_numeric_value(val)
-                    if cleaned_val is not None:
-                        account_revenue = cleaned_val
-                        revenue_total += cleaned_val
-                account_revenues[account] = account_revenue
-                
-                # CSAT
-                csat_row = account_df[account_df['KPI'] == 'CSAT']
-                if not csat_row.empty and 'Dec-25' in csat_row.columns:
-                    val = csat_row['Dec-25'].values[0]
-                    cleaned_val = clean_numeric_value(val)
-                    if cleaned_val is not None:
-                        csat_values.append(cleaned_val)
-                
-                # Headcount
-                hc_row = account_df[account_df['KPI'] == 'Headcount']
-                if not hc_row.empty and 'Dec-25' in hc_row.columns:
-                    val = hc_row['Dec-25'].values[0]
-                    cleaned_val = clean_numeric_value(val)
-                    if cleaned_val is not None:
-                        headcount_total += int(cleaned_val)
-                
-                # Red Sites #
-                rs_row = account_df[account_df['KPI'] == 'Red Sites (#)']
-                if not rs_row.empty and 'Dec-25' in rs_row.columns:
-                    val = rs_row['Dec-25'].values[0]
-                    cleaned_val = clean_numeric_value(val)
-                    if cleaned_val is not None:
-                        red_sites_count += int(cleaned_val)
-                
-                # Growth %
-                growth_row = account_df[account_df['KPI'] == 'Growth (%)']
-                if not growth_row.empty and 'Dec-25' in growth_row.columns:
-                    val = growth_row['Dec-25'].values[0]
-                    cleaned_val = clean_numeric_value(val)
-                    if cleaned_val is not None:
-                        growth_values.append(cleaned_val)
-            
-            # Sort accounts by revenue (biggest to smallest)
-            sorted_accounts = sorted(accounts, key=lambda x: account_revenues.get(x, 0), reverse=True)
-            
-            ad_financial_data[ad_name] = {
-                'accounts': sorted_accounts,
-                'num_accounts': len(sorted_accounts),
-                'revenue_total': revenue_total,
-                'csat_avg': sum(csat_values) / len(csat_values) if csat_values else None,
-                'headcount_total': headcount_total,
-                'red_sites_count': red_sites_count,
-                'growth_avg': sum(growth_values) / len(growth_values) if growth_values else None
-            }
-            
+            ad_name, metrics = cache.load(("financials", str(csv_file)), [csv_file],
+                                          lambda: load_ad_financials(csv_file))
         except Exception as e:
             print(f"⚠️  Error processing {csv_file}: {e}")
             continue
+        ad_financial_data[ad_name] = metrics
     
     return ad_financial_data
 
@@ -336,9 +553,88 @@ SECTION_SHORT_NAMES = [
 
 TOTAL_MAX_SCORE = len(SCORING_SECTIONS) * 5
 
+
+class Review:
+    """One review in the in-memory pipeline; to_json() gives the data.json shape.
+
+    Scores and feedback are indexed by SCORING_SECTIONS ordinal instead of keyed by the
+    section name. Split joint reviews share the same (never mutated) score array and
+    feedback tuple.
+    """
+    __slots__ = ("id", "account_director", "account", "reviewer_name", "reviewer_email", "scores", "feedback")
+
+    def __init__(self, id, account_director, account, reviewer_name, reviewer_email, scores, feedback):
+        self.id = id
+        self.account_director = account_director
+        self.account = account
+        self.reviewer_name = reviewer_name
+        self.reviewer_email = reviewer_email
+        self.scores = scores      # array("d"), one per section
+        self.feedback = feedback  # tuple of str, one per section
+
+    def for_director(self, name):
+        return Review(self.id, name, self.account, self.reviewer_name, self.reviewer_email,
+                      self.scores, self.feedback)
+
+    @property
+    def total_score(self):
+        return sum(self.scores)
+
+    def to_json(self):
+        return {
+            "id": self.id,
+            "accountDirector": self.account_director,
+            "account": self.account,
+            "reviewerName": self.reviewer_name,
+            "reviewerEmail": self.reviewer_email,
+            "scores": dict(zip(SCORING_SECTIONS, self.scores)),
+            "feedback": dict(zip(SCORING_SECTIONS, self.feedback)),
+            "totalScore": self.total_score
+        }
+
+
+class ADAggregate:
+    """Per-AD rollup of Review records; to_json() gives the data.json accountDirectors entry."""
+    __slots__ = ("account_director", "reviews", "avg_scores", "vertical_data", "fin_data", "atb_accounts", "total_atb")
+
+    def __init__(self, account_director, reviews, avg_scores, vertical_data, fin_data, atb_accounts, total_atb):
+        self.account_director = account_director
+        self.reviews = reviews
+        self.avg_scores = avg_scores  # array("d"), one per section
+        self.vertical_data = vertical_data
+        self.fin_data = fin_data
+        self.atb_accounts = atb_accounts
+        self.total_atb = total_atb
+
+    def to_json(self):
+        accounts_list = self.fin_data.get('accounts', [])
+        return {
+            "accountDirector": self.account_director,
+            "account": ', '.join(accounts_list) if accounts_list else 'undefined',  # For frontend compatibility (singular, joined string)
+            "accounts": accounts_list,  # Keep array for future use
+            "numAccounts": self.fin_data.get('num_accounts', 0),
+            "revenue": self.fin_data.get('revenue_total', 0),
+            "csat": self.fin_data.get('csat_avg'),
+            "headcount": self.fin_data.get('headcount_total', 0),
+            "redSites": self.fin_data.get('red_sites_count', 0),
+            "growth": self.fin_data.get('growth_avg'),
+            "vertical": self.vertical_data.get("vertical", "N/A"),
+            "tier": self.vertical_data.get("tier", ""),
+            "role": self.vertical_data.get("role", "Account Director"),
+            "reviewCount": len(self.reviews),
+            "avgScores": dict(zip(SCORING_SECTIONS, self.avg_scores)),
+            "avgTotalScore": sum(self.avg_scores),
+            "reviews": [review.to_json() for review in self.reviews],
+            "atbData": {
+                "accounts": self.atb_accounts,
+                "totalAtb": self.total_atb
+            }
+        }
+
+
 def load_csv_data(csv_path="../data/performance_reviews.csv"):
-    """Load and parse the performance review CSV."""
-    df = pd.read_csv(csv_path, low_memory=False)
+    """Load and parse the performance review CSV (typed, see review_data.py)."""
+    df = load_reviews_frame(csv_path)
     
     # Rename columns for consistency
     column_mapping = {}
@@ -355,50 +651,25 @@ def load_csv_data(csv_path="../data/performance_reviews.csv"):
     df = df.rename(columns=column_mapping)
     return df
 
+def review_id(row):
+    """Stable review ID: the form's response Id, else a hash of who reviewed whom."""
+    raw = row.get("Id")
+    if raw is not None and not pd.isna(raw) and str(raw).strip():
+        value = str(raw).strip()
+        return value[:-2] if value.endswith(".0") else value
+    key = "|".join(str(row.get(col, "")).strip()
+                   for col in ("Account Director", "Account", "Reviewer Email", "Reviewer Name"))
+    return "r" + hashlib.sha256(key.encode("utf-8")).hexdigest()[:12]
+
 def extract_scores_and_feedback(df):
-    """Extract scores and feedback from the DataFrame."""
-    cols_list = list(df.columns)
-    
-    # AD Name normalization mapping
-    AD_NAME_NORMALIZE = {
-        "Logan Newman's": "Logan Newman",
-        "Ayesha Nasi": "Ayesha Nasir",
-        "Gisell Langelier": "Giselle Langelier",
-        "Dave Pergola": "David Pergola",
-        "Greg DeMedio": "Gregory DeMedio",
-        "Greg Demedio": "Gregory DeMedio",
-        "Nick Trenkamp": "Nicholas Trenkamp",
-        "Nike Trenkamp": "Nicholas Trenkamp",
-        "Jen Segovia": "Jennifer Segovia"
-    }
-    
-    # New structure: columns 0-7 are metadata, 8+ are feedback/score pairs
-    # Pattern: Feedback (col 8), Score (col 9), Feedback (col 10), Score (col 11), etc.
-    start_idx = 8  # Start after "Enter Your Name" column
-    
-    scoring_cols = cols_list[start_idx:]
-    
-    # Pair up feedback and score columns
-    # Pattern: [Feedback, Score, Feedback, Score, ...]
+    """Extract scores and feedback from the DataFrame as a list of Review records."""
+    # Feedback/score column pairs, matched to sections by the score column header
     score_columns = []
     feedback_columns = []
-    
-    for i in range(0, len(scoring_cols) - 1, 2):
-        feedback_col_raw = scoring_cols[i]      # Even indices (0, 2, 4...) = Feedback
-        score_col_raw = scoring_cols[i + 1]      # Odd indices (1, 3, 5...) = Score
-        
-        section_name = score_col_raw.strip()
-        
-        # Match to expected sections
-        matched_section = None
-        for expected_section in SCORING_SECTIONS:
-            if expected_section == section_name or section_name in expected_section:
-                matched_section = expected_section
-                break
-        
-        if matched_section:
-            score_columns.append((matched_section, score_col_raw))
-            feedback_columns.append((matched_section, feedback_col_raw))
+    for section, feedback_col, score_col in section_columns(df.columns):
+        ordinal = SCORING_SECTIONS.index(section)
+        score_columns.append((ordinal, score_col))
+        feedback_columns.append((ordinal, feedback_col))
     
     # Extract data
     reviews = []
@@ -407,92 +678,62 @@ def extract_scores_and_feedback(df):
             continue
         
         # Get and normalize AD name
-        ad_name = str(row.get("Account Director", "")).strip()
-        ad_name = AD_NAME_NORMALIZE.get(ad_name, ad_name)
+        ad_name = canonical_ad_name(row.get("Account Director", ""))
         
         # Get reviewer name - try "Reviewer Name" (Enter Your Name) first, then fall back to "Name"
         reviewer_name = str(row.get("Reviewer Name", "")).strip()
         if not reviewer_name or reviewer_name.lower() == "nan":
             reviewer_name = str(row.get("Name", "")).strip()
         
-        review = {
-            "accountDirector": ad_name,
-            "account": str(row.get("Account", "")).strip(),
-            "reviewerName": reviewer_name,
-            "reviewerEmail": str(row.get("Reviewer Email", "")).strip(),
-            "scores": {section: 0 for section in SCORING_SECTIONS},  # Initialize all sections
-            "feedback": {section: "" for section in SCORING_SECTIONS},  # Initialize all sections
-            "totalScore": 0
-        }
+        scores = array("d", [0.0] * len(SCORING_SECTIONS))  # Initialize all sections
+        feedback = [""] * len(SCORING_SECTIONS)
         
-        total = 0
-        for section, score_col in score_columns:
+        for ordinal, score_col in score_columns:
             try:
                 score = float(row.get(score_col, 0))
                 if pd.isna(score):
                     score = 0
             except (ValueError, TypeError):
                 score = 0
-            
-            review["scores"][section] = score
-            total += score
+            scores[ordinal] = score
         
-        for section, feedback_col in feedback_columns:
-            feedback = str(row.get(feedback_col, "")).strip()
-            if not feedback or feedback.lower() == "nan":
-                feedback = "No feedback provided"
-            review["feedback"][section] = feedback
+        for ordinal, feedback_col in feedback_columns:
+            text = str(row.get(feedback_col, "")).strip()
+            if not text or text.lower() == "nan":
+                text = "No feedback provided"
+            feedback[ordinal] = text
         
-        review["totalScore"] = total
+        # Names repeat across reviews; intern them so every record points at one copy
+        review = Review(
+            review_id(row), sys.intern(ad_name), sys.intern(str(row.get("Account", "")).strip()),
+            sys.intern(reviewer_name), sys.intern(str(row.get("Reviewer Email", "")).strip()),
+            scores, tuple(feedback)
+        )
         
         # Handle joint reviews (e.g., "Brian Davis / Justin Homa")
         # EXCLUDE Justin Homa from joint reviews (per user request)
-        if " / " in review["accountDirector"]:
+        if " / " in review.account_director:
             # Split the names and create separate reviews for each
-            names = [name.strip() for name in review["accountDirector"].split(" / ")]
+            names = [name.strip() for name in review.account_director.split(" / ")]
             for name in names:
                 # Skip Justin Homa in joint reviews
                 if name == "Justin Homa":
                     continue
-                individual_review = review.copy()
-                individual_review["accountDirector"] = name
-                individual_review["scores"] = review["scores"].copy()
-                individual_review["feedback"] = review["feedback"].copy()
-                reviews.append(individual_review)
+                reviews.append(review.for_director(sys.intern(name)))
         else:
             reviews.append(review)
     
     return reviews
 
 def load_verticals(vertical_path="../data/verticals.csv"):
-    """Load vertical, tier, and role mapping."""
+    """Load vertical, tier, and role mapping from the shared staff dimension table."""
     try:
-        vertical_df = pd.read_csv(vertical_path)
-        # Return dict with vertical, tier, and role
-        result = {}
-        for idx, row in vertical_df.iterrows():
-            ad_name = row["Account Director"].strip() if pd.notna(row["Account Director"]) else ""
-            vertical = row["Vertical"].strip() if pd.notna(row["Vertical"]) else "N/A"
-            tier = row["Tier"].strip() if pd.notna(row["Tier"]) and str(row["Tier"]).strip() else ""
-            role = row["Role"].strip() if "Role" in row and pd.notna(row.get("Role")) and str(row.get("Role")).strip() else "Account Director"
-            result[ad_name] = {"vertical": vertical, "tier": tier, "role": role}
-        return result
+        return dimension_records(load_dimension_table(vertical_path))
     except FileNotFoundError:
         return {}
-    except KeyError:
-        # If columns don't exist, fall back
-        vertical_df = pd.read_csv(vertical_path)
-        result = {}
-        for idx, row in vertical_df.iterrows():
-            ad_name = row["Account Director"].strip() if pd.notna(row["Account Director"]) else ""
-            vertical = row["Vertical"].strip() if pd.notna(row["Vertical"]) else "N/A"
-            tier = row["Tier"].strip() if pd.notna(row.get("Tier")) and str(row.get("Tier")).strip() else ""
-            role = row["Role"].strip() if "Role" in row and pd.notna(row.get("Role")) and str(row.get("Role")).strip() else "Account Director"
-            result[ad_name] = {"vertical": vertical, "tier": tier, "role": role}
-        return result
 
 def aggregate_reviews(reviews, verticals, financial_data, atb_data=None):
-    """Aggregate reviews by Account Director."""
+    """Aggregate Review records into one ADAggregate per Account Director."""
     from collections import defaultdict
 
     if atb_data is None:
@@ -501,18 +742,14 @@ def aggregate_reviews(reviews, verticals, financial_data, atb_data=None):
     ad_reviews = defaultdict(list)
 
     for review in reviews:
-        ad_reviews[review["accountDirector"]].append(review)
+        ad_reviews[review.account_director].append(review)
 
     aggregated = []
 
     for ad_name, ad_review_list in ad_reviews.items():
-        # Calculate average scores
-        avg_scores = {}
-        for section in SCORING_SECTIONS:
-            scores = [r["scores"].get(section, 0) for r in ad_review_list]
-            avg_scores[section] = sum(scores) / len(scores) if scores else 0
-
-        avg_total = sum(avg_scores.values())
+        # Calculate average scores, section by section across the score vectors
+        count = len(ad_review_list)
+        avg_scores = array("d", (sum(column) / count for column in zip(*(r.scores for r in ad_review_list))))
 
         # Get vertical and tier data
         vertical_data = verticals.get(ad_name, {"vertical": "N/A", "tier": ""})
@@ -528,9 +765,7 @@ def aggregate_reviews(reviews, verticals, financial_data, atb_data=None):
             'growth_avg': None
         })
 
-        # Get accounts list and create display string
         accounts_list = fin_data.get('accounts', [])
-        account_display = ', '.join(accounts_list) if accounts_list else 'undefined'
 
         # Build ATB data: match AD accounts to ATB by exact name (with aliases for known mismatches)
         atb_accounts = []
@@ -555,30 +790,8 @@ def aggregate_reviews(reviews, verticals, financial_data, atb_data=None):
                     'hasSubcontractedWork': atb_row.get('hasSubcontractedWork', False)
                 })
 
-        ad_entry = {
-            "accountDirector": ad_name,
-            "account": account_display,  # For frontend compatibility (singular, joined string)
-            "accounts": accounts_list,  # Keep array for future use
-            "numAccounts": fin_data.get('num_accounts', 0),
-            "revenue": fin_data.get('revenue_total', 0),
-            "csat": fin_data.get('csat_avg'),
-            "headcount": fin_data.get('headcount_total', 0),
-            "redSites": fin_data.get('red_sites_count', 0),
-            "growth": fin_data.get('growth_avg'),
-            "vertical": vertical_data.get("vertical", "N/A"),
-            "tier": vertical_data.get("tier", ""),
-            "role": vertical_data.get("role", "Account Director"),
-            "reviewCount": len(ad_review_list),
-            "avgScores": avg_scores,
-            "avgTotalScore": avg_total,
-            "reviews": ad_review_list,
-            "atbData": {
-                "accounts": atb_accounts,
-                "totalAtb": total_atb
-            }
-        }
-
-        aggregated.append(ad_entry)
+        aggregated.append(ADAggregate(ad_name, ad_review_list, avg_scores, vertical_data, fin_data,
+                                      atb_accounts, total_atb))
 
     return aggregated
 
@@ -669,42 +882,65 @@ def build_rubric_data():
     
     return rubrics
 
-def main():
-    """Main function to build data.json."""
+def load_reviews(profiler):
     print("Loading CSV data...")
-    df = load_csv_data()
+    with profiler.stage("load_csv"):
+        df = load_csv_data(REVIEWS_PATH)
     
     print("Extracting scores and feedback...")
-    reviews = extract_scores_and_feedback(df)
+    with profiler.stage("normalize_reviews"):
+        return extract_scores_and_feedback(df)
+
+def build(profiler, cache=None):
+    """Load every source and assemble the data.json structure.
+
+    Returns (data, search_index, review_count).
+    """
+    cache = cache or SourceCache()
+
+    reviews = cache.load("reviews", [REVIEWS_PATH], lambda: load_reviews(profiler))
     
     print("Loading vertical mappings...")
-    verticals = load_verticals()
+    with profiler.stage("load_verticals"):
+        verticals = cache.load("verticals", [VERTICALS_PATH], lambda: load_verticals(VERTICALS_PATH))
     
     print("Loading financial data from AD CSVs...")
-    financial_data = load_financial_data()
+    with profiler.stage("load_financials"):
+        financial_data = load_financial_data(AD_CSVS_DIR, cache)
     print(f"   - Loaded financial data for {len(financial_data)} Account Directors")
     
     print("Applying manual mappings...")
-    financial_data = apply_manual_mappings(financial_data)
+    with profiler.stage("apply_manual_mappings"):
+        financial_data = apply_manual_mappings(financial_data)
 
     print("Loading ATB data...")
-    atb_data = load_atb_data()
+    with profiler.stage("load_atb"):
+        atb_data = cache.load("atb", [ATB_PATH], lambda: load_atb_data(ATB_PATH))
     print(f"   - Loaded ATB for {len(atb_data)} accounts")
 
     print("Aggregating reviews by Account Director...")
-    aggregated = aggregate_reviews(reviews, verticals, financial_data, atb_data)
+    with profiler.stage("aggregate"):
+        aggregated = aggregate_reviews(reviews, verticals, financial_data, atb_data)
+    
+    # Records stay compact through aggregation; convert to the data.json shape here
+    with profiler.stage("to_json"):
+        account_directors = [ad.to_json() for ad in aggregated]
     
     print("Building rubric data...")
-    rubrics = build_rubric_data()
+    with profiler.stage("build_rubrics"):
+        rubrics = build_rubric_data()
     
     # Load best practices
     print("Loading best practices...")
-    best_practices = load_best_practices()
+    with profiler.stage("load_best_practices"):
+        best_practices = cache.load("best_practices", [BEST_PRACTICES_PATH],
+                                    lambda: load_best_practices(BEST_PRACTICES_PATH))
     print(f"   - Loaded best practices for {len(best_practices)} Account Directors")
 
     # Load follow-up questions (2026 Development Focus)
     print("Loading follow-up questions...")
-    follow_up_raw = load_follow_up_questions()
+    with profiler.stage("load_follow_ups"):
+        follow_up_raw = cache.load("follow_ups", [FOLLOW_UPS_PATH], lambda: load_follow_up_questions(FOLLOW_UPS_PATH))
     # Normalize keys to match aggregated AD names (e.g. Dave Pergola -> David Pergola)
     FOLLOW_UP_NAME_MAP = {"Dave Pergola": "David Pergola", "Mike Barry": "Michael Barry", "Josh Grady": "Joshua Grady", "Jen Segovia": "Jennifer Segovia"}
     follow_up_questions = {}
@@ -713,29 +949,257 @@ def main():
         follow_up_questions[canonical] = v
     print(f"   - Loaded follow-up questions for {len(follow_up_questions)} Account Directors")
     
+    last_updated = pd.Timestamp.now().isoformat()
+    with profiler.stage("build_best_practices"):
+        best_practices = build_best_practices(best_practices, account_directors, last_updated)
+    
     # Build final data structure
     data = {
         "metadata": {
             "totalMaxScore": TOTAL_MAX_SCORE,
             "scoringSections": SCORING_SECTIONS,
             "sectionShortNames": SECTION_SHORT_NAMES,
-            "lastUpdated": pd.Timestamp.now().isoformat()
+            "lastUpdated": last_updated
         },
-        "accountDirectors": aggregated,
+        "accountDirectors": account_directors,
         "rubrics": rubrics,
         "bestPractices": best_practices,
         "followUpQuestions": follow_up_questions
     }
     
-    # Write to JSON
-    output_path = Path("data.json")
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    print("Building search index...")
+    with profiler.stage("build_search_index"):
+        search_index = build_search_index(account_directors, best_practices["practices"], follow_up_questions)
+    print(f"   - Indexed {len(search_index['docs'])} text fields, {len(search_index['terms'])} terms")
+    
+    return data, search_index, len(reviews)
+
+def content_hash(value):
+    """Short stable hash of a JSON-serializable value."""
+    encoded = json.dumps(value, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()[:16]
+
+def write_atomic(path, text):
+    """Write via a temp file + rename so readers never see a partial file."""
+    tmp_path = Path(f"{path}.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+def load_version_manifest(path=VERSION_PATH):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+def diff_reviews(old_reviews, new_reviews):
+    """Patch one AD's review list by review id; None when ids are missing or repeated."""
+    old_ids = [review.get("id") for review in old_reviews]
+    new_ids = [review.get("id") for review in new_reviews]
+    if (None in old_ids or None in new_ids
+            or len(set(old_ids)) != len(old_ids) or len(set(new_ids)) != len(new_ids)):
+        return None
+    old_by_id = dict(zip(old_ids, old_reviews))
+    new_set = set(new_ids)
+    patch = {
+        "added": [review for review in new_reviews if review["id"] not in old_by_id],
+        "changed": [review for review in new_reviews
+                    if review["id"] in old_by_id and old_by_id[review["id"]] != review],
+        "removed": [old_id for old_id in old_ids if old_id not in new_set],
+    }
+    patch = {key: value for key, value in patch.items() if value}
+    # Applying keeps surviving reviews in place and appends added ones; send the order only if that's wrong
+    if [i for i in old_ids if i in new_set] + [r["id"] for r in patch.get("added", [])] != new_ids:
+        patch["order"] = new_ids
+    return patch
+
+def diff_fields(old, new, skip=()):
+    """{"set": {key: value}, "unset": [key]} turning dict old into new (keys in skip ignored)."""
+    change = {
+        "set": {key: value for key, value in new.items() if key not in skip and old.get(key) != value},
+        "unset": [key for key in old if key not in new and key not in skip],
+    }
+    return {key: value for key, value in change.items() if value}
+
+def diff_section(old, new):
+    """diff_fields for a non-AD section; same-length lists (e.g. practices) send only changed items."""
+    change = diff_fields(old, new)
+    for key, value in list(change.get("set", {}).items()):
+        old_value = old.get(key)
+        if isinstance(value, list) and isinstance(old_value, list) and len(value) == len(old_value):
+            change.setdefault("items", {})[key] = {
+                str(index): item for index, (old_item, item) in enumerate(zip(old_value, value)) if old_item != item
+            }
+            del change["set"][key]
+    if not change.get("set", True):
+        del change["set"]
+    return change
+
+def diff_builds(old, new, old_version, new_version):
+    """JSON patch turning build old_version into new_version.
+
+    {"from", "to", "builtAt",
+     "shards": {section: {"set": {key: value}, "unset": [key],    # changed keys of other sections
+                          "items": {key: {index: item}}}},       # changed items of same-length lists
+     "accountDirectors": {
+         "added": [ad], "removed": [name], "order": [name] (only if not implied),
+         "changed": {name: {"set": {field: value}, "unset": [field],
+                            "reviews": {"added": [review], "changed": [review],
+                                        "removed": [id], "order": [id]}}}}}
+    """
+    patch = {"from": old_version, "to": new_version, "builtAt": new["metadata"]["lastUpdated"]}
+    shards = {name: diff_section(old.get(name) or {}, new[name]) for name in SHARDS
+              if name != "accountDirectors" and old.get(name) != new[name]}
+    if shards:
+        patch["shards"] = shards
+
+    old_ads = {ad["accountDirector"]: ad for ad in old.get("accountDirectors", [])}
+    new_ads = {ad["accountDirector"]: ad for ad in new["accountDirectors"]}
+    changed = {}
+    for name, ad in new_ads.items():
+        old_ad = old_ads.get(name)
+        if old_ad is None or old_ad == ad:
+            continue
+        change = diff_fields(old_ad, ad, skip={"reviews"})
+        reviews = diff_reviews(old_ad.get("reviews", []), ad.get("reviews", []))
+        if reviews is None:
+            change.setdefault("set", {})["reviews"] = ad.get("reviews", [])
+        elif reviews:
+            change["reviews"] = reviews
+        changed[name] = change
+
+    ads = {
+        "added": [ad for name, ad in new_ads.items() if name not in old_ads],
+        "removed": [name for name in old_ads if name not in new_ads],
+        "changed": changed,
+    }
+    ads = {key: value for key, value in ads.items() if value}
+    implied_order = [name for name in old_ads if name in new_ads] + [ad["accountDirector"] for ad in ads.get("added", [])]
+    if implied_order != list(new_ads):
+        ads["order"] = list(new_ads)
+    if ads:
+        patch["accountDirectors"] = ads
+    return patch
+
+def load_previous_build():
+    """(version, data) of the data.json currently on disk, or (None, None)."""
+    try:
+        with open(OUTPUT_PATH, "r", encoding="utf-8") as f:
+            text = f.read()
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()[:16], expand_reviews(json.loads(text))
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None, None
+
+def write_delta(patch):
+    """Write deltas/<to>.json and prune all but the newest DELTA_HISTORY deltas."""
+    DELTAS_DIR.mkdir(exist_ok=True)
+    write_atomic(DELTAS_DIR / f"{patch['to']}.json", json.dumps(patch, ensure_ascii=False, separators=(",", ":")))
+    deltas = sorted(DELTAS_DIR.glob("*.json"), key=lambda path: path.stat().st_mtime_ns, reverse=True)
+    for path in deltas[DELTA_HISTORY:]:
+        path.unlink()
+
+def write_outputs(data, search_index, intern_strings=False):
+    """Swap in data.json, its delta, search_index.json and the version manifest.
+
+    With intern_strings, data.json stores review strings in a string table (string_table.py);
+    hashes and deltas are always computed on the expanded form. Returns (manifest, changed ADs).
+    """
+    previous = load_version_manifest()
+    previous_version, previous_data = load_previous_build()
+    text = json.dumps(intern_reviews(data) if intern_strings else data, indent=2, ensure_ascii=False)
+    manifest = {
+        "version": hashlib.sha256(text.encode("utf-8")).hexdigest()[:16],
+        "previous": previous.get("previous"),
+        "builtAt": data["metadata"]["lastUpdated"],
+        "shards": {name: content_hash(data[name]) for name in SHARDS},
+        "ads": {ad["accountDirector"]: content_hash(ad) for ad in data["accountDirectors"]},
+    }
+    if previous_data is not None and previous_version != manifest["version"]:
+        # Written before data.json, so a served version always has its delta on disk
+        write_delta(diff_builds(previous_data, data, previous_version, manifest["version"]))
+        manifest["previous"] = previous_version
+    old_ads = previous.get("ads", {})
+    changed_ads = sorted(
+        name for name in set(old_ads) | set(manifest["ads"]) if old_ads.get(name) != manifest["ads"].get(name)
+    )
+
+    write_atomic(OUTPUT_PATH, text)
+    write_search_index(search_index, SEARCH_INDEX_PATH)
+    # The manifest goes last: once it names a version, that data.json is in place
+    write_atomic(VERSION_PATH, json.dumps(manifest, indent=2, ensure_ascii=False))
+    return manifest, changed_ads
+
+def watched_signatures():
+    """Signatures of every input build() reads."""
+    paths = [REVIEWS_PATH, VERTICALS_PATH, ATB_PATH, BEST_PRACTICES_PATH, FOLLOW_UPS_PATH]
+    paths += sorted(AD_CSVS_DIR.glob("*.csv"))
+    return {str(path): file_signature(path) for path in paths}
+
+def watch(interval=WATCH_INTERVAL, debounce=WATCH_DEBOUNCE, intern_strings=False):
+    """Poll the inputs and rebuild once a burst of changes settles.
+
+    Unchanged files are not parsed again, but every AD is re-aggregated on each rebuild;
+    the "AD(s) changed" count comes from comparing the new build's hashes with the old.
+    """
+    cache = SourceCache()
+    profiler = Profiler("build_data")
+    signatures = None
+    print(f"Watching {DATA_DIR.resolve()} (poll {interval}s, debounce {debounce}s). Ctrl+C to stop.")
+    while True:
+        current = watched_signatures()
+        if current != signatures:
+            # Wait for a quiet period so a multi-file drop triggers one rebuild
+            while True:
+                time.sleep(debounce)
+                settled = watched_signatures()
+                if settled == current:
+                    break
+                current = settled
+            changed_files = sorted(p for p in current if signatures is None or current[p] != signatures.get(p))
+            signatures = current
+            started = time.perf_counter()
+            try:
+                data, search_index, _ = build(profiler, cache)
+                manifest, changed_ads = write_outputs(data, search_index, intern_strings)
+            except Exception as e:
+                # Keep serving the previous build; the next change retries
+                print(f"⚠️  Rebuild failed, keeping previous data.json: {e}")
+                continue
+            print(f"Rebuilt version {manifest['version']} in {time.perf_counter() - started:.2f}s "
+                  f"({len(changed_files)} changed file(s), {len(changed_ads)} AD(s) changed"
+                  f"{': ' + ', '.join(changed_ads[:10]) if changed_ads else ''})")
+        time.sleep(interval)
+
+def main():
+    """Main function to build data.json."""
+    parser = argparse.ArgumentParser(description="Build data.json for the vanilla JS dashboard.")
+    parser.add_argument("--watch", action="store_true", help="Rebuild whenever files under data/ change")
+    parser.add_argument("--interval", type=float, default=WATCH_INTERVAL, help="Watch poll interval (seconds)")
+    parser.add_argument("--debounce", type=float, default=WATCH_DEBOUNCE,
+                        help="Quiet period before a watch rebuild (seconds)")
+    parser.add_argument("--intern-strings", action="store_true",
+                        help="Store review strings once in a string table (smaller data.json)")
+    add_profile_arguments(parser)
+    args = parser.parse_args()
+
+    if args.watch:
+        try:
+            watch(args.interval, args.debounce, args.intern_strings)
+        except KeyboardInterrupt:
+            print("\nStopped watching.")
+        return
+
+    profiler = Profiler.from_args(args, "build_data")
+    data, search_index, review_count = build(profiler)
+    with profiler.stage("write_json"):
+        write_outputs(data, search_index, args.intern_strings)
     
-    print(f"SUCCESS: Successfully built {output_path}")
-    print(f"   - {len(aggregated)} Account Directors")
-    print(f"   - {len(reviews)} Total Reviews")
+    print(f"SUCCESS: Successfully built {OUTPUT_PATH}")
+    print(f"   - {len(data['accountDirectors'])} Account Directors")
+    print(f"   - {review_count} Total Reviews")
     print(f"   - {len(SCORING_SECTIONS)} Scoring Sections")
+    profiler.finish()
 
 if __name__ == "__main__":
     main()